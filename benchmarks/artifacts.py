@@ -0,0 +1,99 @@
+"""Benchmark loading large Truffle build artifacts.
+
+This compares parsing a whole artifact with :code:`json.load` with
+loading only the members the CLI uses through :code:`load_json_keys`,
+both for an artifact with an AST and for one that only carries the
+legacy AST. Besides the wall time, the peak memory traced by
+:code:`tracemalloc` is reported, including the artifact's text.
+
+Run it from the repository root with::
+
+    python -m benchmarks.artifacts
+"""
+
+import json
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from mythx_cli.analyze.truffle import ARTIFACT_KEYS, TruffleJob
+
+from .synthetic import make_artifact
+
+AST_DEPTH = 7
+
+
+def json_load(path: Path) -> Dict[str, Any]:
+    """Load an artifact completely and keep the members the CLI uses."""
+
+    with open(path) as artifact_f:
+        artifact = json.load(artifact_f)
+    keys = ARTIFACT_KEYS if "ast" in artifact else ARTIFACT_KEYS | {"legacyAST"}
+    return {key: value for key, value in artifact.items() if key in keys}
+
+
+def measure(load: Callable[[Path], Dict], path: Path) -> Tuple[float, int]:
+    """Measure the wall time and the peak memory of loading an artifact.
+
+    :param load: The function loading the artifact
+    :param path: The artifact path
+    :return: The wall time in seconds and the peak memory in bytes
+    """
+
+    start = time.perf_counter()
+    load(path)
+    wall_time = time.perf_counter() - start
+
+    tracemalloc.start()
+    try:
+        load(path)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return wall_time, peak_memory
+
+
+def run(depth: int = AST_DEPTH) -> List[Dict[str, Any]]:
+    """Time loading artifacts with and without an AST.
+
+    :param depth: The depth of the generated ASTs
+    :return: One result dict per artifact
+    """
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for ast in (True, False):
+            path = Path(tmp_dir) / "Token.json"
+            with open(path, "w") as artifact_f:
+                json.dump(make_artifact(depth, ast=ast), artifact_f, indent=2)
+            assert TruffleJob.load_artifact(str(path)) == json_load(path)
+
+            legacy_time, legacy_memory = measure(json_load, path)
+            selective_time, selective_memory = measure(TruffleJob.load_artifact, path)
+            results.append(
+                {
+                    "scenario": "AST" if ast else "legacy AST only",
+                    "size": path.stat().st_size,
+                    "legacy": legacy_time,
+                    "legacy_memory": legacy_memory,
+                    "selective": selective_time,
+                    "selective_memory": selective_memory,
+                }
+            )
+    return results
+
+
+if __name__ == "__main__":
+    for result in run():
+        print(
+            "{scenario} ({size_mb:.1f} MB): json.load {legacy:.3f}s / "
+            "{legacy_mb:.1f} MB, load_json_keys {selective:.3f}s / "
+            "{selective_mb:.1f} MB".format(
+                size_mb=result["size"] / 2 ** 20,
+                legacy_mb=result["legacy_memory"] / 2 ** 20,
+                selective_mb=result["selective_memory"] / 2 ** 20,
+                **result,
+            )
+        )
@@ -0,0 +1,107 @@
+"""Benchmark the Truffle dependency map construction.
+
+This generates a synthetic Truffle build directory with thousands of
+artifacts, each importing a handful of others, and times
+:code:`TruffleJob.build_dependency_map` against the former linear
+substring scan over all artifact files.
+
+Run it from the repository root with::
+
+    python -m benchmarks.dependency_map
+"""
+
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from mythx_cli.analyze.truffle import TruffleJob
+
+SIZES = (500, 2000, 5000)
+IMPORTS_PER_ARTIFACT = 8
+
+
+def make_project(base_path: Path, size: int, seed: int = 0) -> None:
+    """Write a synthetic Truffle build directory.
+
+    :param base_path: The project root to create the build folder in
+    :param size: The number of artifacts to generate
+    :param seed: The seed for picking the imports of each artifact
+    """
+    rng = random.Random(seed)
+    build_dir = base_path / "build" / "contracts"
+    build_dir.mkdir(parents=True)
+    names = [f"Contract{i}" for i in range(size)]
+    for idx, name in enumerate(names):
+        imports = rng.sample(names, min(IMPORTS_PER_ARTIFACT, size))
+        source_path = f"/project/contracts/{name}.sol"
+        artifact = {
+            "contractName": name,
+            "sourcePath": source_path,
+            "ast": {
+                "absolutePath": source_path,
+                "src": f"0:0:{idx}",
+                "nodes": [
+                    {
+                        "nodeType": "ImportDirective",
+                        "absolutePath": f"/project/contracts/{i}.sol",
+                    }
+                    for i in imports
+                ],
+            },
+        }
+        with open(build_dir / f"{name}.json", "w") as artifact_f:
+            json.dump(artifact, artifact_f)
+
+
+def legacy_dependency_map(job: TruffleJob) -> Dict[str, set]:
+    """Build the dependency map with a substring scan per import.
+
+    :param job: The Truffle job holding the loaded artifacts
+    :return: The dependency map
+    """
+    dependency_map = {}
+    for artifact_file in job.artifact_files:
+        related = set()
+        for node in job.artifacts[artifact_file]["ast"]["nodes"]:
+            basename = Path(node["absolutePath"]).name.replace(".sol", ".json")
+            match = next((x for x in job.artifact_files if basename in x), None)
+            if match is not None:
+                related.add(match)
+        dependency_map[artifact_file] = related
+    return dependency_map
+
+
+def run(sizes=SIZES) -> List[Dict[str, float]]:
+    """Time the dependency map construction for each project size.
+
+    :param sizes: The numbers of artifacts to benchmark
+    :return: One result dict per size
+    """
+    results = []
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            make_project(Path(tmp_dir), size)
+            job = TruffleJob(Path(tmp_dir))
+
+            job.sol_artifact_map, job.artifact_index = {}, None
+            start = time.perf_counter()
+            job.build_dependency_map()
+            indexed = time.perf_counter() - start
+
+            start = time.perf_counter()
+            legacy_dependency_map(job)
+            legacy = time.perf_counter() - start
+
+        results.append({"artifacts": size, "indexed": indexed, "legacy": legacy})
+    return results
+
+
+if __name__ == "__main__":
+    for result in run():
+        print(
+            "{artifacts:>6} artifacts: indexed {indexed:.4f}s, "
+            "substring scan {legacy:.4f}s".format(**result)
+        )
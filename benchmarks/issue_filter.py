@@ -0,0 +1,76 @@
+"""Benchmark filtering issue reports.
+
+This filters a synthetic report with 100k issues by minimum severity and
+SWC blacklist, once with a prebuilt :code:`IssueFilter` and once with the
+former approach of normalizing the filter settings per report and looking
+up severities by index for every issue.
+
+Run it from the repository root with::
+
+    python -m benchmarks.issue_filter
+"""
+
+import time
+from typing import Dict, List
+
+from mythx_models.response.issue import SEVERITY
+
+from mythx_cli.formatter.util import SEVERITY_ORDER, IssueFilter, normalize_swc_list
+
+from .synthetic import make_report
+
+ISSUES = 100000
+SETTINGS = {"min_severity": "low", "swc_blacklist": "SWC-110,113"}
+
+
+def legacy_filter(resp, min_severity=None, swc_blacklist=None, swc_whitelist=None):
+    """Filter a report the way :code:`filter_report` used to."""
+
+    min_severity = SEVERITY(min_severity.title()) if min_severity else SEVERITY.UNKNOWN
+    swc_blacklist = normalize_swc_list(swc_blacklist)
+    swc_whitelist = normalize_swc_list(swc_whitelist)
+
+    for report in resp.issue_reports:
+        new_issues = []
+        for issue in report.issues:
+            is_severe = SEVERITY_ORDER.index(issue.severity) >= SEVERITY_ORDER.index(
+                min_severity
+            )
+            not_blacklisted = issue.swc_id not in swc_blacklist
+            is_whitelisted = issue.swc_id in swc_whitelist if swc_whitelist else True
+            if all((is_severe, is_whitelisted, not_blacklisted)):
+                new_issues.append(issue)
+        report.issues = new_issues
+    return resp
+
+
+def run(issues: int = ISSUES) -> List[Dict[str, float]]:
+    """Time filtering a large report.
+
+    :param issues: The number of issues in the report
+    :return: A list holding the result dict
+    """
+
+    resp = make_report(issues, ["0:1:0"])
+    original = list(resp.issue_reports[0].issues)
+
+    start = time.perf_counter()
+    legacy_filter(resp, **SETTINGS)
+    legacy = time.perf_counter() - start
+    expected = resp.issue_reports[0].issues
+
+    resp.issue_reports[0].issues = list(original)
+    start = time.perf_counter()
+    IssueFilter(**SETTINGS).apply(resp)
+    compiled = time.perf_counter() - start
+
+    assert resp.issue_reports[0].issues == expected
+    return [{"issues": issues, "compiled": compiled, "legacy": legacy}]
+
+
+if __name__ == "__main__":
+    for result in run():
+        print(
+            "{issues} issues: issue filter {compiled:.4f}s, "
+            "per-issue index lookups {legacy:.4f}s".format(**result)
+        )
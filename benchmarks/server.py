@@ -0,0 +1,361 @@
+"""A local stand-in for the MythX API.
+
+The server answers the analysis, status, report, input, list, group and
+version endpoints with responses built from the recorded API responses in
+:code:`tests/testdata`. This makes it possible to exercise the network
+paths of the CLI at scale without the real service. Latency, queue time,
+injected server errors and rate limiting can be configured to simulate a
+busy deployment.
+
+Submitted analyses stay queued for the configured queue time and are
+finished afterwards. Unknown analysis UUIDs are treated as finished
+analyses, so recorded UUID lists can be reported on directly. Every
+finished analysis reports the recorded issues and input.
+
+Run it from the repository root and point the CLI at it with::
+
+    python -m benchmarks.server --port 8080 --latency 0.05 --queue-time 2
+    MYTHX_API_URL=http://127.0.0.1:8080 MYTHX_API_KEY=dummy mythx analysis list
+"""
+
+import base64
+import json
+import logging
+import random
+import re
+import threading
+import time
+import uuid as uuid_lib
+from collections import deque
+from contextlib import contextmanager
+from copy import deepcopy
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import click
+
+LOGGER = logging.getLogger("mythx-cli")
+TESTDATA = Path(__file__).parent.parent / "tests" / "testdata"
+PAGE_SIZE = 20
+ROUTES = (
+    ("POST", re.compile(r"/v1/auth/login$"), "login"),
+    ("POST", re.compile(r"/v1/analyses$"), "submit"),
+    ("GET", re.compile(r"/v1/analyses$"), "analysis_list"),
+    ("GET", re.compile(r"/v1/analyses/(?P<uuid>[^/]+)$"), "analysis_status"),
+    ("GET", re.compile(r"/v1/analyses/(?P<uuid>[^/]+)/issues$"), "report"),
+    ("GET", re.compile(r"/v1/analyses/(?P<uuid>[^/]+)/input$"), "analysis_input"),
+    ("POST", re.compile(r"/v1/analysis-groups$"), "create_group"),
+    ("GET", re.compile(r"/v1/analysis-groups$"), "group_list"),
+    ("GET", re.compile(r"/v1/analysis-groups/(?P<group_id>[^/]+)$"), "group_status"),
+    ("POST", re.compile(r"/v1/analysis-groups/(?P<group_id>[^/]+)$"), "seal_group"),
+    ("GET", re.compile(r"/v1/version$"), "version"),
+)
+Response = Tuple[int, Dict[str, str], Any]
+
+
+def load_testdata(name: str) -> Any:
+    """Load a recorded API response.
+
+    :param name: The file name in the test data directory
+    :return: The decoded JSON response
+    """
+
+    with open(TESTDATA / name) as data_f:
+        return json.load(data_f)
+
+
+def timestamp(ts: float) -> str:
+    """Format a UNIX timestamp the way the API does."""
+
+    return datetime.fromtimestamp(ts, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+def make_token(expires_in: int = 24 * 60 * 60) -> str:
+    """Create an unsigned JWT which the API client accepts as access
+    token.
+
+    :param expires_in: The token lifetime in seconds
+    :return: The encoded token
+    """
+
+    def encode(data: Dict) -> str:
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).decode().rstrip("=")
+
+    claims = {"exp": int(time.time()) + expires_in}
+    return ".".join((encode({"alg": "HS256", "typ": "JWT"}), encode(claims), "stub"))
+
+
+class StandInAPI:
+    """The state and request handlers of the stand-in API.
+
+    :param latency: The delay in seconds before each response
+    :param queue_time: The time in seconds an analysis stays queued
+    :param error_rate: The fraction of requests answered with a server error
+    :param rate_limit: The number of requests served within any one-second
+        window before answering with status 429, or 0 to disable rate
+        limiting
+    :param seed: The seed for choosing the requests that fail
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        queue_time: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit: int = 0,
+        seed: Optional[int] = None,
+    ):
+        self.latency = latency
+        self.queue_time = queue_time
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.served: Deque[float] = deque()
+        self.requests: Dict[str, int] = {}
+
+        self.analyses: Dict[str, Dict[str, Any]] = {}
+        self.submitted: Dict[str, float] = {}
+        self.groups: Dict[str, Dict[str, Any]] = {}
+        self.status_template = load_testdata("analysis-status-response.json")
+        self.issues = load_testdata("detected-issues-response.json")
+        self.input = load_testdata("analysis-input-response.json")
+        self.analysis_list_template = load_testdata("analysis-list-response.json")
+        self.group_template = load_testdata("group-status-response.json")
+        self.group_list_template = load_testdata("group-list-response.json")
+        self.version_data = load_testdata("version-response.json")
+
+    def handle(self, method: str, url: str, payload: Any) -> Response:
+        """Answer a request.
+
+        :param method: The HTTP method
+        :param url: The request path including the query string
+        :param payload: The decoded JSON request body
+        :return: The status code, additional headers, and JSON response
+        """
+
+        time.sleep(self.latency)
+        parts = urlsplit(url)
+        query = {k: v[0] for k, v in parse_qs(parts.query).items()}
+        for route_method, pattern, name in ROUTES:
+            match = pattern.match(parts.path)
+            if route_method == method and match:
+                break
+        else:
+            return 404, {}, {"error": f"Unknown endpoint {method} {parts.path}"}
+
+        with self.lock:
+            self.requests[name] = self.requests.get(name, 0) + 1
+            if self.rate_limited():
+                return 429, {"Retry-After": "1"}, {"error": "Too many requests"}
+            if self.random.random() < self.error_rate:
+                return 500, {}, {"error": "Injected server error"}
+            return 200, {}, getattr(self, name)(payload, query, **match.groupdict())
+
+    def rate_limited(self) -> bool:
+        """Check a request against the requests served in the last second."""
+
+        if not self.rate_limit:
+            return False
+        now = time.monotonic()
+        while self.served and now - self.served[0] >= 1:
+            self.served.popleft()
+        if len(self.served) >= self.rate_limit:
+            return True
+        self.served.append(now)
+        return False
+
+    def status(self, uuid: str) -> Dict[str, Any]:
+        """Build the status response of an analysis."""
+
+        status = deepcopy(self.analyses.get(uuid) or self.status_template)
+        status["uuid"] = uuid
+        submitted = self.submitted.get(uuid)
+        if submitted is not None and time.time() - submitted < self.queue_time:
+            status["status"] = "Queued"
+        else:
+            status["status"] = "Finished"
+        return status
+
+    def login(self, payload, query) -> Dict[str, str]:
+        return {"access": make_token(), "refresh": make_token()}
+
+    def submit(self, payload, query) -> Dict[str, Any]:
+        uuid = str(uuid_lib.uuid4())
+        now = time.time()
+        analysis = deepcopy(self.status_template)
+        analysis.update(uuid=uuid, submittedAt=timestamp(now))
+        for key in ("clientToolName", "groupId", "groupName"):
+            if payload.get(key):
+                analysis[key] = payload[key]
+        for key in ("analysisMode", "mainSource"):
+            if payload["data"].get(key):
+                analysis[key] = payload["data"][key]
+        self.analyses[uuid] = analysis
+        self.submitted[uuid] = now
+        return self.status(uuid)
+
+    def analysis_list(self, payload, query) -> Dict[str, Any]:
+        offset = int(query.get("offset", 0))
+        if not self.analyses:
+            analyses = self.analysis_list_template["analyses"]
+            return {"analyses": analyses[offset:], "total": len(analyses)}
+        uuids = [
+            uuid
+            for uuid, analysis in reversed(self.analyses.items())
+            if query.get("groupId") in (None, analysis["groupId"])
+        ]
+        return {
+            "analyses": [self.status(u) for u in uuids[offset : offset + PAGE_SIZE]],
+            "total": len(uuids),
+        }
+
+    def analysis_status(self, payload, query, uuid: str) -> Dict[str, Any]:
+        return self.status(uuid)
+
+    def report(self, payload, query, uuid: str) -> Any:
+        return self.issues
+
+    def analysis_input(self, payload, query, uuid: str) -> Dict[str, Any]:
+        return self.input
+
+    def create_group(self, payload, query) -> Dict[str, Any]:
+        group = deepcopy(self.group_template)
+        group.update(
+            {
+                "id": uuid_lib.uuid4().hex[:24],
+                "name": payload.get("groupName", ""),
+                "createdAt": timestamp(time.time()),
+                "status": "opened",
+            }
+        )
+        self.groups[group["id"]] = group
+        return group
+
+    def group_list(self, payload, query) -> Dict[str, Any]:
+        offset = int(query.get("offset", 0))
+        groups = list(reversed(self.groups.values())) or (
+            self.group_list_template["groups"]
+        )
+        return {"groups": groups[offset : offset + PAGE_SIZE], "total": len(groups)}
+
+    def group_status(self, payload, query, group_id: str) -> Dict[str, Any]:
+        return {**(self.groups.get(group_id) or self.group_template), "id": group_id}
+
+    def seal_group(self, payload, query, group_id: str) -> Dict[str, Any]:
+        group = self.groups.setdefault(
+            group_id, {**deepcopy(self.group_template), "id": group_id}
+        )
+        group["status"] = "sealed"
+        return group
+
+    def version(self, payload, query) -> Dict[str, str]:
+        return self.version_data
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Forward HTTP requests to the server's :code:`StandInAPI`."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        self.dispatch("GET")
+
+    def do_POST(self) -> None:
+        self.dispatch("POST")
+
+    def dispatch(self, method: str) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        payload = json.loads(body) if body else {}
+        status, headers, data = self.server.api.handle(method, self.path, payload)
+
+        content = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format: str, *args) -> None:
+        LOGGER.debug(f"{self.address_string()} - {format % args}")
+
+
+def make_server(api: StandInAPI, host: str = "127.0.0.1", port: int = 0):
+    """Create an HTTP server answering requests with the stand-in API.
+
+    :param api: The stand-in API instance
+    :param host: The address to listen on
+    :param port: The port to listen on, or 0 to pick a free one
+    :return: The HTTP server
+    """
+
+    server = ThreadingHTTPServer((host, port), StandInHandler)
+    server.daemon_threads = True
+    server.api = api
+    return server
+
+
+@contextmanager
+def running_server(api: Optional[StandInAPI] = None, **options) -> Iterator[str]:
+    """Run the stand-in API in a background thread.
+
+    :param api: The stand-in API instance to serve, created from the
+        options if not given
+    :param options: The options passed on to :code:`StandInAPI`
+    :return: The API URL to point the client to
+    """
+
+    server = make_server(api or StandInAPI(**options))
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    try:
+        host, port = server.server_address[:2]
+        yield f"http://{host}:{port}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@click.command()
+@click.option("--host", default="127.0.0.1", help="The address to listen on")
+@click.option("--port", default=8080, help="The port to listen on")
+@click.option("--latency", default=0.0, help="Seconds to wait before responding")
+@click.option("--queue-time", default=0.0, help="Seconds an analysis stays queued")
+@click.option(
+    "--error-rate", default=0.0, help="Fraction of requests failing with status 500"
+)
+@click.option(
+    "--rate-limit", default=0, help="Requests per second before returning status 429"
+)
+@click.option("--seed", type=int, default=None, help="Seed for injected errors")
+def main(host, port, latency, queue_time, error_rate, rate_limit, seed) -> None:
+    """Serve a local stand-in for the MythX API."""
+
+    api = StandInAPI(
+        latency=latency,
+        queue_time=queue_time,
+        error_rate=error_rate,
+        rate_limit=rate_limit,
+        seed=seed,
+    )
+    server = make_server(api, host, port)
+    click.echo(f"Serving the MythX API stand-in at http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        click.echo(f"Requests served: {json.dumps(api.requests, sort_keys=True)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Benchmark resolving issue locations to source lines.
+
+This indexes a synthetic report with thousands of issue locations in a
+large flattened contract by file name, once with the line offset table
+and once with the former approach of counting the line breaks up to
+each offset.
+
+Run it from the repository root with::
+
+    python -m benchmarks.source_locations
+"""
+
+import time
+from typing import Dict, List
+from unittest.mock import patch
+
+from mythx_cli.util import index_by_filename
+
+from .synthetic import make_input, make_report, make_source, make_source_maps
+
+SOURCE_LINES = 20000
+ISSUE_COUNTS = (1000, 5000)
+
+
+def count_newlines(source: str, offset: int, line_offsets=None) -> int:
+    """Resolve the line of an offset by counting preceding line breaks."""
+
+    return source.encode("utf-8")[0:offset].count("\n".encode("utf-8")) + 1
+
+
+def run(issue_counts=ISSUE_COUNTS) -> List[Dict[str, float]]:
+    """Time indexing reports of increasing size.
+
+    :param issue_counts: The numbers of issues to benchmark
+    :return: One result dict per issue count
+    """
+
+    source = make_source(SOURCE_LINES)
+    inp = make_input(source)
+    results = []
+    for count in issue_counts:
+        resp = make_report(count, make_source_maps(source, count))
+        issues_list = [("uuid", resp, inp)]
+
+        start = time.perf_counter()
+        indexed = index_by_filename(issues_list)
+        offset_table = time.perf_counter() - start
+
+        with patch(
+            "mythx_cli.formatter.util.get_source_location_by_offset", count_newlines
+        ):
+            start = time.perf_counter()
+            legacy = index_by_filename(issues_list)
+            newline_count = time.perf_counter() - start
+
+        assert {name: dict(r.issues) for name, r in indexed.items()} == {
+            name: dict(r.issues) for name, r in legacy.items()
+        }
+        results.append(
+            {"issues": count, "line_table": offset_table, "legacy": newline_count}
+        )
+    return results
+
+
+if __name__ == "__main__":
+    for result in run():
+        print(
+            "{issues:>6} issues: line table {line_table:.4f}s, "
+            "newline count {legacy:.4f}s".format(**result)
+        )
@@ -0,0 +1,109 @@
+"""Microbenchmark source map decoding.
+
+This compares :code:`SourceMap.decompress` with the memoized, array-backed
+:code:`decode_source_map`, both for decoding long source maps like the
+ones produced in deep mode and for indexing a report whose issues share
+a small set of source maps.
+
+Run it from the repository root with::
+
+    python -m benchmarks.source_maps
+"""
+
+import time
+from typing import Dict, List
+from unittest.mock import patch
+
+from mythx_models.response.issue import SourceMap
+
+from mythx_cli.formatter.util import DecodedSourceMap, decode_source_map
+from mythx_cli.util import index_by_filename
+
+from .synthetic import make_input, make_report, make_source, make_source_maps
+
+MAP_ENTRIES = (1000, 10000, 50000)
+REPORT_ISSUES = 1000
+REPORT_MAPS = 50
+REPORT_MAP_ENTRIES = 200
+
+
+def decompress(source_map: str) -> DecodedSourceMap:
+    """Decode a source map through the source map model."""
+
+    locations = SourceMap.decompress(source_map)
+    return DecodedSourceMap(
+        [c.offset for c in locations],
+        [c.length for c in locations],
+        [c.file_id for c in locations],
+    )
+
+
+def run() -> List[Dict[str, float]]:
+    """Time source map decoding.
+
+    :return: One result dict per scenario
+    """
+
+    source = make_source(2000)
+    results = []
+    for entries in MAP_ENTRIES:
+        (source_map,) = make_source_maps(source, 1, entries=entries)
+
+        start = time.perf_counter()
+        SourceMap.decompress(source_map)
+        legacy = time.perf_counter() - start
+
+        decode_source_map.cache_clear()
+        start = time.perf_counter()
+        decode_source_map(source_map)
+        cold = time.perf_counter() - start
+
+        start = time.perf_counter()
+        decode_source_map(source_map)
+        memoized = time.perf_counter() - start
+
+        results.append(
+            {
+                "scenario": f"decode {entries} entries",
+                "legacy": legacy,
+                "decoder": cold,
+                "memoized": memoized,
+            }
+        )
+
+    source_maps = make_source_maps(source, REPORT_MAPS, entries=REPORT_MAP_ENTRIES)
+    issues_list = [
+        ("uuid", make_report(REPORT_ISSUES, source_maps), make_input(source))
+    ]
+
+    with patch("mythx_cli.formatter.util.decode_source_map", decompress):
+        start = time.perf_counter()
+        index_by_filename(issues_list)
+        legacy = time.perf_counter() - start
+
+    decode_source_map.cache_clear()
+    start = time.perf_counter()
+    index_by_filename(issues_list)
+    cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index_by_filename(issues_list)
+    memoized = time.perf_counter() - start
+
+    results.append(
+        {
+            "scenario": f"index {REPORT_ISSUES} issues sharing {REPORT_MAPS} maps",
+            "legacy": legacy,
+            "decoder": cold,
+            "memoized": memoized,
+        }
+    )
+    return results
+
+
+if __name__ == "__main__":
+    for result in run():
+        print(
+            "{scenario}: decompress {legacy:.4f}s, decoder {decoder:.4f}s, "
+            "memoized {memoized:.4f}s".format(**result)
+        )
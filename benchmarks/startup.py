@@ -0,0 +1,76 @@
+"""Benchmark the startup time of the CLI.
+
+This runs :code:`mythx version` and :code:`mythx --help` in fresh
+interpreters and compares their median wall time with the time it takes
+to start an interpreter that only imports click. Subcommands and their
+dependencies are loaded lazily, so the difference should stay small. The
+benchmark exits with an error if it exceeds :code:`STARTUP_BUDGET`.
+
+Run it from the repository root with::
+
+    python -m benchmarks.startup
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Sequence
+
+COMMANDS = (("version",), ("--help",))
+ROUNDS = 10
+# maximum time in seconds the CLI may take on top of importing click
+STARTUP_BUDGET = 0.1
+
+
+def median_runtime(args: Sequence[str], rounds: int = ROUNDS) -> float:
+    """Measure the median wall time of running a Python interpreter.
+
+    :param args: The interpreter arguments
+    :param rounds: The number of runs
+    :return: The median wall time in seconds
+    """
+
+    env = {**os.environ, "MYTHX_API_KEY": os.environ.get("MYTHX_API_KEY", "dummy")}
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, *args], env=env, stdout=subprocess.DEVNULL, check=True
+        )
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def run(commands=COMMANDS, rounds: int = ROUNDS) -> List[Dict[str, float]]:
+    """Time the startup of each command.
+
+    :param commands: The CLI arguments to benchmark
+    :param rounds: The number of runs per command
+    :return: One result dict per command
+    """
+
+    baseline = median_runtime(("-c", "import click"), rounds)
+    results = []
+    for command in commands:
+        runtime = median_runtime(("-m", "mythx_cli.cli", *command), rounds)
+        results.append(
+            {
+                "command": " ".join(command),
+                "runtime": runtime,
+                "overhead": runtime - baseline,
+            }
+        )
+    return results
+
+
+if __name__ == "__main__":
+    results = run()
+    for result in results:
+        print(
+            "mythx {command}: {runtime:.4f}s, "
+            "{overhead:.4f}s on top of importing click".format(**result)
+        )
+    if any(result["overhead"] > STARTUP_BUDGET for result in results):
+        sys.exit(f"Startup time exceeds the budget of {STARTUP_BUDGET}s")
@@ -0,0 +1,332 @@
+"""End-to-end benchmarks of the analyze, analysis report and render commands.
+
+For each project size, this generates a compiled Truffle project and
+runs the real click commands against the local API stand-in from
+:code:`benchmarks.server`, which answers with the recorded responses in
+:code:`tests/testdata`:
+
+1. :code:`analyze --create-group` submits every contract, waits for the
+   analyses and prints their reports.
+2. :code:`analysis report` fetches and prints the reports of those
+   analyses again.
+3. :code:`render` renders the HTML report of the analysis group.
+
+Each command reports its wall time, the time spent in each phase and the
+peak memory traced by :code:`tracemalloc`. The peak memory is measured in
+a separate run, as tracing slows down the command. Results are written as
+JSON, and a previous result file can be passed to compare against it.
+
+Run it from the repository root with::
+
+    python -m benchmarks.suite --output results.json --compare baseline.json
+"""
+
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import ExitStack, contextmanager
+from datetime import datetime, timezone
+from importlib import import_module
+from inspect import getattr_static
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from unittest.mock import patch
+
+import click
+from click.testing import CliRunner
+
+from mythx_cli.cli import cli
+
+from .server import StandInAPI, running_server
+from .synthetic import make_truffle_project
+
+SIZES = (10, 100, 1000)
+PHASES = {
+    "analyze": {
+        "jobs": ("mythx_cli.analyze.truffle:TruffleJob.generate_payloads",),
+        "submission": ("mythx_cli.analyze.command:submit_jobs",),
+        "polling": ("mythx_cli.analyze.command:poll_reports",),
+        "formatting": (
+            "mythx_cli.formatter.tabular:TabularFormatter.iter_detected_issues",
+        ),
+    },
+    "report": {
+        "fetching": ("mythx_cli.analysis.report:fetch_reports",),
+        "formatting": (
+            "mythx_cli.formatter.tabular:TabularFormatter.iter_detected_issues",
+        ),
+    },
+    "render": {
+        "fetching": (
+            "mythx_cli.render.command:get_analysis_info",
+            "pythx:Client.analysis_list",
+        ),
+        "indexing": ("mythx_cli.render.command:index_by_filename",),
+        "templating": ("jinja2:Template.render",),
+        "minifying": ("htmlmin:minify",),
+    },
+}
+
+
+class PhaseTimer:
+    """Accumulate the time spent in the functions of each phase.
+
+    Functions returning an iterator, such as generators, are also timed
+    while the iterator is consumed.
+    """
+
+    def __init__(self):
+        self.phases: Dict[str, float] = defaultdict(float)
+
+    def wrap(self, phase: str, func: Callable) -> Callable:
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            finally:
+                self.phases[phase] += time.perf_counter() - start
+            if isinstance(result, Iterator):
+                return self.iterate(phase, result)
+            return result
+
+        return timed
+
+    def iterate(self, phase: str, iterator: Iterator) -> Iterator:
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self.phases[phase] += time.perf_counter() - start
+            yield item
+
+    @contextmanager
+    def patched(self, phases: Dict[str, Sequence[str]]) -> Iterator[None]:
+        """Time the given functions while the context is active.
+
+        Functions are identified by their import path in the form
+        :code:`module:attribute`, where the attribute can be nested, like
+        :code:`module:Class.method`.
+        """
+
+        with ExitStack() as stack:
+            for phase, targets in phases.items():
+                for target in targets:
+                    module, qualname = target.split(":")
+                    *owner_path, attribute = qualname.split(".")
+                    owner = import_module(module)
+                    for name in owner_path:
+                        owner = getattr(owner, name)
+                    timed = self.wrap(phase, getattr(owner, attribute))
+                    if isinstance(
+                        getattr_static(owner, attribute), (classmethod, staticmethod)
+                    ):
+                        # the wrapped function is already bound
+                        timed = staticmethod(timed)
+                    stack.enter_context(patch.object(owner, attribute, timed))
+            yield
+
+
+def invoke(args: List[str], url: str, work_dir: Path) -> None:
+    """Run a CLI command against the stand-in API.
+
+    Every run writes its output to a new file and uses empty caches, so no
+    run is influenced by the data of earlier ones.
+
+    :param args: The command line arguments
+    :param url: The stand-in API URL
+    :param work_dir: The directory to create the run's files in
+    """
+
+    run_dir = Path(tempfile.mkdtemp(dir=work_dir))
+    env = {
+        "MYTHX_API_URL": url,
+        "MYTHX_API_KEY": "dummy",
+        "MYTHX_CACHE_DIR": str(run_dir / "cache"),
+    }
+    args = ["--output", str(run_dir / "output.txt"), *args]
+    result = CliRunner(mix_stderr=False).invoke(cli, args, env=env)
+    if result.exception is not None and not isinstance(result.exception, SystemExit):
+        raise result.exception
+    if result.exit_code != 0:
+        raise RuntimeError(f"mythx {' '.join(args)} failed: {result.stderr}")
+
+
+def measure(command: str, args: List[str], url: str, work_dir: Path) -> Dict[str, Any]:
+    """Measure the wall time, phase times, and peak memory of a command.
+
+    :param command: The name of the command's phase definition
+    :param args: The command line arguments
+    :param url: The stand-in API URL
+    :param work_dir: The directory to create the runs' files in
+    :return: The measurements
+    """
+
+    timer = PhaseTimer()
+    with timer.patched(PHASES[command]):
+        start = time.perf_counter()
+        invoke(args, url, work_dir)
+        wall_time = time.perf_counter() - start
+
+    tracemalloc.start()
+    try:
+        invoke(args, url, work_dir)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "command": command,
+        "wall_time": wall_time,
+        "phases": {phase: timer.phases[phase] for phase in PHASES[command]},
+        "peak_memory": peak_memory,
+    }
+
+
+def run_size(contracts: int) -> List[Dict[str, Any]]:
+    """Benchmark all commands on a project of the given size.
+
+    :param contracts: The number of contracts in the generated project
+    :return: One result dict per command
+    """
+
+    api = StandInAPI()
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp_dir, running_server(api) as url:
+        work_dir = Path(tmp_dir)
+        project = work_dir / "project"
+        project.mkdir()
+        make_truffle_project(project, contracts)
+        # Truffle jobs look up Solidity files relative to the working directory
+        os.chdir(project)
+        try:
+            results = [
+                measure(
+                    "analyze",
+                    [
+                        "--yes",
+                        "analyze",
+                        "--create-group",
+                        "--poll-interval",
+                        "0",
+                        "--poll-jitter",
+                        "0",
+                        str(project),
+                    ],
+                    url,
+                    work_dir,
+                )
+            ]
+        finally:
+            os.chdir(cwd)
+
+        group_id = next(iter(api.groups))
+        uuids = [u for u, a in api.analyses.items() if a["groupId"] == group_id]
+        results.append(measure("report", ["analysis", "report", *uuids], url, work_dir))
+        results.append(measure("render", ["render", group_id], url, work_dir))
+
+    for result in results:
+        result["contracts"] = contracts
+    return results
+
+
+def run(sizes: Sequence[int] = SIZES) -> Dict[str, Any]:
+    """Run the benchmark suite.
+
+    :param sizes: The numbers of contracts to benchmark
+    :return: The results and the environment they were measured in
+    """
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "results": [result for size in sizes for result in run_size(size)],
+    }
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any]) -> List[str]:
+    """Compare the wall times and peak memory with a previous run.
+
+    :param results: The current results
+    :param baseline: The results to compare against
+    :return: One line per result measured in both runs
+    """
+
+    previous = {(r["command"], r["contracts"]): r for r in baseline["results"]}
+    lines = []
+    for result in results["results"]:
+        old = previous.get((result["command"], result["contracts"]))
+        if old is None:
+            continue
+        lines.append(
+            "{command:>7} {contracts:>5} contracts: wall time {time:+.1%}, "
+            "peak memory {memory:+.1%}".format(
+                command=result["command"],
+                contracts=result["contracts"],
+                time=result["wall_time"] / old["wall_time"] - 1,
+                memory=result["peak_memory"] / old["peak_memory"] - 1,
+            )
+        )
+    return lines
+
+
+@click.command()
+@click.option(
+    "--size",
+    "sizes",
+    type=int,
+    multiple=True,
+    default=SIZES,
+    help="Number of contracts to benchmark (repeatable)",
+)
+@click.option("--output", type=click.Path(), help="File to write the JSON results to")
+@click.option(
+    "--compare",
+    "baseline",
+    type=click.Path(exists=True),
+    help="JSON results of a previous run to compare against",
+)
+def main(sizes: Sequence[int], output: Optional[str], baseline: Optional[str]):
+    """Run the end-to-end benchmark suite."""
+
+    results = run(sizes)
+    for result in results["results"]:
+        click.echo(
+            "{command:>7} {contracts:>5} contracts: {wall_time:.3f}s ({phases}), "
+            "peak memory {memory:.1f} MiB".format(
+                command=result["command"],
+                contracts=result["contracts"],
+                wall_time=result["wall_time"],
+                phases=", ".join(
+                    f"{name} {spent:.3f}s" for name, spent in result["phases"].items()
+                ),
+                memory=result["peak_memory"] / 2 ** 20,
+            )
+        )
+    if output:
+        with open(output, "w") as output_f:
+            json.dump(results, output_f, indent=2)
+    if baseline:
+        with open(baseline) as baseline_f:
+            click.echo("\n".join(compare(results, json.load(baseline_f))))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+"""Synthetic MythX responses, sources and projects for the benchmarks."""
+
+import json
+import random
+from pathlib import Path
+from typing import Dict, List
+
+from mythx_models.response import AnalysisInputResponse, DetectedIssuesResponse
+
+FILENAME = "/project/contracts/Flattened.sol"
+SWC_IDS = ("SWC-101", "SWC-107", "SWC-110", "SWC-113", "SWC-116", "SWC-120")
+SEVERITIES = ("Unknown", "None", "Low", "Medium", "High")
+
+
+def make_source(lines: int) -> str:
+    """Generate a large flattened Solidity contract.
+
+    :param lines: The number of source lines
+    :return: The Solidity source
+    """
+
+    body = [
+        f"    function f{i}(uint256 a) public pure returns (uint256) {{ return a * {i}; }}"
+        for i in range(lines - 3)
+    ]
+    return "\n".join(["pragma solidity ^0.6.0;", "contract Flattened {"] + body + ["}"])
+
+
+def make_source_maps(
+    source: str, count: int, entries: int = 1, seed: int = 0
+) -> List[str]:
+    """Generate compressed source maps pointing into the given source.
+
+    :param source: The source the offsets point into
+    :param count: The number of source maps
+    :param entries: The number of entries of each source map
+    :param seed: The random seed
+    :return: The compressed source maps
+    """
+
+    rng = random.Random(seed)
+    size = len(source.encode("utf-8"))
+    return [
+        ";".join(
+            f"{rng.randrange(size)}:{rng.randrange(1, 80)}:0:-" for _ in range(entries)
+        )
+        for _ in range(count)
+    ]
+
+
+def make_report(
+    issues: int, source_maps: List[str], seed: int = 0
+) -> DetectedIssuesResponse:
+    """Generate a detected issues report.
+
+    :param issues: The number of issues
+    :param source_maps: The source maps to attach to the issues, cycled through
+    :param seed: The random seed
+    :return: The report
+    """
+
+    rng = random.Random(seed)
+    return DetectedIssuesResponse.parse_obj(
+        {
+            "issue_reports": [
+                {
+                    "issues": [
+                        {
+                            "swcID": rng.choice(SWC_IDS),
+                            "swcTitle": "Synthetic issue",
+                            "description": {
+                                "head": f"Synthetic issue {i}.",
+                                "tail": "This issue was generated for benchmarking.",
+                            },
+                            "severity": rng.choice(SEVERITIES),
+                            "locations": [
+                                {
+                                    "sourceMap": source_maps[i % len(source_maps)],
+                                    "sourceType": "solidity-file",
+                                    "sourceFormat": "text",
+                                    "sourceList": [FILENAME],
+                                }
+                            ],
+                            "extra": {},
+                        }
+                        for i in range(issues)
+                    ],
+                    "sourceType": "solidity-file",
+                    "sourceFormat": "text",
+                    "sourceList": [FILENAME],
+                    "meta": {},
+                }
+            ]
+        }
+    )
+
+
+def make_input(source: str) -> AnalysisInputResponse:
+    """Generate the analysis input for a single source file.
+
+    :param source: The Solidity source
+    :return: The analysis input
+    """
+
+    return AnalysisInputResponse.parse_obj(
+        {
+            "contractName": "Flattened",
+            "bytecode": "0x",
+            "sourceMap": "",
+            "deployedBytecode": "0x",
+            "deployedSourceMap": "",
+            "mainSource": FILENAME,
+            "sources": {FILENAME: {"source": source}},
+            "sourceList": [FILENAME],
+            "version": "0.6.0",
+            "analysisMode": "quick",
+        }
+    )
+
+
+def make_truffle_project(
+    base_path: Path, contracts: int, imports: int = 3, seed: int = 0
+) -> None:
+    """Write a compiled Truffle project with the given number of contracts.
+
+    Every contract imports up to :code:`imports` contracts with a lower
+    index, and its build artifact holds the fields the CLI reads.
+
+    :param base_path: The directory to create the project in
+    :param contracts: The number of contracts
+    :param imports: The maximum number of imports per contract
+    :param seed: The random seed for picking the imports
+    """
+
+    rng = random.Random(seed)
+    (base_path / "truffle-config.js").write_text("module.exports = {};\n")
+    build_dir, contracts_dir = (
+        base_path / "build" / "contracts",
+        base_path / "contracts",
+    )
+    build_dir.mkdir(parents=True)
+    contracts_dir.mkdir()
+    for idx in range(contracts):
+        name = f"Contract{idx}"
+        source_path = str(contracts_dir / f"{name}.sol")
+        deps = rng.sample(range(idx), min(imports, idx))
+        source = "\n".join(
+            ["pragma solidity ^0.6.0;"]
+            + [f'import "./Contract{dep}.sol";' for dep in deps]
+            + [
+                f"contract {name} {{",
+                "    uint256 value;",
+                "    function set(uint256 v) public { value = v; }",
+                "}",
+            ]
+        )
+        (contracts_dir / f"{name}.sol").write_text(source)
+        ast = {
+            "absolutePath": source_path,
+            "src": f"0:{len(source)}:{idx}",
+            "nodes": [
+                {
+                    "nodeType": "ImportDirective",
+                    "absolutePath": str(contracts_dir / f"Contract{dep}.sol"),
+                }
+                for dep in deps
+            ],
+        }
+        artifact = {
+            "contractName": name,
+            "bytecode": "0x6080604052" + f"{idx:08x}" * 64,
+            "deployedBytecode": "0x6080604052" + f"{idx:08x}" * 48,
+            "sourceMap": f"0:{len(source)}:{idx}:-;;;;",
+            "deployedSourceMap": f"0:{len(source)}:{idx}:-;;;",
+            "source": source,
+            "sourcePath": source_path,
+            "ast": ast,
+            "compiler": {"name": "solc", "version": "0.6.0+commit.26b70077"},
+        }
+        with open(build_dir / f"{name}.json", "w") as artifact_f:
+            json.dump(artifact, artifact_f, indent=2)
+
+
+def make_ast_node(depth: int, children: int = 4, legacy: bool = False) -> Dict:
+    """Generate a nested AST node in the compact or the legacy AST format.
+
+    :param depth: The number of node levels below this node
+    :param children: The number of child nodes per level
+    :param legacy: Whether to use the legacy AST format
+    :return: The AST node
+    """
+
+    nested = [
+        make_ast_node(depth - 1, children, legacy)
+        for _ in range(children if depth else 0)
+    ]
+    if legacy:
+        node = {"attributes": {"type": "uint256", "value": "x"}, "name": "Block"}
+        if nested:
+            node["children"] = nested
+    else:
+        node = {
+            "nodeType": "Block",
+            "typeDescriptions": {
+                "typeIdentifier": "t_uint256",
+                "typeString": "uint256",
+            },
+        }
+        if nested:
+            node["statements"] = nested
+    return {"id": depth, "src": "0:100:0", **node}
+
+
+def make_artifact(depth: int, ast: bool = True) -> Dict:
+    """Generate a large Truffle build artifact.
+
+    The members are ordered like in the artifacts Truffle writes, so the
+    legacy AST and the compiler information come after the AST.
+
+    :param depth: The depth of the generated ASTs
+    :param ast: Whether to include the compact AST next to the legacy AST
+    :return: The build artifact
+    """
+
+    source = make_source(2000)
+    artifact = {
+        "contractName": "Token",
+        "abi": [
+            {"inputs": [], "name": f"f{idx}", "outputs": [], "type": "function"}
+            for idx in range(500)
+        ],
+        "metadata": json.dumps({"sources": {"Token.sol": {"content": source}}}),
+        "bytecode": "0x6080604052" + "ab" * 12000,
+        "deployedBytecode": "0x6080604052" + "cd" * 10000,
+        "sourceMap": "0:10:0:-;" * 4000,
+        "deployedSourceMap": "0:10:0:-;" * 3000,
+        "source": source,
+        "sourcePath": "/project/contracts/Token.sol",
+    }
+    if ast:
+        artifact["ast"] = make_ast_node(depth)
+    artifact["legacyAST"] = make_ast_node(depth, legacy=True)
+    artifact["compiler"] = {"name": "solc", "version": "0.5.16+commit.9c3226ce"}
+    artifact["networks"] = {}
+    artifact["schemaVersion"] = "3.0.23"
+    return artifact
@@ -7,7 +7,7 @@ from mythx_models.response import AnalysisInputResponse, DetectedIssuesResponse
 
 from mythx_cli.formatter import FORMAT_RESOLVER, util
 from mythx_cli.formatter.base import BaseFormatter
-from mythx_cli.util import write_or_print
+from mythx_cli.util import fetch_reports, write_or_print
 
 LOGGER = logging.getLogger("mythx-cli")
 
@@ -32,6 +32,13 @@ LOGGER = logging.getLogger("mythx-cli")
     help="A comma-separated list of SWC IDs to include",
     default=None,
 )
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="The maximum number of parallel API requests",
+)
 @click.pass_obj
 def analysis_report(
     ctx,
@@ -39,6 +46,7 @@ def analysis_report(
     min_severity: Optional[str],
     swc_blacklist: Optional[List[str]],
     swc_whitelist: Optional[List[str]],
+    concurrency: int,
 ) -> None:
     """Fetch the report for a single or multiple job UUIDs.
 
@@ -49,6 +57,7 @@ def analysis_report(
     :param min_severity: Ignore SWC IDs below the designated level
     :param swc_blacklist: A comma-separated list of SWC IDs to ignore
     :param swc_whitelist: A comma-separated list of SWC IDs to include
+    :param concurrency: The maximum number of parallel API requests
     :return:
     """
 
@@ -56,31 +65,33 @@ def analysis_report(
         Tuple[str, DetectedIssuesResponse, Optional[AnalysisInputResponse]]
     ] = []
     formatter: BaseFormatter = FORMAT_RESOLVER[ctx["fmt"]]
-    for uuid in uuids:
-        LOGGER.debug(f"{uuid}: Fetching report")
-        resp: DetectedIssuesResponse = ctx["client"].report(uuid)
-        LOGGER.debug(f"{uuid}: Fetching input")
-        inp = (
-            ctx["client"].request_by_uuid(uuid)
-            if formatter.report_requires_input
-            else None
-        )
-
+    issue_filter = util.IssueFilter(
+        min_severity=min_severity,
+        swc_blacklist=swc_blacklist,
+        swc_whitelist=swc_whitelist,
+    )
+    for uuid, resp, inp in fetch_reports(
+        client=ctx["client"],
+        uuids=uuids,
+        fetch_input=formatter.report_requires_input,
+        concurrency=concurrency,
+    ):
         LOGGER.debug(f"{uuid}: Applying SWC filters")
-        util.filter_report(
-            resp,
-            min_severity=min_severity,
-            swc_blacklist=swc_blacklist,
-            swc_whitelist=swc_whitelist,
-        )
+        issue_filter.apply(resp)
+        if formatter.report_incremental:
+            # emit the report right away instead of collecting it
+            write_or_print(formatter.format_detected_issues_entry(uuid, resp, inp))
+            continue
         issues_list.append((uuid, resp, inp))
 
+    if formatter.report_incremental:
+        sys.exit(ctx["retval"])
+
     LOGGER.debug(
         f"Printing report for {len(issues_list)} issue items with sort key \"{ctx['table_sort_key']}\""
     )
-    write_or_print(
-        formatter.format_detected_issues(
-            issues_list, table_sort_key=ctx["table_sort_key"]
-        )
-    )
+    for fragment in formatter.iter_detected_issues(
+        issues_list, table_sort_key=ctx["table_sort_key"]
+    ):
+        write_or_print(fragment, nl=False)
     sys.exit(ctx["retval"])
@@ -1,13 +1,12 @@
 import logging
 import sys
-import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 import click
 from mythx_models.response import (
     AnalysisInputResponse,
-    AnalysisSubmissionResponse,
+    AnalysisStatus,
     DetectedIssuesResponse,
     GroupCreationResponse,
 )
@@ -20,8 +19,13 @@ from mythx_cli.analyze.util import (
     ScenarioMode,
     determine_analysis_targets,
     is_valid_job,
+    poll_reports,
     sanitize_paths,
+    submit_jobs,
 )
+from mythx_cli.cache.compile import CompileCache
+from mythx_cli.cache.ledger import SubmissionLedger, client_account, payload_fingerprint
+from mythx_cli.cache.manifest import AnalysisManifest
 from mythx_cli.formatter import FORMAT_RESOLVER, util
 from mythx_cli.formatter.base import BaseFormatter
 from mythx_cli.util import write_or_print
@@ -130,6 +134,59 @@ LOGGER = logging.getLogger("mythx-cli")
     default=None,
     help="Force an analysis scenario",
 )
+@click.option(
+    "--parallel-compile",
+    is_flag=True,
+    default=None,
+    help="Compile Solidity files in parallel worker processes",
+)
+@click.option(
+    "--compile-workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="The number of compilation workers (defaults to the CPU count)",
+)
+@click.option(
+    "--batch-compile",
+    is_flag=True,
+    default=None,
+    help="Compile all Solidity files of a solc version in one invocation",
+)
+@click.option(
+    "--compile-cache/--no-compile-cache",
+    default=None,
+    help="Reuse cached solc output for unchanged sources",
+)
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=None,
+    help="The maximum number of jobs to submit or reports to fetch in parallel",
+)
+@click.option(
+    "--deduplicate",
+    is_flag=True,
+    default=None,
+    help="Reuse previous analyses of identical payloads instead of resubmitting",
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    default=None,
+    help="Only submit Truffle artifacts that changed since the last run",
+)
+@click.option(
+    "--poll-interval",
+    type=click.FloatRange(min=0),
+    default=None,
+    help="The number of seconds to wait between status checks",
+)
+@click.option(
+    "--poll-jitter",
+    type=click.FloatRange(min=0),
+    default=None,
+    help="The maximum number of seconds randomly added to the poll interval",
+)
 @click.pass_obj
 def analyze(
     ctx,
@@ -150,6 +207,15 @@ def analyze(
     enable_scribble: bool,
     scribble_path: str,
     scenario: str,
+    parallel_compile: bool,
+    compile_workers: int,
+    batch_compile: bool,
+    compile_cache: bool,
+    concurrency: int,
+    deduplicate: bool,
+    incremental: bool,
+    poll_interval: float,
+    poll_jitter: float,
 ) -> None:
     """Analyze the given directory or arguments with MythX.
 
@@ -173,6 +239,15 @@ def analyze(
     :param enable_scribble: Enable instrumentation with scribble
     :param scribble_path: Optional path to the scribble executable
     :param scenario: Force an analysis scenario
+    :param parallel_compile: Compile Solidity files in parallel worker processes
+    :param compile_workers: The number of compilation worker processes
+    :param batch_compile: Compile all Solidity files of a version at once
+    :param compile_cache: Reuse cached solc output for unchanged sources
+    :param concurrency: The maximum number of parallel submissions and report requests
+    :param deduplicate: Reuse previous analyses of identical payloads
+    :param incremental: Only submit Truffle artifacts changed since the last run
+    :param poll_interval: The number of seconds to wait between status checks
+    :param poll_jitter: The maximum random delay added to the poll interval
     :return:
     """
 
@@ -198,6 +273,20 @@ def analyze(
     scribble_path = scribble_path or analyze_config.get("scribble-path") or "scribble"
     target = target or analyze_config.get("targets") or None
     scenario = scenario or analyze_config.get("scenario") or None
+    parallel_compile = (
+        parallel_compile or analyze_config.get("parallel-compile") or False
+    )
+    compile_workers = compile_workers or analyze_config.get("compile-workers") or None
+    batch_compile = batch_compile or analyze_config.get("batch-compile") or False
+    if compile_cache is None:
+        compile_cache = analyze_config.get("compile-cache", True)
+    concurrency = concurrency or analyze_config.get("concurrency") or 1
+    deduplicate = deduplicate or analyze_config.get("deduplicate") or False
+    incremental = incremental or analyze_config.get("incremental") or False
+    if poll_interval is None:
+        poll_interval = analyze_config.get("poll-interval", 3)
+    if poll_jitter is None:
+        poll_jitter = analyze_config.get("poll-jitter", 1)
 
     # enable property checking if explicitly requested or implicitly when
     # scribble instrumentation is requested
@@ -216,7 +305,10 @@ def analyze(
         ctx["client"].handler.middlewares.append(group_mw)
 
     jobs: List[Dict[str, Any]] = []
+    # maps Truffle payloads by identity to their manifest entry
+    artifact_entries: Dict[int, Tuple[AnalysisManifest, str, str]] = {}
     include = list(include)
+    solc_cache = CompileCache() if compile_cache else None
     mode_list = determine_analysis_targets(target, forced_scenario=scenario)
 
     for scenario, element in mode_list:
@@ -227,6 +319,21 @@ def analyze(
                 remappings=remap_import,
                 scribble_path=scribble_path,
             )
+            if incremental:
+                manifest = AnalysisManifest(
+                    element, api_url=ctx["client"].handler.api_url
+                )
+                fingerprints = job.artifact_fingerprints()
+                for artifact_file, payload in zip(job.artifact_files, job.payloads):
+                    artifact_entries[id(payload)] = (
+                        manifest,
+                        artifact_file,
+                        payload_fingerprint(
+                            {"artifact": fingerprints[artifact_file]},
+                            analysis_mode=mode,
+                            check_properties=check_properties or enable_scribble,
+                        ),
+                    )
             jobs.extend(job.payloads)
         elif scenario == ScenarioMode.SOLIDITY_DIR:
             # recursively enumerate sol files if not a truffle project
@@ -239,6 +346,10 @@ def analyze(
                     remappings=remap_import,
                     enable_scribble=enable_scribble,
                     scribble_path=scribble_path,
+                    parallel=parallel_compile,
+                    workers=compile_workers,
+                    batch=batch_compile,
+                    compile_cache=solc_cache,
                 )
             )
         elif scenario == ScenarioMode.SOLIDITY_FILE:
@@ -256,6 +367,7 @@ def analyze(
                 remappings=remap_import,
                 enable_scribble=enable_scribble,
                 scribble_path=scribble_path,
+                compile_cache=solc_cache,
             )
             jobs.extend(job.payloads)
 
@@ -293,54 +405,124 @@ def analyze(
         LOGGER.debug("User consent not given - exiting")
         sys.exit(0)
 
-    uuids = []
-    with click.progressbar(jobs) as bar:
-        for job in bar:
-            # attach execution mode, submit, poll
-            job.update({"analysis_mode": mode})
-            resp: AnalysisSubmissionResponse = ctx["client"].analyze(**job)
-            uuids.append(resp.uuid)
+    for job in jobs:
+        # attach execution mode
+        job.update({"analysis_mode": mode})
+
+    uuids: List[Optional[str]] = [None] * len(jobs)
+    for idx, job in enumerate(jobs):
+        if id(job) not in artifact_entries:
+            continue
+        manifest, artifact_file, fingerprint = artifact_entries[id(job)]
+        uuid = manifest.lookup(artifact_file, fingerprint)
+        if uuid is None:
+            continue
+        if ctx["client"].analysis_status(uuid).status == AnalysisStatus.ERROR:
+            LOGGER.debug(f"Previous analysis {uuid} failed - resubmitting")
+            continue
+        LOGGER.debug(f"Artifact {artifact_file} unchanged - reusing analysis {uuid}")
+        uuids[idx] = uuid
+
+    fingerprints: List[Optional[str]] = [None] * len(jobs)
+    ledger = None
+    if deduplicate:
+        ledger = SubmissionLedger(
+            api_url=ctx["client"].handler.api_url, account=client_account(ctx["client"])
+        )
+    if ledger is not None:
+        for idx, job in enumerate(jobs):
+            if uuids[idx] is not None:
+                continue
+            fingerprints[idx] = payload_fingerprint(
+                job, check_properties=check_properties or enable_scribble
+            )
+            uuid = ledger.lookup(fingerprints[idx])
+            if uuid is None:
+                continue
+            if ctx["client"].analysis_status(uuid).status == AnalysisStatus.ERROR:
+                LOGGER.debug(f"Previous analysis {uuid} failed - resubmitting")
+                ledger.forget(fingerprints[idx])
+                continue
+            LOGGER.debug(f"Reusing analysis {uuid} for {job.get('contract_name')}")
+            uuids[idx] = uuid
+
+    pending = [idx for idx, uuid in enumerate(uuids) if uuid is None]
+    if len(pending) < len(jobs):
+        click.echo(
+            f"Reusing {len(jobs) - len(pending)} previous analyses of unchanged jobs",
+            err=True,
+        )
+
+    with click.progressbar(length=len(pending)) as bar:
+        submitted = submit_jobs(
+            client=ctx["client"],
+            jobs=[jobs[idx] for idx in pending],
+            concurrency=concurrency,
+            bar=bar,
+        )
+    for idx, uuid in zip(pending, submitted):
+        uuids[idx] = uuid
+        if ledger is not None:
+            ledger.record(fingerprints[idx], uuid)
+
+    manifests = set()
+    for idx, job in enumerate(jobs):
+        if id(job) in artifact_entries:
+            manifest, artifact_file, fingerprint = artifact_entries[id(job)]
+            manifest.update(artifact_file, fingerprint, uuids[idx])
+            manifests.add(manifest)
 
     if async_flag:
         LOGGER.debug(
             f"Asynchronous submission enabled - printing {len(uuids)} UUIDs and exiting"
         )
+        for manifest in manifests:
+            manifest.save()
         write_or_print("\n".join(uuids))
         return
 
-    issues_list: List[
-        Tuple[str, DetectedIssuesResponse, Optional[AnalysisInputResponse]]
-    ] = []
+    reports: Dict[
+        str, Tuple[str, DetectedIssuesResponse, Optional[AnalysisInputResponse]]
+    ] = {}
     formatter: BaseFormatter = FORMAT_RESOLVER[ctx["fmt"]]
-    for uuid in uuids:
-        while not ctx["client"].analysis_ready(uuid):
-            # TODO: Add poll interval option
-            LOGGER.debug(f"Analysis {uuid} not ready yet - waiting")
-            time.sleep(3)
-        LOGGER.debug(f"{uuid}: Fetching report")
-        resp: DetectedIssuesResponse = ctx["client"].report(uuid)
-        LOGGER.debug(f"{uuid}: Fetching input")
-        inp: Optional[AnalysisInputResponse] = (
-            ctx["client"].request_by_uuid(uuid)
-            if formatter.report_requires_input
-            else None
-        )
-
+    issue_filter = util.IssueFilter(
+        min_severity=min_severity,
+        swc_blacklist=swc_blacklist,
+        swc_whitelist=swc_whitelist,
+    )
+    for uuid, resp, inp in poll_reports(
+        client=ctx["client"],
+        uuids=uuids,
+        interval=poll_interval,
+        jitter=poll_jitter,
+        fetch_input=formatter.report_requires_input,
+        concurrency=concurrency,
+    ):
         LOGGER.debug(f"{uuid}: Applying SWC filters")
-        util.filter_report(
-            resp,
-            min_severity=min_severity,
-            swc_blacklist=swc_blacklist,
-            swc_whitelist=swc_whitelist,
-        )
-        issues_list.append((uuid, resp, inp))
+        issue_filter.apply(resp)
+        if formatter.report_incremental:
+            # emit the report right away instead of collecting it
+            write_or_print(formatter.format_detected_issues_entry(uuid, resp, inp))
+            continue
+        reports[uuid] = (uuid, resp, inp)
+
+    # all analyses finished, so the next incremental run can build on them
+    for manifest in manifests:
+        manifest.save()
+
+    if formatter.report_incremental:
+        sys.exit(ctx["retval"])
+
+    # restore submission order for deterministic output
+    issues_list: List[
+        Tuple[str, DetectedIssuesResponse, Optional[AnalysisInputResponse]]
+    ] = [reports[uuid] for uuid in uuids]
 
     LOGGER.debug(
         f"Printing report for {len(issues_list)} issue items with sort key \"{ctx['table_sort_key']}\""
     )
-    write_or_print(
-        formatter.format_detected_issues(
-            issues_list, table_sort_key=ctx["table_sort_key"]
-        )
-    )
+    for fragment in formatter.iter_detected_issues(
+        issues_list, table_sort_key=ctx["table_sort_key"]
+    ):
+        write_or_print(fragment, nl=False)
     sys.exit(ctx["retval"])
@@ -1,14 +1,19 @@
 """This module contains functions to generate Solidity-related payloads."""
 
 import logging
+import os
 import re
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import click
 import solcx
 import solcx.exceptions
 
+from mythx_cli.cache.compile import CompileCache
+
 from .scribble import ScribbleMixin
 
 LOGGER = logging.getLogger("mythx-cli")
@@ -16,6 +21,21 @@ PRAGMA_PATTERN = r"pragma solidity [\^<>=]*(\d+\.\d+\.\d+);"
 RGLOB_BLACKLIST = ["node_modules"]
 
 
+def _compile_payloads(file: str, options: Dict[str, Any]) -> List[Dict]:
+    """Generate the payloads of a single Solidity file.
+
+    This is the unit of work of the parallel compilation mode. It lives on
+    module level so it can be sent to process pool workers.
+
+    :param file: The Solidity file to compile
+    :param options: The keyword arguments to pass to :code:`generate_payloads`
+    :return: The generated payloads
+    """
+    job = SolidityJob(Path(file))
+    job.generate_payloads(**options)
+    return job.payloads
+
+
 class SolidityJob(ScribbleMixin):
     def __init__(self, target: Path):
         super().__init__()
@@ -23,7 +43,11 @@ class SolidityJob(ScribbleMixin):
         self.payloads = []
 
     def payload_from_sources(
-        self, solc_result: Dict, scribble_file: str, solc_version: str
+        self,
+        solc_result: Dict,
+        scribble_file: str,
+        solc_version: str,
+        include: Optional[Set[str]] = None,
     ) -> Dict:
         compiled_sources = solc_result.get("sources", {})
         payload = {
@@ -38,6 +62,9 @@ class SolidityJob(ScribbleMixin):
                 continue
             # fill source list entry
             payload["source_list"][file_data.get("id")] = file_path
+            if include is not None and file_path not in include:
+                # keep the source list complete, but skip unrelated sources
+                continue
             payload_dict = payload["sources"][file_path] = {}
 
             # add AST for file if it's present
@@ -132,6 +159,35 @@ class SolidityJob(ScribbleMixin):
                     )
                     payload["deployed_source_map"] = contract_deployed_source_map
 
+    @staticmethod
+    def compiler_settings(path: str, remappings: Tuple[str]) -> Dict:
+        """Build the solc standard-JSON settings used for all compilations.
+
+        :param path: The base path to resolve import remappings against
+        :param remappings: Import remappings to pass to solc
+        :return: The standard-JSON settings object
+        """
+        return {
+            "remappings": [r.format(pwd=path) for r in remappings]
+            or [
+                f"openzeppelin-solidity/={path}/node_modules/openzeppelin-solidity/",
+                f"openzeppelin-zos/={path}/node_modules/openzeppelin-zos/",
+                f"zos-lib/={path}/node_modules/zos-lib/",
+            ],
+            "outputSelection": {
+                "*": {
+                    "*": [
+                        "evm.bytecode.object",
+                        "evm.bytecode.sourceMap",
+                        "evm.deployedBytecode.object",
+                        "evm.deployedBytecode.sourceMap",
+                    ],
+                    "": ["ast"],
+                }
+            },
+            "optimizer": {"enabled": True, "runs": 200},
+        }
+
     def solcx_compile(
         self,
         path: str,
@@ -139,35 +195,26 @@ class SolidityJob(ScribbleMixin):
         enable_scribble: bool,
         scribble_file: str = None,
         solc_path: str = None,
+        solc_version: str = None,
+        compile_cache: Optional[CompileCache] = None,
     ) -> Dict:
-        return solcx.compile_standard(
+        compile_standard = (
+            compile_cache.compile_standard
+            if compile_cache is not None
+            else solcx.compile_standard
+        )
+        return compile_standard(
             solc_binary=solc_path,
+            # pass the version explicitly instead of relying on the
+            # process-global version set in solcx
+            solc_version=solc_version if solc_path is None else None,
             input_data={
                 "language": "Solidity",
                 "sources": {
                     scribble_file
                     or self.target: {"urls": [scribble_file or self.target]}
                 },
-                "settings": {
-                    "remappings": [r.format(pwd=path) for r in remappings]
-                    or [
-                        f"openzeppelin-solidity/={path}/node_modules/openzeppelin-solidity/",
-                        f"openzeppelin-zos/={path}/node_modules/openzeppelin-zos/",
-                        f"zos-lib/={path}/node_modules/zos-lib/",
-                    ],
-                    "outputSelection": {
-                        "*": {
-                            "*": [
-                                "evm.bytecode.object",
-                                "evm.bytecode.sourceMap",
-                                "evm.deployedBytecode.object",
-                                "evm.deployedBytecode.sourceMap",
-                            ],
-                            "": ["ast"],
-                        }
-                    },
-                    "optimizer": {"enabled": True, "runs": 200},
-                },
+                "settings": self.compiler_settings(path, remappings),
             },
             # if scribble enabled, allow access to temporary file
             allow_paths=path if not enable_scribble else scribble_file,
@@ -181,6 +228,7 @@ class SolidityJob(ScribbleMixin):
         remappings: Tuple[str] = None,
         enable_scribble: bool = False,
         scribble_path: str = "scribble",
+        compile_cache: Optional[CompileCache] = None,
     ):
         """Generate a MythX analysis request from a given Solidity file.
 
@@ -205,6 +253,7 @@ class SolidityJob(ScribbleMixin):
         :param remappings: Import remappings to pass to solcx
         :param enable_scribble: Enable instrumentation with scribble
         :param scribble_path: Optional path to the scribble executable
+        :param compile_cache: An optional cache for the solc output
         """
 
         with open(self.target) as f:
@@ -231,6 +280,8 @@ class SolidityJob(ScribbleMixin):
                     remappings=remappings,
                     enable_scribble=enable_scribble,
                     solc_path=solc_path,
+                    solc_version=solc_version,
+                    compile_cache=compile_cache,
                 )
             except solcx.exceptions.SolcError as e:
                 raise click.exceptions.UsageError(
@@ -287,6 +338,10 @@ class SolidityJob(ScribbleMixin):
         remappings: Tuple[str] = None,
         enable_scribble: bool = False,
         scribble_path: str = "scribble",
+        parallel: bool = False,
+        workers: Optional[int] = None,
+        batch: bool = False,
+        compile_cache: Optional[CompileCache] = None,
     ) -> List[Dict]:
         """Aggregate all Solidity files in the given base path.
 
@@ -294,12 +349,22 @@ class SolidityJob(ScribbleMixin):
         and aggregate all Solidity files it comes across. The resulting job list will
         contain all the Solidity payloads (optionally compiled), ready for submission.
 
+        If parallel mode is enabled, the files are compiled in a pool of worker
+        processes. If batch mode is enabled, all files sharing a solc version are
+        compiled together in a single solc invocation. Batch mode takes precedence
+        over parallel mode and is not available for scribble instrumentation. In
+        all modes, the payload order is the same as in sequential mode.
+
         :param solc_version: The solc version to use for Solidity compilation
         :param solc_path: The path to a custom solc executable
         :param base_path: The base path to walk through from
         :param remappings: Import remappings to pass to solcx
         :param enable_scribble: Enable instrumentation with scribble
         :param scribble_path: Optional path to the scribble executable
+        :param parallel: Compile the files in a pool of worker processes
+        :param workers: The number of worker processes (defaults to the CPU count)
+        :param batch: Compile all files of a solc version in one solc invocation
+        :param compile_cache: An optional cache for the solc output
         :return:
         """
 
@@ -316,15 +381,181 @@ class SolidityJob(ScribbleMixin):
         files = [af for af in files if all((b not in af for b in RGLOB_BLACKLIST))]
 
         LOGGER.debug(f"Found Solidity files to submit: {', '.join(files)}")
+        options = {
+            "version": solc_version,
+            "solc_path": solc_path,
+            "remappings": remappings,
+            "enable_scribble": enable_scribble,
+            "scribble_path": scribble_path,
+            "compile_cache": compile_cache,
+        }
+        if batch and not enable_scribble:
+            return cls.compile_batch(files, options)
+        if parallel and len(files) > 1:
+            return cls.compile_parallel(files, options, workers=workers)
+
         for file in files:
-            job = cls(Path(file))
-            job.generate_payloads(
-                version=solc_version,
-                solc_path=solc_path,
-                remappings=remappings,
-                enable_scribble=enable_scribble,
-                scribble_path=scribble_path,
-            )
             LOGGER.debug(f"Generating Solidity payload for {file}")
-            jobs.extend(job.payloads)
+            jobs.extend(_compile_payloads(file, options))
         return jobs
+
+    @classmethod
+    def compile_parallel(
+        cls, files: List[str], options: Dict[str, Any], workers: Optional[int] = None
+    ) -> List[Dict]:
+        """Generate the payloads of multiple Solidity files in worker processes.
+
+        All required solc versions are resolved and installed up front in the
+        main process, so workers never download the same compiler concurrently.
+        Each worker then passes its file's version explicitly to solc, which keeps
+        the compilation independent of the process-global solcx version.
+
+        The first compilation error cancels all pending files and is raised to
+        the caller.
+
+        :param files: The Solidity files to compile
+        :param options: The keyword arguments to pass to :code:`generate_payloads`
+        :param workers: The number of worker processes (defaults to the CPU count)
+        :return: The generated payloads in file order
+        """
+
+        if options.get("solc_path") is None:
+            installed = set()
+            for file in files:
+                job = cls(Path(file))
+                with open(file) as f:
+                    version = job.solc_version_from_source(
+                        source=f.read(), default_version=options.get("version")
+                    )
+                if version not in installed:
+                    cls.setup_solcx(version)
+                    installed.add(version)
+
+        workers = workers or os.cpu_count() or 1
+        LOGGER.debug(f"Compiling {len(files)} Solidity files with {workers} workers")
+        results: List[Optional[List[Dict]]] = [None] * len(files)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(_compile_payloads, file, options): idx
+                for idx, file in enumerate(files)
+            }
+            try:
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+            except BaseException:
+                LOGGER.debug("Compilation failed - cancelling pending files")
+                for future in futures:
+                    future.cancel()
+                raise
+
+        return [payload for payloads in results for payload in payloads]
+
+    def import_closure(self, solc_result: Dict) -> Set[str]:
+        """Collect the source units the job's target transitively imports.
+
+        The import directives are read from the ASTs in the given compiler
+        output. The returned set includes the target itself.
+
+        :param solc_result: The solc standard-JSON output containing the target
+        :return: The source unit names of the target and all its imports
+        """
+        compiled_sources = solc_result.get("sources", {})
+        closure, pending = set(), [self.target]
+        while pending:
+            name = pending.pop()
+            if name in closure or name not in compiled_sources:
+                continue
+            closure.add(name)
+            ast = compiled_sources[name].get("ast") or {}
+            for node in ast.get("nodes", []):
+                if node.get("nodeType") == "ImportDirective":
+                    pending.append(node.get("absolutePath"))
+        return closure
+
+    def payload_from_batch(self, solc_result: Dict, solc_version: str) -> Dict:
+        """Build the job's payload from a compilation of multiple files.
+
+        Only the target and the files it imports are attached as sources, and
+        the submitted contract is the largest one among them. The source list
+        covers the whole batch, as the source map file IDs refer to it.
+
+        :param solc_result: The solc standard-JSON output of the batch
+        :param solc_version: The solc version used for the batch
+        :return: The payload for the job's target
+        """
+        closure = self.import_closure(solc_result)
+        payload = self.payload_from_sources(
+            solc_result=solc_result,
+            scribble_file=None,
+            solc_version=solc_version,
+            include=closure,
+        )
+        contracts = {
+            file_path: file_element
+            for file_path, file_element in solc_result.get("contracts", {}).items()
+            if file_path in closure
+        }
+        self.set_payload_bytecode_context(payload, {"contracts": contracts})
+        return payload
+
+    @classmethod
+    def compile_batch(cls, files: List[str], options: Dict[str, Any]) -> List[Dict]:
+        """Generate the payloads of multiple Solidity files in batches.
+
+        The files are grouped by their resolved solc version, and each group is
+        compiled with a single standard-JSON invocation. Shared imports are thus
+        only compiled once per group. The payload of every file is then built
+        from its group's compiler output.
+
+        :param files: The Solidity files to compile
+        :param options: The keyword arguments otherwise passed to
+            :code:`generate_payloads`
+        :return: The generated payloads in file order
+        """
+
+        solc_path = options.get("solc_path")
+        groups: Dict[Optional[str], List[str]] = defaultdict(list)
+        for file in files:
+            version = None
+            if solc_path is None:
+                with open(file) as f:
+                    version = cls(Path(file)).solc_version_from_source(
+                        source=f.read(), default_version=options.get("version")
+                    )
+            groups[version].append(file)
+
+        cwd = str(Path.cwd().absolute())
+        compile_cache = options.get("compile_cache")
+        compile_standard = (
+            compile_cache.compile_standard
+            if compile_cache is not None
+            else solcx.compile_standard
+        )
+        payloads: Dict[str, Dict] = {}
+        for version, group in groups.items():
+            if version is not None:
+                cls.setup_solcx(version)
+            LOGGER.debug(f"Compiling batch of {len(group)} files with solc {version}")
+            try:
+                result = compile_standard(
+                    solc_binary=solc_path,
+                    solc_version=version,
+                    input_data={
+                        "language": "Solidity",
+                        "sources": {file: {"urls": [file]} for file in group},
+                        "settings": cls.compiler_settings(
+                            cwd, options.get("remappings") or []
+                        ),
+                    },
+                    allow_paths=cwd,
+                )
+            except solcx.exceptions.SolcError as e:
+                raise click.exceptions.UsageError(
+                    f"Error compiling source with solc {version}: {e}"
+                )
+
+            for file in group:
+                LOGGER.debug(f"Generating Solidity payload for {file}")
+                payloads[file] = cls(Path(file)).payload_from_batch(result, version)
+
+        return [payloads[file] for file in files]
@@ -2,18 +2,35 @@
 
 import json
 import logging
+import os
 import re
 import sys
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from glob import glob
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 import click
 
+from mythx_cli.cache.store import hash_key
+
 from .scribble import ScribbleMixin
+from .util import load_json_keys
 
 LOGGER = logging.getLogger("mythx-cli")
+ARTIFACT_KEYS = {
+    "contractName",
+    "bytecode",
+    "deployedBytecode",
+    "sourceMap",
+    "deployedSourceMap",
+    "source",
+    "sourcePath",
+    "ast",
+    "compiler",
+}
+SOL_INDEX_BLACKLIST = {".git", ".hg", ".svn", ".cache", "__pycache__", ".venv", ".tox"}
 
 
 class TruffleJob(ScribbleMixin):
@@ -29,6 +46,10 @@ class TruffleJob(ScribbleMixin):
         self.target = target
         self.payloads = []
         self.sol_artifact_map = {}
+        self.sol_file_index: Optional[Dict[str, List[str]]] = None
+        self.artifact_index: Optional[Dict[str, str]] = None
+        self.artifacts: Dict[str, Dict[str, Any]] = {}
+        self.sources: Dict[str, Dict[str, Any]] = {}
         self.artifact_files, self.source_list = self.find_truffle_artifacts()
 
         if not self.artifact_files:
@@ -59,30 +80,66 @@ class TruffleJob(ScribbleMixin):
             LOGGER.debug(f"No truffle artifacts found in pattern {output_pattern}")
             return None, None
 
+        self.artifacts = self.load_artifacts(artifact_files)
+
         sources: Set[Tuple[int, str]] = set()
-        for file in artifact_files:
-            with open(file) as af:
-                artifact = json.load(af)
-                try:
-                    ast = artifact.get("ast") or artifact.get("legacyAST")
-                    idx = ast.get("src", "").split(":")[2]
-                    sources.add((int(idx), artifact.get("sourcePath")))
-                except (KeyError, IndexError, AttributeError) as e:
-                    LOGGER.warning(f"Could not reconstruct artifact source list: {e}")
-                    click.echo(
-                        (
-                            "Unable to construct a valid payload from the Truffle build artifacts. "
-                            "Do your payloads contain an 'ast' or 'legacyAST' field? "
-                            "Alternatively, consider explicitly compiling your project using solc: "
-                            "https://mythx-cli.readthedocs.io/en/latest/usage.html#submitting-analyses"
-                        )
+        for artifact in self.artifacts.values():
+            try:
+                ast = artifact.get("ast") or artifact.get("legacyAST")
+                idx = ast.get("src", "").split(":")[2]
+                sources.add((int(idx), artifact.get("sourcePath")))
+            except (KeyError, IndexError, AttributeError) as e:
+                LOGGER.warning(f"Could not reconstruct artifact source list: {e}")
+                click.echo(
+                    (
+                        "Unable to construct a valid payload from the Truffle build artifacts. "
+                        "Do your payloads contain an 'ast' or 'legacyAST' field? "
+                        "Alternatively, consider explicitly compiling your project using solc: "
+                        "https://mythx-cli.readthedocs.io/en/latest/usage.html#submitting-analyses"
                     )
-                    sys.exit(1)
+                )
+                sys.exit(1)
 
         # infer source list from artifact collection
         source_list = [x[1] for x in sorted(list(sources), key=lambda x: x[0])]
         return artifact_files, source_list
 
+    @staticmethod
+    def load_artifact(artifact_file: str) -> Dict[str, Any]:
+        """Load a single Truffle artifact from disk.
+
+        Only the artifact members needed to build payloads are parsed.
+        Large members like the legacy AST, the ABI, or the metadata are
+        skipped, unless the legacy AST is required because the artifact
+        does not contain an AST.
+
+        :param artifact_file: The path to the Truffle artifact
+        :return: The deserialized artifact
+        """
+        artifact = load_json_keys(
+            artifact_file, ARTIFACT_KEYS, fallbacks={"ast": "legacyAST"}
+        )
+        LOGGER.debug(
+            f"Loaded Truffle artifact {artifact_file} with {len(artifact)} keys"
+        )
+        return artifact
+
+    def load_artifacts(self, artifact_files: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Load all Truffle artifacts of the job exactly once.
+
+        The artifact files are read in a thread pool so file I/O of large
+        build directories overlaps. The resulting store maps each artifact
+        path to its parsed content and is used by all later lookups until
+        the payloads have been generated.
+
+        :param artifact_files: The artifact paths to load
+        :return: A mapping of artifact path to deserialized artifact
+        """
+        with ThreadPoolExecutor() as executor:
+            return dict(
+                zip(artifact_files, executor.map(self.load_artifact, artifact_files))
+            )
+
     def generate_payloads(
         self,
         remappings: Tuple[str] = None,
@@ -111,10 +168,7 @@ class TruffleJob(ScribbleMixin):
         :return: The payload dictionary to be sent to MythX
         """
         for file in self.artifact_files:
-            with open(file) as af:
-                artifact = json.load(af)
-                LOGGER.debug(f"Loaded Truffle artifact with {len(artifact)} keys")
-
+            artifact = self.artifacts[file]
             self.payloads.append(
                 {
                     "contract_name": artifact.get("contractName"),
@@ -133,10 +187,7 @@ class TruffleJob(ScribbleMixin):
                     if artifact.get("deployedSourceMap")
                     else None,
                     "sources": {
-                        artifact.get("sourcePath"): {
-                            "source": artifact.get("source"),
-                            "ast": artifact.get("ast"),
-                        },
+                        artifact.get("sourcePath"): self.source_entry(file),
                         **self.get_artifact_context(file),
                     },
                     "source_list": self.source_list,
@@ -145,6 +196,9 @@ class TruffleJob(ScribbleMixin):
                 }
             )
 
+        # the payloads hold everything needed from here on
+        self.artifacts, self.sources = {}, {}
+
         if enable_scribble:
             return self.instrument_truffle_artifacts(
                 payloads=self.payloads,
@@ -167,12 +221,38 @@ class TruffleJob(ScribbleMixin):
         """
         return re.sub(re.compile(r"__\w{38}"), "0" * 40, code)
 
+    @staticmethod
+    def build_sol_file_index() -> Dict[str, List[str]]:
+        """Index all Solidity files below the current directory by file name.
+
+        The directory tree is walked once, skipping version control and
+        tool cache directories. Dependency folders like :code:`node_modules`
+        are kept, as Truffle compiles imported packages into artifacts of
+        their own.
+
+        :return: A mapping of file name to all absolute paths carrying it
+        """
+        index = defaultdict(list)
+        for root, dirs, files in os.walk(Path.cwd()):
+            dirs[:] = sorted(d for d in dirs if d not in SOL_INDEX_BLACKLIST)
+            for name in sorted(files):
+                if name.endswith(".sol"):
+                    index[name].append(os.path.join(root, name))
+        LOGGER.debug(f"Indexed {len(index)} Solidity file names")
+        return index
+
     def artifact_to_sol_file(self, artifact_path: str) -> str:
         """Resolve an artifact file to its corresponding Solidity file.
 
-        This method will take the Truffle artifact's file name, and
-        recursively search through the current directory and all
-        subdirectories, looking for a Solidity file with the same name.
+        This method will take the Truffle artifact's file name, and look
+        up Solidity files with the same name in an index of the current
+        directory and all subdirectories. The index is built on first use
+        and reused for all further lookups of the job.
+
+        If multiple files share the name, the one whose trailing path
+        components match the artifact's :code:`sourcePath` the longest is
+        picked. Remaining ambiguities are reported with a warning listing
+        all candidates.
 
         For additional lookup performance in large Truffle projects with
         a large dependency graph, the mapping from Solidity file to
@@ -189,31 +269,72 @@ class TruffleJob(ScribbleMixin):
         :return: The corresponding Solidity file path
         """
         basename = Path(artifact_path).name.replace(".json", ".sol")
-        sol_file = str(next(Path().rglob(basename)).absolute())
+        if self.sol_file_index is None:
+            self.sol_file_index = self.build_sol_file_index()
+
+        candidates = self.sol_file_index.get(basename)
+        if not candidates:
+            raise click.exceptions.UsageError(
+                f"Could not find Solidity file {basename} for artifact {artifact_path}"
+            )
+        if len(candidates) > 1:
+            source_path = self.artifacts.get(artifact_path, {}).get("sourcePath", "")
+            candidates = self.closest_paths(candidates, source_path)
+        if len(candidates) > 1:
+            LOGGER.warning(
+                f"Ambiguous Solidity file name {basename} for artifact {artifact_path}: "
+                f"{', '.join(candidates)} - using {candidates[0]}"
+            )
+
+        sol_file = candidates[0]
         self.sol_artifact_map[sol_file] = artifact_path
         self.sol_artifact_map[artifact_path] = sol_file
         return sol_file
 
-    def sol_file_to_artifact(
-        self, sol_path: str, artifact_files: Tuple[List[str], List[str]]
-    ) -> Optional[List[str]]:
+    @staticmethod
+    def closest_paths(candidates: List[str], source_path: str) -> List[str]:
+        """Narrow down candidate paths to the ones closest to a source path.
+
+        Closeness is the number of trailing path components a candidate
+        shares with the given source path.
+
+        :param candidates: The file paths to choose from
+        :param source_path: The path as recorded in the Truffle artifact
+        :return: All candidates with the longest common path suffix
+        """
+        source_parts = Path(source_path).parts[::-1]
+
+        def common_suffix(candidate: str) -> int:
+            count = 0
+            for left, right in zip(Path(candidate).parts[::-1], source_parts):
+                if left != right:
+                    break
+                count += 1
+            return count
+
+        scores = [common_suffix(c) for c in candidates]
+        return [c for c, score in zip(candidates, scores) if score == max(scores)]
+
+    def sol_file_to_artifact(self, sol_path: str) -> Optional[str]:
         """Resolve a Solidity file to the corresponding artifact file.
 
         This method will take the path to a Solidity file and return
         its corresponding Truffle artifact JSON file.
         If this relation is already stored in the local artifact mapping,
         the result will be returned right away. Otherwise, the Solidity
-        path's file name is retrieved, and looked up in the list of
-        artifact files and add the relation to the job object's mapping.
+        path's file name is looked up in an index of the job's artifact file
+        names, which is built on first use, and the relation is added to the
+        job object's mapping.
 
         :param sol_path: The path of the Solidity file to retrieve the artifact for
-        :param artifact_files: The list of artifact files in the Truffle build directory
         :return: The resolved Truffle artifact JSON path
         """
         if sol_path in self.sol_artifact_map:
             return self.sol_artifact_map[sol_path]
+        if self.artifact_index is None:
+            self.artifact_index = {Path(x).name: x for x in self.artifact_files}
         basename = Path(sol_path).name.replace(".sol", ".json")
-        artifact_path = next((x for x in artifact_files if basename in x), None)
+        artifact_path = self.artifact_index.get(basename)
         self.sol_artifact_map[sol_path] = artifact_path
         return artifact_path
 
@@ -230,15 +351,11 @@ class TruffleJob(ScribbleMixin):
         """
         dependency_map = defaultdict(set)
         for artifact_file in self.artifact_files:
-            with open(artifact_file) as af:
-                artifact = json.load(af)
-
+            artifact = self.artifacts[artifact_file]
             for node in artifact.get("ast")["nodes"]:
                 if node["nodeType"] != "ImportDirective":
                     continue
-                related_artifact = self.sol_file_to_artifact(
-                    sol_path=node["absolutePath"], artifact_files=self.artifact_files
-                )
+                related_artifact = self.sol_file_to_artifact(node["absolutePath"])
                 if related_artifact is not None:
                     dependency_map[artifact_file].add(related_artifact)
         return dependency_map
@@ -247,20 +364,95 @@ class TruffleJob(ScribbleMixin):
         """Get additional context for a given artifact file.
 
         This method will look up the artifacts related to the current one
-        in the instace's dependency map, load their JSON, and attach source
-        code and AST information to the context object.
+        in the instace's dependency map, fetch them from the job's artifact
+        store, and attach source code and AST information to the context
+        object.
 
-        To do that, the related Solidity file path is resolved.
+        To do that, the related Solidity file path is resolved. The
+        returned entries are shared with all other payloads of the job
+        that include the same file and must not be modified.
 
         :param artifact_file: The artifact file to generate context for
         :return: A dictionary containing source and AST information of all related files
         """
         context = {}
         for related_file in self.dependency_map[artifact_file]:
-            with open(related_file) as af:
-                artifact = json.load(af)
-            context[self.artifact_to_sol_file(artifact_path=related_file)] = {
+            sol_file = self.sol_artifact_map.get(
+                related_file
+            ) or self.artifact_to_sol_file(artifact_path=related_file)
+            context[sol_file] = self.source_entry(related_file)
+        return context
+
+    def source_entry(self, artifact_file: str) -> Dict[str, Any]:
+        """Get the source and AST entry of an artifact for payload sources.
+
+        Each entry is created once per job and then shared between the
+        artifact's own payload and the payloads of all artifacts importing
+        it. This way, memory use grows with the number of files rather than
+        the number of imports.
+
+        :param artifact_file: The artifact file to get the entry for
+        :return: A dictionary containing the artifact's source and AST
+        """
+        if artifact_file not in self.sources:
+            artifact = self.artifacts[artifact_file]
+            self.sources[artifact_file] = {
                 "source": artifact.get("source"),
                 "ast": artifact.get("ast"),
             }
-        return context
+        return self.sources[artifact_file]
+
+    def dependency_closure(self, artifact_file: str) -> Set[str]:
+        """Get all artifacts the given artifact transitively depends on.
+
+        :param artifact_file: The artifact file to resolve dependencies for
+        :return: The paths of all direct and indirect dependencies
+        """
+        closure = set()
+        queue = [artifact_file]
+        while queue:
+            for related_file in self.dependency_map.get(queue.pop(), ()):
+                if related_file not in closure:
+                    closure.add(related_file)
+                    queue.append(related_file)
+        closure.discard(artifact_file)
+        return closure
+
+    def artifact_fingerprints(self) -> Dict[str, str]:
+        """Fingerprint the generated payloads by artifact.
+
+        An artifact's own fingerprint covers its bytecode, source, and AST.
+        The returned fingerprint additionally covers the own fingerprints of
+        all artifacts it transitively depends on, so it changes whenever the
+        artifact or any of its dependencies changed.
+
+        :return: A mapping of artifact path to fingerprint
+        """
+        own = {}
+        for artifact_file, payload in zip(self.artifact_files, self.payloads):
+            main_source = payload["sources"][payload["main_source"]]
+            own[artifact_file] = hash_key(
+                json.dumps(
+                    [
+                        payload["bytecode"],
+                        payload["deployed_bytecode"],
+                        main_source["source"],
+                        main_source["ast"],
+                    ],
+                    sort_keys=True,
+                )
+            )
+
+        return {
+            artifact_file: hash_key(
+                json.dumps(
+                    [fingerprint]
+                    + sorted(
+                        own[dep]
+                        for dep in self.dependency_closure(artifact_file)
+                        if dep in own
+                    )
+                )
+            )
+            for artifact_file, fingerprint in own.items()
+        }
@@ -1,15 +1,28 @@
 """This module contains helpers for generating MythX analysis payloads."""
 
+import json
 import logging
+import random
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from enum import Enum
 from glob import glob
 from os.path import abspath, commonpath
 from pathlib import Path
-from typing import Dict, List, Tuple, Union
+from typing import Any, Collection, Dict, Iterator, List, Optional, Tuple, Union
 
 import click
+from mythx_models.response import (
+    AnalysisInputResponse,
+    AnalysisSubmissionResponse,
+    DetectedIssuesResponse,
+)
+
+from mythx_cli.util import fetch_reports
 
 LOGGER = logging.getLogger("mythx-cli")
+WHITESPACE = re.compile(r"[ \t\n\r]*")
 
 
 class ScenarioMode(Enum):
@@ -158,7 +171,8 @@ def sanitize_paths(job: Dict) -> Dict:
         job["main_source"] = delete_absolute_prefix(job["main_source"], prefix)
         LOGGER.debug(f"Trimmed main source path {job['main_source']}")
     for name in list(job.get("sources", {})):
-        data = job["sources"].pop(name)
+        # source entries may be shared between payloads, so copy before writing
+        data = dict(job["sources"].pop(name))
         # sanitize AST data in compiler output
         for ast_key in ("ast", "legacyAST"):
             LOGGER.debug(f"Sanitizing AST key '{ast_key}'")
@@ -173,7 +187,7 @@ def sanitize_paths(job: Dict) -> Dict:
             LOGGER.debug(
                 f"Setting sanitized {ast_key} -> absolutePath to {sanitized_absolute}"
             )
-            data[ast_key]["absolutePath"] = sanitized_absolute
+            data[ast_key] = {**data[ast_key], "absolutePath": sanitized_absolute}
 
         # replace source key names
         sanitized_source_name = delete_absolute_prefix(name, prefix)
@@ -226,3 +240,170 @@ def is_valid_job(job) -> bool:
         LOGGER.debug(f"Skipping submission for contract: {job.get('contract_name')}")
 
     return valid
+
+
+def submit_jobs(
+    client, jobs: List[Dict[str, Any]], concurrency: int = 1, bar=None
+) -> List[str]:
+    """Submit analysis jobs to the MythX API using a bounded worker pool.
+
+    Each job is submitted through the client's :code:`analyze` method. Up to
+    :code:`concurrency` submissions are in flight at the same time. The returned
+    UUIDs are in the same order as the given jobs, regardless of the order in
+    which the submissions finish. If a progress bar is given, it is advanced
+    once for every finished submission.
+
+    If a submission fails, all submissions that have not been started yet are
+    cancelled and the error is raised to the caller.
+
+    :param client: The pythx client to submit the jobs with
+    :param jobs: The list of payloads to submit
+    :param concurrency: The maximum number of parallel submissions
+    :param bar: An optional click progress bar to update
+    :return: The analysis job UUIDs in job order
+    """
+
+    uuids: List[str] = [None] * len(jobs)
+    LOGGER.debug(f"Submitting {len(jobs)} jobs with {concurrency} worker(s)")
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = {
+            executor.submit(client.analyze, **job): idx for idx, job in enumerate(jobs)
+        }
+        try:
+            for future in as_completed(futures):
+                resp: AnalysisSubmissionResponse = future.result()
+                uuids[futures[future]] = resp.uuid
+                if bar is not None:
+                    bar.update(1)
+        except BaseException:
+            LOGGER.debug("Submission failed - cancelling pending jobs")
+            for future in futures:
+                future.cancel()
+            raise
+
+    return uuids
+
+
+def poll_reports(
+    client,
+    uuids: List[str],
+    interval: float = 3,
+    jitter: float = 1,
+    fetch_input: bool = True,
+    concurrency: int = 1,
+) -> Iterator[Tuple[str, DetectedIssuesResponse, Optional[AnalysisInputResponse]]]:
+    """Wait for a set of analysis jobs and yield their reports as they finish.
+
+    All outstanding UUIDs are tracked together. In each polling round, the
+    status of every pending job is checked first. The reports of the jobs
+    that are ready are then fetched concurrently and yielded, so slow report
+    downloads do not delay the status checks of the remaining jobs. Jobs
+    that are not ready yet are checked again in the next round, which starts
+    after waiting for the given interval plus a random jitter. The total
+    waiting time is therefore bounded by the slowest job rather than the sum
+    of all job runtimes.
+
+    Reports are yielded in the order in which the jobs finish, not in the order
+    of the given UUIDs.
+
+    :param client: The pythx client to poll with
+    :param uuids: The analysis job UUIDs to wait for
+    :param interval: The number of seconds to wait between polling rounds
+    :param jitter: The maximum number of seconds added randomly to each wait
+    :param fetch_input: Whether to also fetch the analysis input of each job
+    :param concurrency: The maximum number of parallel report requests
+    :return: An iterator over UUID, report, and optional input tuples
+    """
+
+    pending = list(uuids)
+    while pending:
+        ready, waiting = [], []
+        for uuid in pending:
+            (ready if client.analysis_ready(uuid) else waiting).append(uuid)
+        LOGGER.debug(f"{len(ready)} analyses ready - fetching their reports")
+        yield from fetch_reports(
+            client=client, uuids=ready, fetch_input=fetch_input, concurrency=concurrency
+        )
+
+        pending = waiting
+        if pending:
+            delay = interval + random.uniform(0, jitter)
+            LOGGER.debug(
+                f"{len(pending)} analyses not ready yet - waiting {delay:.2f}s"
+            )
+            time.sleep(delay)
+
+
+def _discard_object(pairs: List[Tuple[str, Any]]) -> None:
+    return None
+
+
+# objects of skipped values are dropped as soon as their members are parsed
+SKIP_DECODER = json.JSONDecoder(object_pairs_hook=_discard_object)
+
+
+def load_json_keys(
+    path: Union[str, Path],
+    keys: Collection[str],
+    fallbacks: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
+    """Load selected top-level members of a JSON object file.
+
+    The top-level members are scanned one by one, and only the values of
+    the given keys are deserialized. All other values are stepped over
+    with the standard library's JSON scanner, which drops each of their
+    objects as soon as its members are parsed, so their tree is never
+    built. The whole text of the file is read into memory, so the peak
+    memory is the file's size plus the selected data. Scanning stops as
+    soon as all keys have been found.
+
+    A fallback key is only kept if the key it replaces is not in the file,
+    e.g. the legacy AST of artifacts without an AST. The document is still
+    scanned just once.
+
+    :param path: The path to the JSON file
+    :param keys: The top-level keys to load
+    :param fallbacks: Maps keys to the key to load if they are missing
+    :return: A dictionary holding the selected members found in the file
+    """
+
+    with open(path) as f:
+        text = f.read()
+
+    decoder = json.JSONDecoder()
+    idx = WHITESPACE.match(text).end()
+    if not text.startswith("{", idx):
+        raise json.JSONDecodeError("Expecting object", text, idx)
+
+    fallbacks = fallbacks or {}
+    replaced = {fallback: key for key, fallback in fallbacks.items()}
+    result = {}
+    idx += 1
+    while not all(key in result for key in keys):
+        idx = WHITESPACE.match(text, idx).end()
+        if text.startswith("}", idx):
+            break
+        if not text.startswith('"', idx):
+            raise json.JSONDecodeError("Expecting property name", text, idx)
+        key, idx = json.decoder.scanstring(text, idx + 1)
+        idx = WHITESPACE.match(text, idx).end()
+        if not text.startswith(":", idx):
+            raise json.JSONDecodeError("Expecting ':' delimiter", text, idx)
+        idx = WHITESPACE.match(text, idx + 1).end()
+
+        if key in keys:
+            result[key], idx = decoder.raw_decode(text, idx)
+            # drop a fallback loaded before the key it replaces
+            result.pop(fallbacks.get(key), None)
+        elif key in replaced and replaced[key] not in result:
+            result[key], idx = decoder.raw_decode(text, idx)
+        else:
+            idx = SKIP_DECODER.raw_decode(text, idx)[1]
+
+        idx = WHITESPACE.match(text, idx).end()
+        if text.startswith(",", idx):
+            idx += 1
+        elif not text.startswith("}", idx):
+            raise json.JSONDecodeError("Expecting ',' delimiter", text, idx)
+
+    return result
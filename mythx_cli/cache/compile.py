@@ -0,0 +1,153 @@
+"""This module contains a persistent cache for solc compilation output."""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import solcx
+
+from mythx_cli.cache.store import DiskCache, get_cache_dir, hash_key
+
+LOGGER = logging.getLogger("mythx-cli")
+COMPILE_CACHE_SIZE = 512 * 1024 * 1024
+
+
+def hash_file(path: str) -> Optional[str]:
+    """Hash a file's content.
+
+    :param path: The path of the file to hash
+    :return: The hex-encoded SHA-256 digest, or :code:`None` if the file cannot be read
+    """
+
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+class CompileCache:
+    """A content-addressed cache for solc standard-JSON output.
+
+    Entries are looked up by a key covering the compiler input (sources,
+    remappings, output selection, and optimizer settings), the solc version
+    or binary, the allowed paths, and the working directory. Each entry also
+    records the content hashes of all source files that were part of the
+    compilation, including imports. A cached output is only used if none of
+    these files have changed since.
+    """
+
+    def __init__(self, path: Optional[Path] = None, max_size: int = COMPILE_CACHE_SIZE):
+        self.store = DiskCache(path or get_cache_dir("solc"), max_size=max_size)
+
+    @staticmethod
+    def compiler_id(solc_binary: Optional[str], solc_version: Optional[str]) -> str:
+        """Identify the compiler used for a compilation.
+
+        Custom binaries are identified by their path, size, and modification
+        time, solcx-managed compilers by their version.
+
+        :param solc_binary: The path to a custom solc executable
+        :param solc_version: The solcx-managed solc version
+        :return: A string identifying the compiler
+        """
+
+        if solc_binary is not None:
+            stat = os.stat(solc_binary)
+            return f"{os.path.abspath(solc_binary)}:{stat.st_size}:{stat.st_mtime_ns}"
+        if solc_version is None:
+            return f"solcx:{solcx.get_solc_version()}"
+        return f"solcx:{solc_version}"
+
+    def key(
+        self,
+        input_data: Dict,
+        solc_binary: Optional[str],
+        solc_version: Optional[str],
+        allow_paths: Any,
+    ) -> str:
+        return hash_key(
+            json.dumps(
+                {
+                    "input": input_data,
+                    "compiler": self.compiler_id(solc_binary, solc_version),
+                    "allow_paths": str(allow_paths),
+                    "cwd": os.getcwd(),
+                },
+                sort_keys=True,
+            )
+        )
+
+    def lookup(self, key: str) -> Optional[Dict]:
+        """Get a cached compiler output if its sources are unchanged.
+
+        :param key: The compilation's cache key
+        :return: The cached solc output, or :code:`None`
+        """
+
+        data = self.store.get(key)
+        if data is None:
+            return None
+        entry = json.loads(data)
+        for path, digest in entry["files"].items():
+            if hash_file(path) != digest:
+                LOGGER.debug(f"Cached compilation is stale: {path} has changed")
+                return None
+        return entry["output"]
+
+    def save(self, key: str, output: Dict) -> None:
+        """Store a compiler output with the hashes of its source files.
+
+        Outputs whose source files cannot be read from disk are not cached,
+        as they could never be validated.
+
+        :param key: The compilation's cache key
+        :param output: The solc standard-JSON output
+        """
+
+        files = {}
+        for path in output.get("sources", {}):
+            digest = hash_file(path)
+            if digest is None:
+                LOGGER.debug(f"Not caching compilation: cannot read {path}")
+                return
+            files[path] = digest
+        self.store.set(key, json.dumps({"files": files, "output": output}))
+
+    def compile_standard(
+        self,
+        input_data: Dict,
+        solc_binary: Optional[str] = None,
+        solc_version: Optional[str] = None,
+        allow_paths: Any = None,
+        **kwargs,
+    ) -> Dict:
+        """Compile with solc's standard-JSON interface, using the cache.
+
+        This is a drop-in replacement for :code:`solcx.compile_standard`.
+
+        :param input_data: The solc standard-JSON input
+        :param solc_binary: The path to a custom solc executable
+        :param solc_version: The solcx-managed solc version to use
+        :param allow_paths: The paths solc is allowed to import from
+        :return: The solc standard-JSON output
+        """
+
+        key = self.key(input_data, solc_binary, solc_version, allow_paths)
+        output = self.lookup(key)
+        if output is not None:
+            LOGGER.debug("Using cached compilation output")
+            return output
+
+        output = solcx.compile_standard(
+            input_data=input_data,
+            solc_binary=solc_binary,
+            solc_version=solc_version,
+            allow_paths=allow_paths,
+            **kwargs,
+        )
+        self.save(key, output)
+        return output
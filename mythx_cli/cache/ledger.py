@@ -0,0 +1,75 @@
+"""This module contains a ledger of submitted analysis payloads."""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from mythx_cli.cache.store import DiskCache, get_cache_dir, hash_key
+
+LOGGER = logging.getLogger("mythx-cli")
+LEDGER_SIZE = 16 * 1024 * 1024
+
+
+def payload_fingerprint(job: Dict[str, Any], **extra: Any) -> str:
+    """Compute the fingerprint of an analysis payload.
+
+    The fingerprint covers the complete payload, i.e. bytecode, source maps,
+    sources and ASTs, the analysis mode, and the solc version, as well as any
+    additional request options that influence the analysis result.
+
+    :param job: The analysis payload to fingerprint
+    :param extra: Additional request options, e.g. property checking
+    :return: The payload fingerprint
+    """
+
+    return hash_key(json.dumps({"job": job, "extra": extra}, sort_keys=True))
+
+
+def client_account(client) -> str:
+    """Identify the account a MythX API client acts for.
+
+    This is the username for clients logging in with credentials. Access
+    tokens obtained by logging in change on every run, so only the API
+    key of clients authenticating with one is used instead.
+
+    :param client: The MythX API client
+    :return: The account identifier, or an empty string if it is unknown
+    """
+
+    return client.username or client.api_key or ""
+
+
+class SubmissionLedger:
+    """A local record of submitted payloads and their analysis UUIDs.
+
+    Submitting a payload that is identical to a previously submitted one
+    yields the same analysis result. The ledger maps payload fingerprints
+    to the UUID of the first analysis, so identical payloads can reuse it
+    instead of being submitted again. Entries are keyed by the API URL and
+    the account as well, as analyses can only be reused on the deployment
+    and by the account that submitted them.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        max_size: int = LEDGER_SIZE,
+        api_url: str = "",
+        account: str = "",
+    ):
+        self.store = DiskCache(path or get_cache_dir("ledger"), max_size=max_size)
+        self.api_url = api_url
+        self.account = account
+
+    def key(self, fingerprint: str) -> str:
+        return hash_key(f"{self.api_url} {self.account} {fingerprint}")
+
+    def lookup(self, fingerprint: str) -> Optional[str]:
+        return self.store.get(self.key(fingerprint))
+
+    def record(self, fingerprint: str, uuid: str) -> None:
+        self.store.set(self.key(fingerprint), uuid)
+
+    def forget(self, fingerprint: str) -> None:
+        self.store.delete(self.key(fingerprint))
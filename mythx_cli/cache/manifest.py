@@ -0,0 +1,57 @@
+"""This module contains the manifest of a project's last analysis run."""
+
+import json
+import logging
+from pathlib import Path
+from typing import Dict, Optional
+
+from mythx_cli.cache.store import DiskCache, get_cache_dir, hash_key
+
+LOGGER = logging.getLogger("mythx-cli")
+MANIFEST_SIZE = 64 * 1024 * 1024
+
+
+class AnalysisManifest:
+    """The artifact fingerprints and analysis UUIDs of a project's last
+    successful run.
+
+    Incremental analysis compares the current fingerprint of every build
+    artifact with the one recorded here. Artifacts whose fingerprint did
+    not change are not submitted again, and the recorded analysis is
+    reused instead. Manifests are kept per API URL and project path, as the
+    recorded analyses only exist on the deployment they were submitted to.
+    Changes are only persisted once :code:`save` is called.
+    """
+
+    def __init__(
+        self,
+        project: Path,
+        path: Optional[Path] = None,
+        max_size: int = MANIFEST_SIZE,
+        api_url: str = "",
+    ):
+        self.store = DiskCache(path or get_cache_dir("manifests"), max_size=max_size)
+        self.key = hash_key(f"{api_url} {Path(project).absolute()}")
+        self.entries: Dict[str, Dict[str, str]] = json.loads(
+            self.store.get(self.key) or "{}"
+        )
+
+    def lookup(self, name: str, fingerprint: str) -> Optional[str]:
+        """Get the recorded analysis of an unchanged artifact.
+
+        :param name: The artifact's name
+        :param fingerprint: The artifact's current fingerprint
+        :return: The analysis UUID, or :code:`None` if the artifact changed
+        """
+
+        entry = self.entries.get(name)
+        if entry is None or entry["fingerprint"] != fingerprint:
+            return None
+        return entry["uuid"]
+
+    def update(self, name: str, fingerprint: str, uuid: str) -> None:
+        self.entries[name] = {"fingerprint": fingerprint, "uuid": uuid}
+
+    def save(self) -> None:
+        LOGGER.debug(f"Saving manifest with {len(self.entries)} entries")
+        self.store.set(self.key, json.dumps(self.entries))
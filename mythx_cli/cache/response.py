@@ -0,0 +1,123 @@
+"""This module contains a local cache for finished analysis responses."""
+
+import logging
+from pathlib import Path
+from typing import Optional
+
+from mythx_models.response import (
+    AnalysisInputResponse,
+    AnalysisStatus,
+    AnalysisStatusResponse,
+    DetectedIssuesResponse,
+)
+
+from mythx_cli.cache.store import DiskCache, get_cache_dir, hash_key
+
+LOGGER = logging.getLogger("mythx-cli")
+RESPONSE_CACHE_SIZE = 1024 * 1024 * 1024
+
+
+class ResponseCache:
+    """A cache for the status, report, and input responses of analyses.
+
+    Once an analysis has finished, its status, issue report, and input never
+    change, so they can be stored locally and reused by later commands
+    without any network traffic. Entries are keyed by the API URL and the
+    analysis UUID, so responses of different MythX deployments are kept
+    apart.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        max_size: int = RESPONSE_CACHE_SIZE,
+        api_url: str = "",
+    ):
+        self.store = DiskCache(path or get_cache_dir("responses"), max_size=max_size)
+        self.api_url = api_url
+
+    def key(self, uuid: str, kind: str) -> str:
+        return hash_key(f"{self.api_url} {uuid} {kind}")
+
+    def get_status(self, uuid: str) -> Optional[AnalysisStatusResponse]:
+        data = self.store.get(self.key(uuid, "status"))
+        return None if data is None else AnalysisStatusResponse.parse_raw(data)
+
+    def has_status(self, uuid: str) -> bool:
+        return self.store.has(self.key(uuid, "status"))
+
+    def set_status(self, uuid: str, resp: AnalysisStatusResponse) -> None:
+        self.store.set(self.key(uuid, "status"), resp.json(by_alias=True))
+
+    def get_report(self, uuid: str) -> Optional[DetectedIssuesResponse]:
+        data = self.store.get(self.key(uuid, "report"))
+        return None if data is None else DetectedIssuesResponse.parse_raw(data)
+
+    def set_report(self, uuid: str, resp: DetectedIssuesResponse) -> None:
+        self.store.set(self.key(uuid, "report"), resp.json(by_alias=True))
+
+    def get_input(self, uuid: str) -> Optional[AnalysisInputResponse]:
+        data = self.store.get(self.key(uuid, "input"))
+        return None if data is None else AnalysisInputResponse.parse_raw(data)
+
+    def set_input(self, uuid: str, resp: AnalysisInputResponse) -> None:
+        self.store.set(self.key(uuid, "input"), resp.json(by_alias=True))
+
+
+class CachedClient:
+    """A pythx client wrapper serving finished analyses from a local cache.
+
+    The status of a finished analysis is stored in the response cache and
+    marks its report as final, so later status, report, and input requests
+    for it are answered locally. Reports are only stored once the analysis
+    is known to be finished. If that is not known yet when a report is
+    requested, e.g. in :code:`analysis report`, the status is fetched once
+    first. All other attributes are taken from the wrapped client.
+    """
+
+    def __init__(self, client, cache: ResponseCache):
+        self.client = client
+        self.cache = cache
+        self.finished = set()
+
+    def __getattr__(self, name):
+        return getattr(self.client, name)
+
+    def is_finished(self, uuid: str) -> bool:
+        return uuid in self.finished or self.cache.has_status(uuid)
+
+    def analysis_ready(self, uuid: str) -> bool:
+        if self.is_finished(uuid):
+            return True
+        # like pythx, but through the status cache
+        status = self.analysis_status(uuid).status
+        return status in (AnalysisStatus.FINISHED, AnalysisStatus.ERROR)
+
+    def analysis_status(self, uuid: str) -> AnalysisStatusResponse:
+        resp = self.cache.get_status(uuid)
+        if resp is not None:
+            return resp
+        resp = self.client.analysis_status(uuid)
+        if resp.status == AnalysisStatus.FINISHED:
+            self.finished.add(uuid)
+            self.cache.set_status(uuid, resp)
+        return resp
+
+    def report(self, uuid: str) -> DetectedIssuesResponse:
+        resp = self.cache.get_report(uuid)
+        if resp is not None:
+            return resp
+        if not self.is_finished(uuid):
+            # the report of a running analysis may still change
+            self.analysis_status(uuid)
+        resp = self.client.report(uuid)
+        if uuid in self.finished:
+            self.cache.set_report(uuid, resp)
+        return resp
+
+    def request_by_uuid(self, uuid: str) -> AnalysisInputResponse:
+        resp = self.cache.get_input(uuid)
+        if resp is None:
+            resp = self.client.request_by_uuid(uuid)
+            self.cache.set_input(uuid, resp)
+        return resp
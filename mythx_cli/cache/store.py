@@ -0,0 +1,168 @@
+"""This module contains a size-bounded on-disk cache with LRU eviction."""
+
+import hashlib
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+LOGGER = logging.getLogger("mythx-cli")
+
+
+def get_cache_dir(name: str = "") -> Path:
+    """Get the directory the MythX CLI stores its caches in.
+
+    The location can be set explicitly with the :code:`MYTHX_CACHE_DIR`
+    environment variable. Otherwise, the :code:`mythx-cli` directory in
+    :code:`XDG_CACHE_HOME` or :code:`~/.cache` is used.
+
+    :param name: The name of a cache subdirectory
+    :return: The cache directory path
+    """
+
+    base = os.environ.get("MYTHX_CACHE_DIR")
+    if not base:
+        xdg_cache = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        base = Path(xdg_cache) / "mythx-cli"
+    return Path(base) / name
+
+
+def hash_key(data: str) -> str:
+    """Derive a cache key from the given string.
+
+    :param data: The string to hash
+    :return: The hex-encoded SHA-256 digest
+    """
+
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+class DiskCache:
+    """A key-value store persisted in a directory.
+
+    Every entry is stored in its own file. Reading an entry updates the
+    file's modification time, so the least recently used entries can be
+    evicted once the total size of all entries exceeds the configured
+    maximum. The total size is computed once and then kept up to date on
+    every write, so the entries are only scanned again when the cache has
+    grown beyond its maximum size. Entries are written to a temporary file
+    first and then moved into place, so concurrent readers never see
+    partially written data.
+    """
+
+    def __init__(self, path: Path, max_size: int):
+        self.path = Path(path)
+        self.max_size = max_size
+        self.size: Optional[int] = None
+
+    def _entry_path(self, key: str) -> Path:
+        return self.path / key[:2] / key
+
+    def get(self, key: str) -> Optional[str]:
+        """Read an entry from the cache.
+
+        :param key: The entry's key
+        :return: The stored data, or :code:`None` if there is no such entry
+        """
+
+        entry = self._entry_path(key)
+        try:
+            with open(entry, encoding="utf-8") as f:
+                data = f.read()
+            # mark the entry as recently used
+            os.utime(entry, None)
+        except OSError:
+            return None
+        LOGGER.debug(f"Cache hit for {key} in {self.path}")
+        return data
+
+    def has(self, key: str) -> bool:
+        """Check whether an entry exists without reading it.
+
+        :param key: The entry's key
+        :return: Whether the entry is in the cache
+        """
+
+        return self._entry_path(key).is_file()
+
+    def set(self, key: str, data: str) -> None:
+        """Write an entry to the cache and evict old entries if necessary.
+
+        Failing to write to the cache is not an error, as the entry can always be
+        regenerated.
+
+        :param key: The entry's key
+        :param data: The data to store
+        """
+
+        entry = self._entry_path(key)
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=str(entry.parent), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(data)
+            replaced = self._entry_size(entry)
+            os.replace(tmp_path, str(entry))
+            written = entry.stat().st_size
+        except OSError as e:
+            LOGGER.debug(f"Could not write cache entry {key}: {e}")
+            return
+
+        if self.size is None:
+            self.size = sum(size for _, size, _ in self._scan())
+        else:
+            self.size += written - replaced
+        if self.size > self.max_size:
+            self.evict()
+
+    def delete(self, key: str) -> None:
+        """Remove an entry from the cache if it exists.
+
+        :param key: The entry's key
+        """
+
+        entry = self._entry_path(key)
+        size = self._entry_size(entry)
+        try:
+            entry.unlink()
+        except OSError:
+            return
+        if self.size is not None:
+            self.size -= size
+
+    @staticmethod
+    def _entry_size(entry: Path) -> int:
+        try:
+            return entry.stat().st_size
+        except OSError:
+            return 0
+
+    def _scan(self) -> List[Tuple[float, int, Path]]:
+        entries = []
+        for entry in self.path.glob("*/*"):
+            if entry.suffix == ".tmp":
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+        return entries
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until the cache fits its
+        maximum size."""
+
+        entries = self._scan()
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries, key=lambda x: x[0]):
+            if total <= self.max_size:
+                break
+            LOGGER.debug(f"Evicting cache entry {entry.name}")
+            try:
+                entry.unlink()
+            except OSError:
+                continue
+            total -= size
+        self.size = total
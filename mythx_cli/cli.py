@@ -1,32 +1,22 @@
 """The main runtime of the MythX CLI."""
 import logging
 import sys
+from functools import partial
 from pathlib import Path
+from typing import Optional
 
 import click
-import yaml
-from pythx import Client, MythXAPIError
-from pythx.middleware.toolname import ClientToolNameMiddleware
 
 from mythx_cli import __version__
-from mythx_cli.analysis.list import analysis_list
-from mythx_cli.analysis.report import analysis_report
-from mythx_cli.analysis.status import analysis_status
-from mythx_cli.analyze.command import analyze
 from mythx_cli.formatter import FORMAT_RESOLVER
-from mythx_cli.group.close import group_close
-from mythx_cli.group.list import group_list
-from mythx_cli.group.open import group_open
-from mythx_cli.group.status import group_status
-from mythx_cli.render.command import render
-from mythx_cli.util import update_context
-from mythx_cli.version.command import version
+from mythx_cli.lazy import LazyClient, LazyGroup
+from mythx_cli.util import OutputSink, update_context
 
 LOGGER = logging.getLogger("mythx-cli")
 logging.basicConfig(level=logging.WARNING)
 
 
-class APIErrorCatcherGroup(click.Group):
+class APIErrorCatcherGroup(LazyGroup):
     """A custom click group to catch API-related errors.
 
     This custom Group implementation catches :code:`MythXAPIError`
@@ -35,20 +25,53 @@ class APIErrorCatcherGroup(click.Group):
     happened instead of triggering an uncaught exception traceback.
 
     It is given to the main CLI entrypoint and propagated to all
-    subcommands.
+    subcommands. Subcommands are loaded lazily, so pythx is only imported
+    by the commands talking to the API. If a subcommand fails, its output
+    is discarded instead of replacing the output file.
     """
 
+    def invoke(self, ctx: click.Context):
+        try:
+            return super().invoke(ctx)
+        except (SystemExit, click.exceptions.Exit):
+            # commands exit with their return value once they are done
+            raise
+        except BaseException:
+            sink = ctx.obj.get("output_sink") if ctx.obj else None
+            if sink is not None:
+                sink.discard()
+            raise
+
     def __call__(self, *args, **kwargs):
         try:
             return self.main(*args, **kwargs)
-        except MythXAPIError as exc:
+        except Exception as exc:
+            pythx = sys.modules.get("pythx")
+            if pythx is None or not isinstance(exc, pythx.MythXAPIError):
+                raise
             LOGGER.debug("Caught API error")
             click.echo("The API returned an error:\n{}".format(exc))
             sys.exit(1)
 
 
 # noinspection PyIncorrectDocstring
-@click.group(cls=APIErrorCatcherGroup)
+@click.group(
+    cls=APIErrorCatcherGroup,
+    lazy_commands={
+        "analyze": (
+            "mythx_cli.analyze.command:analyze",
+            "Analyze the given directory or arguments with MythX.",
+        ),
+        "render": (
+            "mythx_cli.render.command:render",
+            "Render an analysis job or group report as HTML.",
+        ),
+        "version": (
+            "mythx_cli.version.command:version",
+            "Display API version information.",
+        ),
+    },
+)
 @click.option(
     "--debug",
     is_flag=True,
@@ -101,6 +124,11 @@ class APIErrorCatcherGroup(click.Group):
     default="line",
     help="The column to sort the default table output by",
 )
+@click.option(
+    "--report-cache/--no-report-cache",
+    default=None,
+    help="Reuse locally cached reports and inputs of finished analyses",
+)
 @click.pass_context
 def cli(
     ctx,
@@ -115,6 +143,7 @@ def cli(
     config: str,
     stdout: bool,
     table_sort_key: str,
+    report_cache: bool,
 ) -> None:
     """Your CLI for interacting with https://mythx.io/
 
@@ -131,10 +160,12 @@ def cli(
     :param config: YAML config file to read default parameters from
     :param stdout: Force printing to stdout and ignore output files
     :param table_sort_key: The column to sort the default table output by
+    :param report_cache: Reuse cached reports and inputs of finished analyses
     """
 
-    # set loggers to debug mode
+    # set loggers to debug mode, including those of lazily imported modules
     if debug:
+        logging.root.setLevel(logging.DEBUG)
         for name in logging.root.manager.loggerDict:
             logging.getLogger(name).setLevel(logging.DEBUG)
 
@@ -155,6 +186,8 @@ def cli(
     config_file = config or ".mythx.yml"
     if Path(config_file).is_file():
         LOGGER.debug(f"Parsing config at {config_file}")
+        import yaml
+
         with open(config_file) as config_f:
             parsed_config = yaml.safe_load(config_f.read())
     else:
@@ -171,25 +204,20 @@ def cli(
         ctx.obj["output"] = None
     else:
         update_context(ctx.obj, "output", parsed_config, "output", None)
+    if ctx.obj["output"]:
+        # open the output file once and replace it when the command finishes
+        ctx.obj["output_sink"] = ctx.with_resource(OutputSink(ctx.obj["output"]))
     update_context(ctx.obj, "fmt", parsed_config, "format", "table")
     update_context(ctx.obj, "yes", parsed_config, "confirm", False)
     update_context(ctx.obj, "table_sort_key", parsed_config, "table-sort-key", "line")
+    if report_cache is None:
+        report_cache = parsed_config.get("report-cache", True)
+    ctx.obj["report_cache"] = report_cache
 
     # set return value - used for CI failures
     ctx.obj["retval"] = 0
 
-    LOGGER.debug(f"Initializing tool name middleware with {__version__}")
-    toolname_mw = ClientToolNameMiddleware(name="mythx-cli-{}".format(__version__))
-
-    if api_key is not None:
-        LOGGER.debug("Initializing client with API key")
-        ctx.obj["client"] = Client(api_key=api_key, middlewares=[toolname_mw])
-    elif username and password:
-        LOGGER.debug("Initializing client with username and password")
-        ctx.obj["client"] = Client(
-            username=username, password=password, middlewares=[toolname_mw]
-        )
-    else:
+    if api_key is None and not (username and password):
         raise click.UsageError(
             (
                 "The trial user has been deprecated. You can still use the MythX CLI for free "
@@ -198,14 +226,63 @@ def cli(
             )
         )
 
+    # pythx is only imported once a command talks to the API
+    ctx.obj["client"] = LazyClient(
+        partial(create_client, api_key, username, password, report_cache)
+    )
+
+
+def create_client(
+    api_key: Optional[str],
+    username: Optional[str],
+    password: Optional[str],
+    report_cache: bool,
+):
+    """Create the MythX API client for the given credentials.
 
-LOGGER.debug("Registering main commands")
-cli.add_command(analyze)
-cli.add_command(render)
-cli.add_command(version)
+    :param api_key: User JWT api token from the MythX dashboard
+    :param username: The MythX account ETH address/username
+    :param password: The account password from the MythX dashboard
+    :param report_cache: Reuse cached reports and inputs of finished analyses
+    :return: The API client
+    """
 
+    from pythx import Client
+    from pythx.middleware.toolname import ClientToolNameMiddleware
 
-@cli.group()
+    LOGGER.debug(f"Initializing tool name middleware with {__version__}")
+    toolname_mw = ClientToolNameMiddleware(name="mythx-cli-{}".format(__version__))
+
+    if api_key is not None:
+        LOGGER.debug("Initializing client with API key")
+        client = Client(api_key=api_key, middlewares=[toolname_mw])
+    else:
+        LOGGER.debug("Initializing client with username and password")
+        client = Client(username=username, password=password, middlewares=[toolname_mw])
+
+    if report_cache:
+        from mythx_cli.cache.response import CachedClient, ResponseCache
+
+        LOGGER.debug("Enabling local report cache")
+        client = CachedClient(client, ResponseCache(api_url=client.handler.api_url))
+    return client
+
+
+@cli.group(
+    cls=LazyGroup,
+    lazy_commands={
+        "close": ("mythx_cli.group.close:group_close", "Close/seal an existing group."),
+        "list": ("mythx_cli.group.list:group_list", "Get a list of analysis groups."),
+        "open": (
+            "mythx_cli.group.open:group_open",
+            "Create a new group to assign future analyses to.",
+        ),
+        "status": (
+            "mythx_cli.group.status:group_status",
+            "Get the status of an analysis group.",
+        ),
+    },
+)
 def group() -> None:
     """Create, modify, and view analysis groups.
 
@@ -218,14 +295,23 @@ def group() -> None:
     pass
 
 
-LOGGER.debug("Registering group commands")
-group.add_command(group_list)
-group.add_command(group_status)
-group.add_command(group_open)
-group.add_command(group_close)
-
-
-@cli.group()
+@cli.group(
+    cls=LazyGroup,
+    lazy_commands={
+        "list": (
+            "mythx_cli.analysis.list:analysis_list",
+            "Get a list of submitted analyses.",
+        ),
+        "report": (
+            "mythx_cli.analysis.report:analysis_report",
+            "Fetch the report for a single or multiple job UUIDs.",
+        ),
+        "status": (
+            "mythx_cli.analysis.status:analysis_status",
+            "Get the status of an already submitted analysis.",
+        ),
+    },
+)
 def analysis() -> None:
     """Get information on running and finished analyses.
 
@@ -238,11 +324,5 @@ def analysis() -> None:
     pass
 
 
-LOGGER.debug("Registering analysis commands")
-analysis.add_command(analysis_status)
-analysis.add_command(analysis_list)
-analysis.add_command(analysis_report)
-
-
 if __name__ == "__main__":
     sys.exit(cli())  # pragma: no cover
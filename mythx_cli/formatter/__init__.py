@@ -1,14 +1,56 @@
-"""This module contains various formatters for printing report data."""
+"""This module contains various formatters for printing report data.
 
-from .json import JSONFormatter, PrettyJSONFormatter
-from .simple_stdout import SimpleFormatter
-from .tabular import TabularFormatter
+The formatter modules depend on the MythX models and table libraries, so
+they are only imported once a formatter is actually used.
+"""
 
-FORMAT_RESOLVER = {
-    "simple": SimpleFormatter(),
-    "json": JSONFormatter(),
-    "json-pretty": PrettyJSONFormatter(),
-    "table": TabularFormatter(),
+from collections.abc import Mapping
+
+from mythx_cli.lazy import load_object
+
+FORMATTERS = {
+    "simple": "mythx_cli.formatter.simple_stdout:SimpleFormatter",
+    "json": "mythx_cli.formatter.json:JSONFormatter",
+    "json-pretty": "mythx_cli.formatter.json:PrettyJSONFormatter",
+    "ndjson": "mythx_cli.formatter.json:NDJSONFormatter",
+    "table": "mythx_cli.formatter.tabular:TabularFormatter",
+    "table-stream": "mythx_cli.formatter.tabular:StreamingTabularFormatter",
 }
 
-__all__ = [JSONFormatter, PrettyJSONFormatter, SimpleFormatter, TabularFormatter]
+
+class FormatResolver(Mapping):
+    """A mapping of format names to formatter instances.
+
+    Formatters are instantiated from their import path on first access,
+    while the available format names are known without importing any
+    formatter module.
+    """
+
+    def __init__(self, formatters):
+        self.formatters = formatters
+        self.instances = {}
+
+    def __getitem__(self, name: str):
+        if name not in self.instances:
+            self.instances[name] = load_object(self.formatters[name])()
+        return self.instances[name]
+
+    def __iter__(self):
+        return iter(self.formatters)
+
+    def __len__(self) -> int:
+        return len(self.formatters)
+
+
+FORMAT_RESOLVER = FormatResolver(FORMATTERS)
+FORMATTER_CLASSES = {path.split(":")[1]: path for path in FORMATTERS.values()}
+
+__all__ = list(FORMATTER_CLASSES)
+
+
+def __getattr__(name: str):
+    """Import the formatter classes on first access."""
+
+    if name in FORMATTER_CLASSES:
+        return load_object(FORMATTER_CLASSES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,7 +1,7 @@
 """This module contains the base formatter interface."""
 
 import abc
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 
 from mythx_models.response import (
     AnalysisInputResponse,
@@ -16,6 +16,7 @@ class BaseFormatter(abc.ABC):
     """The base formatter interface for printing various response types."""
 
     report_requires_input = False
+    report_incremental = False
 
     @staticmethod
     @abc.abstractmethod
@@ -42,6 +43,42 @@ class BaseFormatter(abc.ABC):
 
         pass  # pragma: no cover
 
+    @classmethod
+    def iter_detected_issues(
+        cls,
+        issues_list: List[
+            Tuple[str, DetectedIssuesResponse, Optional[AnalysisInputResponse]]
+        ],
+        **kwargs,
+    ) -> Iterator[str]:
+        """Format an issue report response in consecutive fragments.
+
+        Each fragment is written to the output as soon as it has been
+        generated. Fragments are written as they are, so line breaks must
+        be part of them. Streaming formatters override this method to avoid
+        building the complete output in memory. By default, the whole
+        report is a single fragment.
+        """
+
+        yield cls.format_detected_issues(issues_list, **kwargs) + "\n"
+
+    @classmethod
+    def format_detected_issues_entry(
+        cls,
+        uuid: str,
+        resp: DetectedIssuesResponse,
+        inp: Optional[AnalysisInputResponse],
+    ) -> str:
+        """Format the issue report of a single analysis.
+
+        Formatters setting :code:`report_incremental` write the report of
+        each analysis as soon as it is available instead of collecting all
+        reports first. By default, the entry is formatted like a report
+        list holding a single analysis.
+        """
+
+        return cls.format_detected_issues([(uuid, resp, inp)])
+
     @staticmethod
     @abc.abstractmethod
     def format_version(obj: VersionResponse) -> str:
@@ -1,7 +1,8 @@
 """This module contains the compressed and pretty-printing JSON formatters."""
 
 import json
-from typing import List, Optional, Tuple
+from itertools import chain
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from mythx_models.response import (
     AnalysisInputResponse,
@@ -16,6 +17,50 @@ from mythx_models.response import (
 from mythx_cli.formatter.base import BaseFormatter
 
 
+def iter_json_array(
+    items: Iterable[Any], indent: Optional[int] = None, sort_keys: bool = False
+) -> Iterator[str]:
+    """Encode an iterable as a JSON array, one element at a time.
+
+    Joining the generated fragments results in the same string as calling
+    :code:`json.dumps` on a list of the items with the same arguments, but
+    only a single encoded element is held in memory at a time.
+
+    :param items: The JSON-serializable array elements
+    :param indent: The indentation to pretty-print with
+    :param sort_keys: Whether to sort the keys of JSON objects
+    :return: The encoded array fragments
+    """
+
+    if indent is None:
+        pad, start, sep, end = None, "[", ", ", "]"
+    else:
+        pad = "\n" + " " * indent
+        start, sep, end = "[" + pad, "," + pad, "\n]"
+
+    prefix = start
+    for item in items:
+        encoded = json.dumps(item, indent=indent, sort_keys=sort_keys)
+        if pad is not None:
+            encoded = encoded.replace("\n", pad)
+        yield prefix + encoded
+        prefix = sep
+    yield "[]" if prefix is start else end
+
+
+def iter_report_dicts(
+    issues_list: Iterable[
+        Tuple[str, DetectedIssuesResponse, Optional[AnalysisInputResponse]]
+    ],
+) -> Iterator[Dict[str, Any]]:
+    """Convert issue reports to dicts, adding each analysis UUID."""
+
+    for uuid, resp, _ in issues_list:
+        d = resp.dict()
+        d["uuid"] = uuid
+        yield d
+
+
 class JSONFormatter(BaseFormatter):
     """The JSON formatter.
 
@@ -57,12 +102,20 @@ class JSONFormatter(BaseFormatter):
         **kwargs,
     ) -> str:
         """Format an issue report response as compressed JSON."""
-        output = []
-        for uuid, resp, _ in issues_list:
-            d = resp.dict()
-            d["uuid"] = uuid
-            output.append(d)
-        return json.dumps(output)
+
+        return "".join(iter_json_array(iter_report_dicts(issues_list)))
+
+    @staticmethod
+    def iter_detected_issues(
+        issues_list: List[
+            Tuple[str, DetectedIssuesResponse, Optional[AnalysisInputResponse]]
+        ],
+        **kwargs,
+    ) -> Iterator[str]:
+        """Format an issue report response as compressed JSON, one analysis
+        at a time."""
+
+        return chain(iter_json_array(iter_report_dicts(issues_list)), ("\n",))
 
     @staticmethod
     def format_version(resp: VersionResponse) -> str:
@@ -85,15 +138,11 @@ class PrettyJSONFormatter(BaseFormatter):
     def _print_as_json(obj, report_mode=False) -> str:
         """Pretty-print the given object's JSON representation."""
 
-        json_args = {"indent": 2, "sort_keys": True}
         if report_mode:
-            output = []
-            for uuid, resp, _ in obj:
-                d = resp.dict()
-                d["uuid"] = uuid
-                output.append(d)
-            return json.dumps(output, **json_args)
-        return json.dumps(obj.dict(), **json_args)
+            return "".join(
+                iter_json_array(iter_report_dicts(obj), indent=2, sort_keys=True)
+            )
+        return json.dumps(obj.dict(), indent=2, sort_keys=True)
 
     @staticmethod
     def format_group_status(resp: GroupStatusResponse) -> str:
@@ -130,8 +179,73 @@ class PrettyJSONFormatter(BaseFormatter):
 
         return PrettyJSONFormatter._print_as_json(issues_list, report_mode=True)
 
+    @staticmethod
+    def iter_detected_issues(
+        issues_list: List[
+            Tuple[str, DetectedIssuesResponse, Optional[AnalysisInputResponse]]
+        ],
+        **kwargs,
+    ) -> Iterator[str]:
+        """Format an issue report response as pretty-printed JSON, one
+        analysis at a time."""
+
+        return chain(
+            iter_json_array(iter_report_dicts(issues_list), indent=2, sort_keys=True),
+            ("\n",),
+        )
+
     @staticmethod
     def format_version(obj: VersionResponse) -> str:
         """Format a version response as pretty-printed JSON."""
 
         return PrettyJSONFormatter._print_as_json(obj)
+
+
+class NDJSONFormatter(JSONFormatter):
+    """The newline-delimited JSON formatter.
+
+    It works like the JSON formatter, with the difference that issue
+    reports are written as one compressed JSON object per line. Each
+    analysis report is emitted as soon as it is available, so consumers
+    can start processing before all analyses have finished.
+    """
+
+    report_requires_input = False
+    report_incremental = True
+
+    @staticmethod
+    def format_detected_issues_entry(
+        uuid: str, resp: DetectedIssuesResponse, inp: Optional[AnalysisInputResponse]
+    ) -> str:
+        """Format a single analysis report as a line of compressed JSON."""
+
+        d = resp.dict()
+        d["uuid"] = uuid
+        return json.dumps(d)
+
+    @staticmethod
+    def format_detected_issues(
+        issues_list: List[
+            Tuple[str, DetectedIssuesResponse, Optional[AnalysisInputResponse]]
+        ],
+        **kwargs,
+    ) -> str:
+        """Format an issue report response as newline-delimited JSON."""
+
+        return "\n".join(
+            NDJSONFormatter.format_detected_issues_entry(uuid, resp, inp)
+            for uuid, resp, inp in issues_list
+        )
+
+    @staticmethod
+    def iter_detected_issues(
+        issues_list: List[
+            Tuple[str, DetectedIssuesResponse, Optional[AnalysisInputResponse]]
+        ],
+        **kwargs,
+    ) -> Iterator[str]:
+        """Format an issue report response as newline-delimited JSON, one
+        analysis at a time."""
+
+        for uuid, resp, inp in issues_list:
+            yield NDJSONFormatter.format_detected_issues_entry(uuid, resp, inp) + "\n"
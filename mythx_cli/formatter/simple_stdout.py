@@ -96,9 +96,7 @@ class SimpleFormatter(BaseFormatter):
 
         for filename, data in file_to_issues.items():
             result.append(f"Report for {filename}")
-            # sort by line number
-            data = sorted([o for o in data if o["issues"]], key=lambda x: x["line"])
-            for line in data:
+            for line in data.issue_lines():
                 for issue in line["issues"]:
                     result.append(f"Title: {issue['swcTitle']} ({issue['severity']})")
                     result.append(f"Description: {issue['description']['head']}")
@@ -2,8 +2,9 @@
 response data."""
 
 from itertools import zip_longest
+from operator import itemgetter
 from os.path import basename
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 
 from mythx_models.response import (
     AnalysisInputResponse,
@@ -17,7 +18,7 @@ from mythx_models.response import (
 from tabulate import tabulate
 
 from mythx_cli.formatter.base import BaseFormatter
-from mythx_cli.formatter.util import generate_dashboard_link
+from mythx_cli.formatter.util import generate_dashboard_link, truncate
 from mythx_cli.util import index_by_filename
 
 
@@ -139,7 +140,7 @@ class TabularFormatter(BaseFormatter):
         table_sort_key = kwargs.pop("table_sort_key", "line")
 
         for filename, data in file_to_issues.items():
-            data = [o for o in data if o["issues"]]
+            data = list(data.issue_lines())
             if not data:
                 continue
             result.append(f"Report for {filename}")
@@ -182,3 +183,104 @@ class TabularFormatter(BaseFormatter):
 
         data = ((k.title(), v) for k, v in resp.dict().items())
         return tabulate(data, tablefmt="fancy_grid")
+
+
+class StreamingTabularFormatter(TabularFormatter):
+    """The streaming tabular formatter.
+
+    This formatter displays the same issue tables as the tabular
+    formatter, but uses fixed column widths instead of measuring the
+    whole table first. Each row is written as soon as it is formatted, so
+    large reports are printed without building the complete output in
+    memory. Titles and descriptions exceeding their column are truncated.
+    """
+
+    headers = ("Line", "SWC Title", "Severity", "Short Description")
+    column_widths = (6, 40, 8, 60)
+
+    @classmethod
+    def rule(cls, left: str, fill: str, sep: str, right: str) -> str:
+        """Format a horizontal table border."""
+
+        return left + sep.join(fill * (w + 2) for w in cls.column_widths) + right
+
+    @classmethod
+    def row(cls, cells: Tuple) -> str:
+        """Format a table row, right-aligning the line number column."""
+
+        line, *texts = (
+            truncate(cell, width) for cell, width in zip(cells, cls.column_widths)
+        )
+        cells = [line.rjust(cls.column_widths[0])] + [
+            text.ljust(width) for text, width in zip(texts, cls.column_widths[1:])
+        ]
+        return "│ " + " │ ".join(cells) + " │"
+
+    @classmethod
+    def format_detected_issues(
+        cls,
+        issues_list: List[
+            Tuple[DetectedIssuesResponse, Optional[AnalysisInputResponse]]
+        ],
+        **kwargs,
+    ) -> str:
+        """Format an issue report to a tabular representation."""
+
+        return "\n".join(cls.iter_lines(issues_list, **kwargs))
+
+    @classmethod
+    def iter_detected_issues(
+        cls,
+        issues_list: List[
+            Tuple[DetectedIssuesResponse, Optional[AnalysisInputResponse]]
+        ],
+        **kwargs,
+    ) -> Iterator[str]:
+        """Format an issue report to a tabular representation, one line at
+        a time."""
+
+        for line in cls.iter_lines(issues_list, **kwargs):
+            yield line + "\n"
+
+    @classmethod
+    def iter_lines(
+        cls,
+        issues_list: List[
+            Tuple[DetectedIssuesResponse, Optional[AnalysisInputResponse]]
+        ],
+        **kwargs,
+    ) -> Iterator[str]:
+        """Generate the lines of the issue tables, one row at a time."""
+
+        table_sort_key = kwargs.pop("table_sort_key", "line")
+        sort_idx = {"line": 0, "title": 1, "severity": 2, "description": 3}[
+            table_sort_key
+        ]
+
+        for filename, data in index_by_filename(issues_list).items():
+            links, lines = set(), set()
+            for line in data.issue_lines():
+                for issue in line["issues"]:
+                    links.add(generate_dashboard_link(issue["uuid"]))
+                    lines.add(
+                        (
+                            line["line"],
+                            f"({issue['swcID']}) {issue['swcTitle']}",
+                            issue["severity"],
+                            issue["description"]["head"],
+                        )
+                    )
+            if not lines:
+                continue
+
+            yield f"Report for {filename}"
+            yield from links
+            yield cls.rule("╒", "═", "╤", "╕")
+            yield cls.row(cls.headers)
+            yield cls.rule("╞", "═", "╪", "╡")
+            for idx, row in enumerate(sorted(lines, key=itemgetter(sort_idx))):
+                if idx:
+                    yield cls.rule("├", "─", "┼", "┤")
+                yield cls.row(row)
+            yield cls.rule("╘", "═", "╧", "╛")
+            yield ""  # new line after table
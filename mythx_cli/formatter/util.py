@@ -1,10 +1,14 @@
 """Utility functions for handling API requests and responses."""
 
-from typing import List, Union
+from array import array
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
+from typing import List, NamedTuple, Optional, Union
 
 import click
 from mythx_models.response import DetectedIssuesResponse
-from mythx_models.response.issue import SEVERITY
+from mythx_models.response.issue import SEVERITY, Issue
 
 SEVERITY_ORDER = (
     SEVERITY.UNKNOWN,
@@ -13,18 +17,90 @@ SEVERITY_ORDER = (
     SEVERITY.MEDIUM,
     SEVERITY.HIGH,
 )
+SOURCE_MAP_CACHE_SIZE = 128
 
 
-def get_source_location_by_offset(source: str, offset: int) -> int:
+class DecodedSourceMap(NamedTuple):
+    """A decompressed source map in columnar form.
+
+    Entry :code:`i` of the source map is described by the :code:`i`-th
+    element of each array.
+    """
+
+    offsets: array
+    lengths: array
+    file_ids: array
+
+
+def get_line_offsets(source: str) -> List[int]:
+    """Compute the byte offsets at which the lines of a Solidity source
+    start.
+
+    The resulting table holds the UTF-8 byte offset of every line start
+    except the first one, followed by the encoded source length plus one.
+    It can be passed to :code:`get_source_location_by_offset` to resolve
+    many offsets of the same source without re-scanning it.
+
+    :param source: The Solidity source to analyze
+    :return: The line offset table
+    """
+
+    return list(
+        accumulate(len(line) + 1 for line in source.encode("utf-8").split(b"\n"))
+    )
+
+
+def get_source_location_by_offset(
+    source: str, offset: int, line_offsets: Optional[List[int]] = None
+) -> int:
     """Retrieve the Solidity source code location based on the source map
     offset.
 
     :param source: The Solidity source to analyze
     :param offset: The source map's offset
+    :param line_offsets: The source's precomputed line offset table
     :return: The offset's source line number equivalent
     """
 
-    return source.encode("utf-8")[0:offset].count("\n".encode("utf-8")) + 1
+    if line_offsets is None:
+        line_offsets = get_line_offsets(source)
+    if offset < 0:
+        # mirror slicing semantics for negative offsets
+        offset = max(line_offsets[-1] - 1 + offset, 0)
+    return bisect_right(line_offsets, offset, hi=len(line_offsets) - 1) + 1
+
+
+@lru_cache(maxsize=SOURCE_MAP_CACHE_SIZE)
+def decode_source_map(source_map: str) -> DecodedSourceMap:
+    """Decompress a Solidity source map into offset, length, and file ID
+    arrays.
+
+    Empty fields inherit the value of the previous entry, like in
+    :code:`SourceMap.decompress`, but the values are stored in compact
+    integer arrays instead of one model object per entry. Results are
+    memoized by source map, as the issues of a report often share the
+    same map. The returned arrays are shared between callers and must not
+    be modified.
+
+    :param source_map: The compressed source map
+    :return: The decoded source map
+    """
+
+    offsets, lengths, file_ids = array("q"), array("q"), array("q")
+    offset, length, file_id = -1, -1, -2
+    for component in source_map.split(";"):
+        if component:
+            parts = component.split(":", 3)
+            if parts[0]:
+                offset = int(parts[0])
+            if len(parts) > 1 and parts[1]:
+                length = int(parts[1])
+            if len(parts) > 2 and parts[2]:
+                file_id = int(parts[2])
+        offsets.append(offset)
+        lengths.append(length)
+        file_ids.append(file_id)
+    return DecodedSourceMap(offsets, lengths, file_ids)
 
 
 def generate_dashboard_link(uuid: str) -> str:
@@ -39,6 +115,24 @@ def generate_dashboard_link(uuid: str) -> str:
     return "https://dashboard.mythx.io/#/console/analyses/{}".format(uuid)
 
 
+def truncate(text: str, width: int) -> str:
+    """Fit a text into a table cell of the given width.
+
+    Whitespace sequences, including line breaks, are collapsed into a
+    single space. Texts exceeding the width are cut off and end with an
+    ellipsis.
+
+    :param text: The text to fit into the cell
+    :param width: The maximum number of characters
+    :return: The truncated text
+    """
+
+    text = " ".join(str(text).split())
+    if len(text) <= width:
+        return text
+    return text[: width - 1] + "…"
+
+
 def normalize_swc_list(swc_list: Union[str, List[str], None]) -> List[str]:
     """Normalize a list of SWC IDs.
 
@@ -78,6 +172,67 @@ def set_ci_failure() -> None:
         pass
 
 
+class IssueFilter:
+    """A reusable filter for the issues of analysis reports.
+
+    The minimum severity and the SWC black- and whitelist are normalized
+    once when the filter is created. Afterwards, checking an issue only
+    takes a few set lookups, so the same filter can be applied to any
+    number of reports.
+
+    The SWC blacklist can be a list of strings in the format "SWC-000"
+    or a comma-separated string. "SWC" is case-insensitive and
+    normalized. The SWC whitelist works in a similar way, just including
+    selected SWCs into the resulting response object.
+    """
+
+    def __init__(
+        self,
+        min_severity: Union[str, SEVERITY] = None,
+        swc_blacklist: Union[str, List[str]] = None,
+        swc_whitelist: Union[str, List[str]] = None,
+    ):
+        min_severity = (
+            SEVERITY(min_severity.title()) if min_severity else SEVERITY.UNKNOWN
+        )
+        self.severities = frozenset(
+            SEVERITY_ORDER[SEVERITY_ORDER.index(min_severity) :]
+        )
+        self.swc_blacklist = frozenset(normalize_swc_list(swc_blacklist))
+        self.swc_whitelist = frozenset(normalize_swc_list(swc_whitelist))
+
+    def __call__(self, issue: Issue) -> bool:
+        """Check whether an issue passes the filter.
+
+        :param issue: The issue to check
+        :return: Whether the issue should be kept
+        """
+
+        return (
+            issue.severity in self.severities
+            and issue.swc_id not in self.swc_blacklist
+            and (not self.swc_whitelist or issue.swc_id in self.swc_whitelist)
+        )
+
+    def apply(self, resp: DetectedIssuesResponse) -> DetectedIssuesResponse:
+        """Remove all issues not passing the filter from a report.
+
+        If any issue is left in the report, the CI failure return code is
+        set.
+
+        :param resp: The issue report of an analysis job
+        :return: The filtered issue report
+        """
+
+        found = False
+        for report in resp.issue_reports:
+            report.issues = [issue for issue in report.issues if self(issue)]
+            found = found or bool(report.issues)
+        if found:
+            set_ci_failure()
+        return resp
+
+
 def filter_report(
     resp: DetectedIssuesResponse,
     min_severity: Union[str, SEVERITY] = None,
@@ -88,11 +243,9 @@ def filter_report(
 
     This will remove issues of a specific SWC ID or with a too low
     severity from the issue reports of the passed
-    :code:`DetectedIssuesResponse` object. The SWC blacklist can be a
-    list of strings in the format "SWC-000" or a comma-separated string.
-    "SWC" is case-insensitive and normalized. The SWC whitelist works in
-    a similar way, just including selected SWCs into the resulting
-    response object.
+    :code:`DetectedIssuesResponse` object. To filter multiple reports
+    with the same settings, create an :code:`IssueFilter` once and apply
+    it to each report instead.
 
     :param resp: The issue report of an analysis job
     :param min_severity: Ignore SWC IDs below the designated level
@@ -101,25 +254,8 @@ def filter_report(
     :return: The filtered issue report
     """
 
-    min_severity = min_severity = (
-        SEVERITY(min_severity.title()) if min_severity else SEVERITY.UNKNOWN
-    )
-    swc_blacklist = normalize_swc_list(swc_blacklist)
-    swc_whitelist = normalize_swc_list(swc_whitelist)
-
-    new_issues = []
-    for report in resp.issue_reports:
-        for issue in report.issues:
-            is_severe = SEVERITY_ORDER.index(issue.severity) >= SEVERITY_ORDER.index(
-                min_severity
-            )
-            not_blacklisted = issue.swc_id not in swc_blacklist
-            is_whitelisted = issue.swc_id in swc_whitelist if swc_whitelist else True
-
-            if all((is_severe, is_whitelisted, not_blacklisted)):
-                new_issues.append(issue)
-                set_ci_failure()
-
-        report.issues = new_issues
-
-    return resp
+    return IssueFilter(
+        min_severity=min_severity,
+        swc_blacklist=swc_blacklist,
+        swc_whitelist=swc_whitelist,
+    ).apply(resp)
@@ -0,0 +1,92 @@
+"""This module contains helpers to defer imports until they are needed.
+
+Most subcommands depend on heavy libraries, such as pythx, the MythX
+models, solcx, and jinja2. Deferring their imports keeps the CLI's startup
+time low for commands that do not need them.
+"""
+
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import click
+from click.utils import make_default_short_help
+
+
+def load_object(path: str) -> Any:
+    """Import an object given as :code:`module:attribute`.
+
+    :param path: The object's import path
+    :return: The imported object
+    """
+
+    module, attribute = path.split(":")
+    return getattr(import_module(module), attribute)
+
+
+class LazyGroup(click.Group):
+    """A click group importing its subcommands only when they are used.
+
+    Lazy subcommands are registered by name with the import path of the
+    command object and their short help text. The group's help page is
+    generated from the registered help texts, so a command's module and
+    its dependencies are only imported once the command is invoked.
+    """
+
+    def __init__(
+        self,
+        *args,
+        lazy_commands: Optional[Dict[str, Tuple[str, str]]] = None,
+        **kwargs
+    ):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = dict(lazy_commands or {})
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx: click.Context, name: str) -> Optional[click.Command]:
+        if name in self.lazy_commands and name not in self.commands:
+            path, _ = self.lazy_commands[name]
+            self.add_command(load_object(path), name)
+        return super().get_command(ctx, name)
+
+    def format_commands(
+        self, ctx: click.Context, formatter: click.HelpFormatter
+    ) -> None:
+        """Write the subcommands and their short help texts to the help
+        page without importing the lazy ones."""
+
+        names = self.list_commands(ctx)
+        if not names:
+            return
+        limit = formatter.width - 6 - max(len(name) for name in names)
+        rows = []
+        for name in names:
+            if name in self.commands:
+                cmd = self.commands[name]
+                if not cmd.hidden:
+                    rows.append((name, cmd.get_short_help_str(limit)))
+            else:
+                _, help_text = self.lazy_commands[name]
+                rows.append((name, make_default_short_help(help_text, limit)))
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+
+class LazyClient:
+    """A MythX API client that is only created when it is first used.
+
+    All attribute lookups are forwarded to the client returned by the
+    factory, which is called on the first lookup. Commands that never talk
+    to the API thus do not import pythx.
+    """
+
+    def __init__(self, factory: Callable[[], Any]):
+        self.factory = factory
+        self.client = None
+
+    def __getattr__(self, name):
+        if self.client is None:
+            self.client = self.factory()
+        return getattr(self.client, name)
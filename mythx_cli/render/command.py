@@ -8,6 +8,7 @@ import jinja2
 from mythx_models.response import AnalysisInputResponse, DetectedIssuesResponse
 from pythx import Client
 
+from mythx_cli.formatter.util import IssueFilter
 from mythx_cli.render.util import get_analysis_info
 from mythx_cli.util import index_by_filename, write_or_print
 
@@ -105,6 +106,11 @@ def render(
     issues_list: List[
         Tuple[str, DetectedIssuesResponse, Optional[AnalysisInputResponse]]
     ] = []
+    issue_filter = IssueFilter(
+        min_severity=min_severity,
+        swc_blacklist=swc_blacklist,
+        swc_whitelist=swc_whitelist,
+    )
     if len(target) == 24:
         LOGGER.debug(f"Identified group target {target}")
         list_resp = client.analysis_list(group_id=target)
@@ -121,22 +127,14 @@ def render(
                 "Fetching report for analysis {}".format(analysis.uuid), err=True
             )
             uuid, _, resp, inp = get_analysis_info(
-                client=client,
-                uuid=analysis.uuid,
-                min_severity=min_severity,
-                swc_blacklist=swc_blacklist,
-                swc_whitelist=swc_whitelist,
+                client=client, uuid=analysis.uuid, issue_filter=issue_filter
             )
             issues_list.append((uuid, resp, inp))
     elif len(target) == 36:
         LOGGER.debug(f"Identified analysis target {target}")
         click.echo("Fetching report for analysis {}".format(target), err=True)
         uuid, _, resp, inp = get_analysis_info(
-            client=client,
-            uuid=target,
-            min_severity=min_severity,
-            swc_blacklist=swc_blacklist,
-            swc_whitelist=swc_whitelist,
+            client=client, uuid=target, issue_filter=issue_filter
         )
         issues_list.append((uuid, resp, inp))
     else:
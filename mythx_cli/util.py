@@ -1,27 +1,93 @@
 import logging
-from collections import defaultdict
-from typing import Any, List, Optional, Tuple
+import os
+import shutil
+import tempfile
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, TextIO, Tuple
 
 import click
-from mythx_models.response import AnalysisInputResponse, DetectedIssuesResponse
-from mythx_models.response.issue import SourceMap
 
-from mythx_cli.formatter.util import get_source_location_by_offset
+if TYPE_CHECKING:  # pragma: no cover
+    from mythx_models.response import AnalysisInputResponse, DetectedIssuesResponse
 
 LOGGER = logging.getLogger("mythx-cli")
+OUTPUT_BUFFER_SIZE = 1024 * 1024
+FETCH_WINDOW_FACTOR = 2
+
+
+class FileReport:
+    """The issues found in a single source file.
+
+    The file's source is stored once, and issues are recorded sparsely by
+    their line number. Line objects of the form :code:`{"line": ...,
+    "content": ..., "issues": [...]}` are only created when they are
+    accessed, either for all lines by iterating over the report or just for
+    the lines containing issues through :code:`issue_lines`.
+    """
+
+    def __init__(self, source: str):
+        self.source = source
+        self.issues: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+        self._lines: Optional[List[str]] = None
+
+    @property
+    def lines(self) -> List[str]:
+        if self._lines is None:
+            self._lines = self.source.split("\n")
+        return self._lines
+
+    def line(self, number: int) -> Dict[str, Any]:
+        """Get the line object for a line number.
+
+        :param number: The one-based line number
+        :return: The line's number, content, and issues
+        """
+
+        return {
+            "line": number,
+            "content": self.lines[number - 1] if number <= len(self.lines) else "",
+            "issues": self.issues.get(number, []),
+        }
+
+    def issue_lines(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over the line objects of all lines containing issues in
+        ascending order."""
+
+        for number in sorted(self.issues):
+            yield self.line(number)
+
+    def __len__(self) -> int:
+        return self.source.count("\n") + 1
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for number in range(1, len(self) + 1):
+            yield self.line(number)
+
+    def __getitem__(self, idx):
+        numbers = range(1, len(self) + 1)[idx]
+        if isinstance(numbers, range):
+            return [self.line(number) for number in numbers]
+        return self.line(numbers)
+
+    def __repr__(self) -> str:
+        return f"<FileReport lines={len(self)} issues={dict(self.issues)}>"
 
 
 def index_by_filename(
     issues_list: List[
-        Tuple[str, DetectedIssuesResponse, Optional[AnalysisInputResponse]]
+        Tuple[str, "DetectedIssuesResponse", Optional["AnalysisInputResponse"]]
     ]
-):
+) -> Dict[str, FileReport]:
     """Index the given report/input responses by filename.
 
     This will return a simplified, unified representation of the report/input payloads
-    returned by the MythX API. It is a mapping from filename to an iterable of issue
-    objects, which contain the report UUID, SWC ID, SWC title, short and long
-    description, severity, as well as the issue's line location in the source code.
+    returned by the MythX API. It is a mapping from filename to a :code:`FileReport`,
+    an iterable of line objects holding issue objects, which contain the report UUID,
+    SWC ID, SWC title, short and long description, severity, as well as the issue's
+    line location in the source code. Files shared between multiple analyses are only
+    indexed once.
 
     This representation is meant to be passed on to the respective formatter, which
     them visualizes the data.
@@ -30,20 +96,25 @@ def index_by_filename(
     :return: A simplified mapping indexing issues by their file path
     """
 
-    report_context = defaultdict(list)
+    # the formatter utilities depend on the MythX models, which are only
+    # loaded once a report is processed
+    from mythx_cli.formatter.util import (
+        decode_source_map,
+        get_line_offsets,
+        get_source_location_by_offset,
+    )
+
+    report_context: Dict[str, FileReport] = {}
+    # line offset tables, built once for each distinct source text
+    line_offsets = {}
     for uuid, resp, inp in issues_list:
-        # initialize context with source line objects
+        # initialize context with the file sources
         for filename, file_data in inp.sources.items():
             source = file_data.get("source")
-            if source is None:
-                # skip files where no source is given
+            if source is None or filename in report_context:
+                # skip files where no source is given or that are already indexed
                 continue
-            report_context[filename].extend(
-                [
-                    {"line": line + 1, "content": content, "issues": []}
-                    for line, content in enumerate(source.split("\n"))
-                ]
-            )
+            report_context[filename] = FileReport(source)
 
         for report in resp.issue_reports:
             for issue in report.issues:
@@ -68,26 +139,83 @@ def index_by_filename(
                     if loc.source_format != "text" and "text" in source_formats:
                         # skip non-text locations when we have one attached to the issue
                         continue
-                    for c in SourceMap.decompress(loc.source_map):
+                    decoded = decode_source_map(loc.source_map)
+                    for offset, file_id in zip(decoded.offsets, decoded.file_ids):
                         source_list = loc.source_list or report.source_list
-                        if not (source_list and 0 <= c.file_id < len(source_list)):
+                        if not (source_list and 0 <= file_id < len(source_list)):
                             # skip issues whose srcmap file ID if out of range of the source list
                             continue
-                        filename = source_list[c.file_id]
+                        filename = source_list[file_id]
 
                         if not inp.sources or filename not in inp.sources:
                             # skip issues that can't be decoded to source location
                             continue
 
+                        source = inp.sources[filename]["source"]
+                        if source not in line_offsets:
+                            line_offsets[source] = get_line_offsets(source)
                         line = get_source_location_by_offset(
-                            inp.sources[filename]["source"], c.offset
+                            source, offset, line_offsets[source]
                         )
-                        report_context[filename][line - 1]["issues"].append(issue_entry)
+                        report_context[filename].issues[line].append(issue_entry)
                         break
 
     return report_context
 
 
+def fetch_reports(
+    client, uuids: List[str], fetch_input: bool = True, concurrency: int = 1
+) -> Iterator[Tuple[str, "DetectedIssuesResponse", Optional["AnalysisInputResponse"]]]:
+    """Fetch the reports and inputs of the given analysis jobs.
+
+    Report and input requests are sent through a bounded worker pool, so up to
+    :code:`concurrency` requests are in flight at the same time. The results are
+    yielded in the order of the given UUIDs, which keeps the formatted output
+    deterministic no matter in which order the requests finish. Only
+    :code:`concurrency * FETCH_WINDOW_FACTOR` jobs are queued ahead of the
+    consumer, and each result is released once it has been yielded, so memory
+    usage does not grow with the number of UUIDs.
+
+    :param client: The pythx client to fetch the data with
+    :param uuids: The analysis job UUIDs to fetch the reports for
+    :param fetch_input: Whether to also fetch the analysis input of each job
+    :param concurrency: The maximum number of parallel requests
+    :return: An iterator over UUID, report, and optional input tuples
+    """
+
+    LOGGER.debug(f"Fetching {len(uuids)} reports with {concurrency} worker(s)")
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        pending = iter(uuids)
+        futures = deque()
+
+        def submit_next() -> None:
+            uuid = next(pending, None)
+            if uuid is None:
+                return
+            LOGGER.debug(f"{uuid}: Fetching report")
+            resp = executor.submit(client.report, uuid)
+            LOGGER.debug(f"{uuid}: Fetching input")
+            inp = executor.submit(client.request_by_uuid, uuid) if fetch_input else None
+            futures.append((uuid, resp, inp))
+
+        for _ in range(concurrency * FETCH_WINDOW_FACTOR):
+            submit_next()
+
+        try:
+            while futures:
+                uuid, resp, inp = futures.popleft()
+                submit_next()
+                yield uuid, resp.result(), inp.result() if inp else None
+                # release the responses before waiting for the next ones
+                del resp, inp
+        finally:
+            # do not send pending requests if the consumer stops early
+            for _, resp, inp in futures:
+                resp.cancel()
+                if inp is not None:
+                    inp.cancel()
+
+
 def update_context(
     context: dict, context_key: str, config: dict, config_key: str, default: Any = None
 ):
@@ -106,21 +234,117 @@ def update_context(
     context[context_key] = context.get(context_key) or config.get(config_key) or default
 
 
+class OutputSink:
+    """A buffered output file that is replaced atomically.
+
+    The sink is opened on the first write and collects all output of a
+    command in a temporary file next to the output path, using a large
+    write buffer. Closing the sink renames the temporary file to the output
+    path, so other tools watching it only ever see the previous or the
+    complete new file. If the command fails, the sink is discarded and the
+    output file is left untouched. Appending writes start from a copy of
+    the existing file.
+
+    As a consequence, incremental output such as NDJSON reports only shows
+    up in the output file once the command has finished.
+    """
+
+    def __init__(self, path: str, buffer_size: int = OUTPUT_BUFFER_SIZE):
+        self.path = Path(path).absolute()
+        self.buffer_size = buffer_size
+        self.file: Optional[TextIO] = None
+        self.tmp_path: Optional[Path] = None
+
+    def __enter__(self) -> "OutputSink":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None or issubclass(
+            exc_type, (SystemExit, click.exceptions.Exit)
+        ):
+            self.close()
+        else:
+            self.discard()
+
+    def open(self, append: bool) -> None:
+        """Create the temporary file the output is collected in.
+
+        :param append: Whether to start with the output file's content
+        """
+
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp"
+        )
+        self.tmp_path = Path(tmp_path)
+        self.file = open(fd, "w", buffering=self.buffer_size)
+        if self.path.is_file():
+            shutil.copymode(self.path, self.tmp_path)
+            if append:
+                with open(self.path) as existing:
+                    shutil.copyfileobj(existing, self.file)
+        else:
+            # apply the permissions a regular open would create the file with
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(self.tmp_path, 0o666 & ~umask)
+
+    def write(self, data: str, mode: str = "a+") -> None:
+        """Write data to the output file.
+
+        :param data: The data to write
+        :param mode: The file mode, where "w" modes discard previous content
+        """
+
+        if self.file is None:
+            self.open(append=mode.startswith("a"))
+        elif mode.startswith("w"):
+            self.file.seek(0)
+            self.file.truncate()
+        self.file.write(data)
+
+    def close(self) -> None:
+        """Flush the buffered output and move it to the output path."""
+
+        if self.file is None:
+            return
+        self.file.close()
+        os.replace(self.tmp_path, self.path)
+        LOGGER.debug(f"Wrote output to {self.path}")
+        self.file, self.tmp_path = None, None
+
+    def discard(self) -> None:
+        """Drop the collected output and keep the previous output file."""
+
+        if self.file is None:
+            return
+        self.file.close()
+        self.tmp_path.unlink()
+        LOGGER.debug(f"Discarded output to {self.path}")
+        self.file, self.tmp_path = None, None
+
+
 @click.pass_obj
-def write_or_print(ctx, data: str, mode="a+") -> None:
+def write_or_print(ctx, data: str, mode="a+", nl: bool = True) -> None:
     """Depending on the context, write the given content to stdout or a given
     file.
 
     :param ctx: Click context holding group-level parameters
     :param data: The data to print or write to a file
     :param mode: The mode to open the file in (if file output enabled)
+    :param nl: Whether to append a line break to the data
     :return:
     """
 
     if not ctx["output"]:
         LOGGER.debug("Writing data to stdout")
-        click.echo(data)
+        click.echo(data, nl=nl)
+        return
+    data = data + "\n" if nl else data
+    sink = ctx.get("output_sink")
+    if sink is not None:
+        sink.write(data, mode)
         return
-    with open(ctx["output"], mode) as outfile:
-        LOGGER.debug(f"Writing data to {ctx['output']}")
-        outfile.write(data + "\n")
+    # without a command-wide sink, replace the file right away
+    LOGGER.debug(f"Writing data to {ctx['output']}")
+    with OutputSink(ctx["output"]) as sink:
+        sink.write(data, mode)
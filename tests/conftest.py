@@ -1,5 +1,15 @@
 import os
 
+import pytest
+
 
 def pytest_generate_tests(metafunc):
     os.environ["MYTHX_API_KEY"] = "test"
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path_factory, monkeypatch):
+    # keep caches from leaking between tests or into the user's home
+    path = tmp_path_factory.mktemp("cache")
+    monkeypatch.setenv("MYTHX_CACHE_DIR", str(path))
+    return path
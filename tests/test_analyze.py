@@ -1,7 +1,14 @@
+import json
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
 import pytest
 from click.testing import CliRunner
 
+from mythx_cli.analyze.util import load_json_keys, poll_reports, submit_jobs
 from mythx_cli.cli import cli
+from mythx_cli.util import fetch_reports
 
 from .common import mock_context
 
@@ -42,6 +49,15 @@ def test_invalid():
         "scribble",
         "scribble-path",
         "scenario",
+        "parallel-compile",
+        "compile-workers",
+        "batch-compile",
+        "no-compile-cache",
+        "concurrency",
+        "deduplicate",
+        "incremental",
+        "poll-interval",
+        "poll-jitter",
         "truffle",
         "solidity",
         "help",
@@ -53,3 +69,187 @@ def test_helppage_keywords(keyword):
     result = runner.invoke(cli, ["analyze", "--help"])
 
     assert keyword in result.output
+
+
+class DelayedClient:
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+
+    def analyze(self, contract_name, delay):
+        time.sleep(delay)
+        if contract_name == self.fail_on:
+            raise ValueError(contract_name)
+        return SimpleNamespace(uuid=f"uuid-{contract_name}")
+
+
+class CountingBar:
+    def __init__(self):
+        self.count = 0
+
+    def update(self, n):
+        self.count += n
+
+
+@pytest.mark.parametrize("concurrency", (1, 2, 8))
+def test_submit_jobs_order(concurrency):
+    # later jobs finish first to shuffle the completion order
+    jobs = [{"contract_name": str(i), "delay": (5 - i) * 0.01} for i in range(5)]
+    bar = CountingBar()
+
+    uuids = submit_jobs(DelayedClient(), jobs, concurrency=concurrency, bar=bar)
+
+    assert uuids == [f"uuid-{i}" for i in range(5)]
+    assert bar.count == 5
+
+
+def test_submit_jobs_error():
+    jobs = [{"contract_name": str(i), "delay": 0} for i in range(5)]
+
+    with pytest.raises(ValueError):
+        submit_jobs(DelayedClient(fail_on="2"), jobs, concurrency=2)
+
+
+class PollingClient:
+    def __init__(self, rounds):
+        # number of status checks until each job is ready
+        self.rounds = dict(rounds)
+        self.calls = []
+
+    def analysis_ready(self, uuid):
+        self.calls.append(("ready", uuid))
+        self.rounds[uuid] -= 1
+        return self.rounds[uuid] <= 0
+
+    def report(self, uuid):
+        self.calls.append(("report", uuid))
+        return f"report-{uuid}"
+
+    def request_by_uuid(self, uuid):
+        self.calls.append(("input", uuid))
+        return f"input-{uuid}"
+
+
+def test_poll_reports_completion_order():
+    client = PollingClient({"a": 3, "b": 1, "c": 2})
+
+    with patch("time.sleep") as sleep_patch:
+        results = list(poll_reports(client, ["a", "b", "c"], interval=2, jitter=0))
+
+    assert [r[0] for r in results] == ["b", "c", "a"]
+    assert results[0] == ("b", "report-b", "input-b")
+    # one wait after each round with pending jobs
+    assert sleep_patch.call_count == 2
+    sleep_patch.assert_called_with(2)
+    # reports are only fetched once the status of every pending job is known
+    assert client.calls[:5] == [
+        ("ready", "a"),
+        ("ready", "b"),
+        ("ready", "c"),
+        ("report", "b"),
+        ("input", "b"),
+    ]
+
+
+def test_poll_reports_concurrency():
+    client = PollingClient({"a": 1, "b": 1, "c": 2})
+
+    with patch("time.sleep"), patch(
+        "mythx_cli.analyze.util.fetch_reports", wraps=fetch_reports
+    ) as fetch_patch:
+        results = list(poll_reports(client, ["a", "b", "c"], concurrency=4))
+
+    assert [r[0] for r in results] == ["a", "b", "c"]
+    assert fetch_patch.call_args_list[0][1]["uuids"] == ["a", "b"]
+    assert fetch_patch.call_args_list[0][1]["concurrency"] == 4
+
+
+def test_poll_reports_skip_input():
+    client = PollingClient({"a": 1})
+
+    with patch("time.sleep") as sleep_patch:
+        results = list(poll_reports(client, ["a"], fetch_input=False))
+
+    assert results == [("a", "report-a", None)]
+    sleep_patch.assert_not_called()
+
+
+def test_poll_reports_jitter():
+    client = PollingClient({"a": 2})
+
+    with patch("time.sleep") as sleep_patch:
+        list(poll_reports(client, ["a"], interval=1, jitter=0.5))
+
+    (delay,), _ = sleep_patch.call_args
+    assert 1 <= delay <= 1.5
+
+
+JSON_DOCUMENT = {
+    "skipped": {"nested": ['"', '\n  "fake": 1', {"deep": [1, 2]}], "x": "}"},
+    "wanted": {"nodes": [{"id": 1}, "text"]},
+    "list": [1, [2, [3]]],
+    "string": 'a \\" b',
+    "last": {"value": None},
+}
+
+
+@pytest.mark.parametrize(
+    "dump_kwargs",
+    (
+        pytest.param({}, id="compact"),
+        pytest.param({"indent": 2}, id="indent 2"),
+        pytest.param({"indent": 1}, id="indent 1"),
+        pytest.param({"indent": "\t"}, id="tabs"),
+    ),
+)
+@pytest.mark.parametrize(
+    "keys",
+    (
+        pytest.param({"wanted"}, id="single"),
+        pytest.param({"string", "last"}, id="trailing"),
+        pytest.param({"skipped", "missing"}, id="missing key"),
+        pytest.param(set(JSON_DOCUMENT), id="all"),
+    ),
+)
+def test_load_json_keys(tmp_path, dump_kwargs, keys):
+    path = tmp_path / "doc.json"
+    path.write_text(json.dumps(JSON_DOCUMENT, **dump_kwargs))
+
+    expected = {k: v for k, v in JSON_DOCUMENT.items() if k in keys}
+    assert load_json_keys(path, keys) == expected
+
+
+def test_load_json_keys_irregular_indent(tmp_path):
+    # nested members at the top-level indentation, and a member sharing a line
+    path = tmp_path / "doc.json"
+    path.write_text(
+        '{\n  "skipped": {\n  "wanted": "nested",\n  "x": 1\n  },\n'
+        '  "other": 1, "wanted": "top",\n  "last": 2\n}'
+    )
+
+    assert load_json_keys(path, {"wanted", "last"}) == {"wanted": "top", "last": 2}
+
+
+@pytest.mark.parametrize(
+    "document,expected",
+    (
+        ('{"ast": 1, "legacy": 2, "a": 3}', {"ast": 1, "a": 3}),
+        ('{"legacy": 2, "ast": 1, "a": 3}', {"ast": 1, "a": 3}),
+        ('{"legacy": 2, "a": 3}', {"legacy": 2, "a": 3}),
+    ),
+)
+def test_load_json_keys_fallback(tmp_path, document, expected):
+    path = tmp_path / "doc.json"
+    path.write_text(document)
+
+    assert load_json_keys(path, {"ast", "a"}, fallbacks={"ast": "legacy"}) == expected
+
+
+@pytest.mark.parametrize(
+    "document", ("[1, 2]", '{"a" 1}', '{"a": 1 "b": 2}', '{"a": [1}')
+)
+def test_load_json_keys_invalid(tmp_path, document):
+    path = tmp_path / "doc.json"
+    path.write_text(document)
+
+    with pytest.raises(json.JSONDecodeError):
+        load_json_keys(path, {"a", "b"})
@@ -1,6 +1,10 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
+from pathlib import Path
+from unittest.mock import patch
 
+import click
 import pytest
 from click.testing import CliRunner
 from mythx_models.response import (
@@ -10,6 +14,7 @@ from mythx_models.response import (
 )
 from mythx_models.response.issue import SEVERITY
 
+from mythx_cli.analyze.solidity import SolidityJob
 from mythx_cli.cli import cli
 
 from .common import get_test_case, mock_context
@@ -279,3 +284,137 @@ def test_scribble_errors(fake_process, tmp_path, retval, stdout):
 
     assert stdout in result.output
     assert result.exit_code == retval
+
+
+def fake_solc_result(job, **kwargs):
+    if "broken" in job.target:
+        raise click.exceptions.UsageError(f"Error compiling {job.target}")
+    contract = job.target.split("/")[-1].replace(".sol", "")
+    evm = {"object": "0x6080", "sourceMap": "0:1:0"}
+    return {
+        "sources": {job.target: {"id": 0, "ast": {}}},
+        "contracts": {
+            job.target: {contract: {"evm": {"bytecode": evm, "deployedBytecode": evm}}}
+        },
+    }
+
+
+@pytest.mark.parametrize("workers", (None, 1, 3))
+def test_parallel_compile_order(tmp_path, workers):
+    for i in range(5):
+        setup_solidity_file(tmp_path, name=f"Contract{i}.sol")
+
+    # worker processes do not see mocks, so compile in threads instead
+    with patch.object(SolidityJob, "setup_solcx"), patch.object(
+        SolidityJob, "solcx_compile", autospec=True, side_effect=fake_solc_result
+    ), patch("mythx_cli.analyze.solidity.ProcessPoolExecutor", ThreadPoolExecutor):
+        sequential = SolidityJob.walk_solidity_files(
+            solc_version=None, base_path=str(tmp_path)
+        )
+        parallel = SolidityJob.walk_solidity_files(
+            solc_version=None, base_path=str(tmp_path), parallel=True, workers=workers
+        )
+
+    assert len(parallel) == 5
+    assert parallel == sequential
+
+
+def test_parallel_compile_error(tmp_path):
+    for name in ("A.sol", "broken.sol", "C.sol"):
+        setup_solidity_file(tmp_path, name=name)
+
+    with patch.object(SolidityJob, "setup_solcx"), patch.object(
+        SolidityJob, "solcx_compile", autospec=True, side_effect=fake_solc_result
+    ), patch("mythx_cli.analyze.solidity.ProcessPoolExecutor", ThreadPoolExecutor):
+        with pytest.raises(click.exceptions.UsageError):
+            SolidityJob.walk_solidity_files(
+                solc_version=None, base_path=str(tmp_path), parallel=True
+            )
+
+
+def test_parallel_compile_installs_once(tmp_path):
+    for i in range(3):
+        setup_solidity_file(tmp_path, name=f"Contract{i}.sol")
+
+    with patch.object(SolidityJob, "setup_solcx") as setup_patch, patch.object(
+        SolidityJob, "solcx_compile", autospec=True, side_effect=fake_solc_result
+    ), patch("mythx_cli.analyze.solidity.ProcessPoolExecutor", ThreadPoolExecutor):
+        SolidityJob.walk_solidity_files(
+            solc_version=None, base_path=str(tmp_path), parallel=True
+        )
+
+    # one install in the main process, then one version switch per file
+    assert setup_patch.call_args_list[0].args == ("v0.4.13",)
+    assert setup_patch.call_count == 4
+
+
+def fake_batch_result(input_data, **kwargs):
+    sources, contracts = {}, {}
+    for idx, name in enumerate(input_data["sources"]):
+        with open(name) as f:
+            imports = [line.split('"')[1] for line in f if line.startswith("import")]
+        nodes = [{"nodeType": "ImportDirective", "absolutePath": i} for i in imports]
+        sources[name] = {"id": idx, "ast": {"nodes": nodes}}
+        contract = name.split("/")[-1].replace(".sol", "")
+        # libraries get the largest bytecode to check closure-based selection
+        evm = {"object": "0x" + "60" * (10 if "Lib" in name else 1), "sourceMap": "0"}
+        contracts[name] = {
+            contract: {"evm": {"bytecode": evm, "deployedBytecode": evm}}
+        }
+    return {"sources": sources, "contracts": contracts}
+
+
+def setup_batch_project(base_path, versions=("0.4.13",) * 3):
+    lib = str(base_path / "Lib.sol")
+    files = {
+        "Lib.sol": "",
+        "A.sol": f'import "{lib}";\n',
+        "B.sol": f'import "{lib}";\n',
+        "C.sol": "",
+    }
+    for (name, imports), version in zip(files.items(), ("0.4.13",) + versions):
+        with open(str(base_path / name), "w+") as f:
+            f.write(imports + f"pragma solidity {version};\n")
+
+
+def test_batch_compile(tmp_path):
+    setup_batch_project(tmp_path)
+
+    with patch.object(SolidityJob, "setup_solcx"), patch(
+        "solcx.compile_standard", side_effect=fake_batch_result
+    ) as compile_patch:
+        payloads = SolidityJob.walk_solidity_files(
+            solc_version=None, base_path=str(tmp_path), batch=True
+        )
+
+    assert compile_patch.call_count == 1
+    assert len(compile_patch.call_args.kwargs["input_data"]["sources"]) == 4
+    by_main = {Path(p["main_source"]).name: p for p in payloads}
+    assert set(by_main) == {"Lib.sol", "A.sol", "B.sol", "C.sol"}
+    assert sorted(Path(x).name for x in by_main["A.sol"]["sources"]) == [
+        "A.sol",
+        "Lib.sol",
+    ]
+    assert [Path(x).name for x in by_main["C.sol"]["sources"]] == ["C.sol"]
+    # the source list covers the whole batch
+    assert len(by_main["C.sol"]["source_list"]) == 4
+    # contract selection is limited to the import closure
+    assert by_main["A.sol"]["contract_name"] == "Lib"
+    assert by_main["C.sol"]["contract_name"] == "C"
+
+
+def test_batch_compile_order(tmp_path):
+    setup_batch_project(tmp_path, versions=("0.5.0", "0.4.13", "0.5.0"))
+
+    with patch.object(SolidityJob, "setup_solcx"), patch(
+        "solcx.compile_standard", side_effect=fake_batch_result
+    ) as compile_patch:
+        payloads = SolidityJob.walk_solidity_files(
+            solc_version=None, base_path=str(tmp_path), batch=True
+        )
+
+    assert compile_patch.call_count == 2
+    versions = {c.kwargs["solc_version"] for c in compile_patch.call_args_list}
+    assert versions == {"v0.4.13", "v0.5.0"}
+    files = [str(x) for x in tmp_path.rglob("*.sol")]
+    assert [p["main_source"] for p in payloads] == files
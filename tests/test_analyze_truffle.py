@@ -1,6 +1,7 @@
 import json
 import os
 from copy import deepcopy
+from unittest.mock import patch
 
 import pytest
 from click.testing import CliRunner
@@ -11,6 +12,8 @@ from mythx_models.response import (
 )
 from mythx_models.response.issue import SEVERITY
 
+from mythx_cli.analyze.truffle import TruffleJob
+from mythx_cli.analyze.util import load_json_keys
 from mythx_cli.cli import cli
 
 from .common import get_test_case, mock_context
@@ -51,6 +54,32 @@ def setup_truffle_project(base_path, compiled=True, switch_dir=False):
         json.dump(TRUFFLE_ARTIFACT, artifact_f)
 
 
+def setup_dependency_project(base_path):
+    # LANDProxy imports Storage and Proxy, which are built as separate artifacts
+    setup_truffle_project(base_path, compiled=False, switch_dir=True)
+    main_source = TRUFFLE_ARTIFACT["sourcePath"]
+    artifacts = {"LANDProxy": TRUFFLE_ARTIFACT}
+    for idx, node in enumerate(TRUFFLE_ARTIFACT["ast"]["nodes"]):
+        if node["nodeType"] != "ImportDirective":
+            continue
+        path = node["absolutePath"]
+        artifact = deepcopy(TRUFFLE_ARTIFACT)
+        artifact["contractName"] = os.path.basename(path)[:-4]
+        artifact["sourcePath"] = path
+        artifact["source"] = f"// {path}"
+        artifact["ast"] = {"absolutePath": path, "nodes": [], "src": f"0:0:{idx}"}
+        artifacts[artifact["contractName"]] = artifact
+
+    for name, artifact in artifacts.items():
+        with open(base_path / f"build/contracts/{name}.json", "w+") as artifact_f:
+            json.dump(artifact, artifact_f)
+        sol_file = base_path / os.path.relpath(
+            artifact["sourcePath"], main_source.rsplit("/contracts/", 1)[0]
+        )
+        os.makedirs(str(sol_file.parent), exist_ok=True)
+        sol_file.write_text(artifact["source"])
+
+
 def get_high_severity_report():
     issues_resp = deepcopy(ISSUES_RESPONSE)
     issues_resp.issue_reports[0].issues[0].severity = SEVERITY.HIGH
@@ -152,6 +181,13 @@ def test_param_yaml_override(tmp_path):
             id="async",
         ),
         pytest.param(["analyze"], ISSUES_TABLE, True, 0, id="issue table"),
+        pytest.param(
+            ["--format", "ndjson", "analyze"],
+            '"uuid": "ab9092f7-54d0-480f-9b63-1bb1508280e2"',
+            True,
+            0,
+            id="ndjson",
+        ),
         pytest.param(
             ["analyze", "."], ISSUES_TABLE, True, 0, id="issue table with path"
         ),
@@ -210,3 +246,264 @@ def test_parameters(tmp_path, params, value, contained, retval):
             assert value not in result.output
 
         assert result.exit_code == retval
+
+
+def test_deduplicate(tmp_path):
+    setup_truffle_project(tmp_path, compiled=True, switch_dir=True)
+    runner = CliRunner()
+
+    with mock_context() as patches:
+        first = runner.invoke(cli, ["analyze", "--deduplicate"], input="y\n")
+        second = runner.invoke(cli, ["analyze", "--deduplicate"], input="y\n")
+        third = runner.invoke(
+            cli, ["analyze", "--mode", "deep", "--deduplicate"], input="y\n"
+        )
+
+    assert first.exit_code == 0
+    assert second.exit_code == 0
+    assert ISSUES_TABLE in second.output
+    assert "Reusing 1 previous analyses of unchanged jobs" in second.output
+    # a different analysis mode changes the fingerprint
+    assert "Reusing" not in third.output
+    assert patches[0].call_count == 2
+
+
+@pytest.mark.parametrize(
+    "env", ({"MYTHX_API_URL": "http://127.0.0.1:8080/"}, {"MYTHX_API_KEY": "other"})
+)
+def test_deduplicate_other_account(tmp_path, env):
+    setup_truffle_project(tmp_path, compiled=True, switch_dir=True)
+    runner = CliRunner()
+
+    with mock_context() as patches:
+        runner.invoke(cli, ["analyze", "--deduplicate"], input="y\n")
+        result = runner.invoke(cli, ["analyze", "--deduplicate"], input="y\n", env=env)
+
+    assert result.exit_code == 0
+    assert "Reusing" not in result.output
+    assert patches[0].call_count == 2
+
+
+def test_deduplicate_failed_analysis(tmp_path):
+    setup_truffle_project(tmp_path, compiled=True, switch_dir=True)
+    runner = CliRunner()
+
+    with mock_context() as patches:
+        patches[7].return_value.status = "Error"
+        runner.invoke(cli, ["analyze", "--deduplicate"], input="y\n")
+        result = runner.invoke(cli, ["analyze", "--deduplicate"], input="y\n")
+
+    assert result.exit_code == 0
+    assert "Reusing" not in result.output
+    assert patches[0].call_count == 2
+
+
+def test_no_deduplicate(tmp_path):
+    setup_truffle_project(tmp_path, compiled=True, switch_dir=True)
+    runner = CliRunner()
+
+    with mock_context() as patches:
+        runner.invoke(cli, ["analyze"], input="y\n")
+        runner.invoke(cli, ["analyze"], input="y\n")
+
+    assert patches[0].call_count == 2
+
+
+def test_artifacts_parsed_once(tmp_path):
+    setup_dependency_project(tmp_path)
+
+    with patch(
+        "mythx_cli.analyze.truffle.load_json_keys", wraps=load_json_keys
+    ) as load_patch:
+        job = TruffleJob(tmp_path)
+        job.generate_payloads()
+
+    assert load_patch.call_count == 3
+    assert job.artifacts == {}
+    main_payload = next(p for p in job.payloads if p["contract_name"] == "LANDProxy")
+    assert len(main_payload["sources"]) == 3
+    storage_payload = next(p for p in job.payloads if p["contract_name"] == "Storage")
+    assert len(storage_payload["sources"]) == 1
+
+
+def test_sol_file_index_built_once(tmp_path):
+    setup_dependency_project(tmp_path)
+    os.makedirs(str(tmp_path / ".git"))
+    (tmp_path / ".git/Storage.sol").write_text("// ignored")
+
+    with patch("mythx_cli.analyze.truffle.os.walk", wraps=os.walk) as walk_patch:
+        job = TruffleJob(tmp_path)
+        job.generate_payloads()
+
+    assert walk_patch.call_count == 1
+    assert job.sol_file_index["Storage.sol"] == [
+        str(tmp_path / "contracts/Storage.sol")
+    ]
+
+
+def test_sol_file_ambiguity_resolved_by_source_path(tmp_path):
+    setup_dependency_project(tmp_path)
+    os.makedirs(str(tmp_path / "node_modules/lib"))
+    (tmp_path / "node_modules/lib/Storage.sol").write_text("// other")
+
+    job = TruffleJob(tmp_path)
+    job.generate_payloads()
+
+    main_payload = next(p for p in job.payloads if p["contract_name"] == "LANDProxy")
+    assert str(tmp_path / "contracts/Storage.sol") in main_payload["sources"]
+
+
+def test_sol_file_ambiguity_reported(tmp_path, caplog):
+    setup_dependency_project(tmp_path)
+    os.makedirs(str(tmp_path / "other/contracts"))
+    (tmp_path / "other/contracts/Storage.sol").write_text("// other")
+
+    job = TruffleJob(tmp_path)
+    job.generate_payloads()
+
+    assert "Ambiguous Solidity file name Storage.sol" in caplog.text
+    assert str(tmp_path / "other/contracts/Storage.sol") in caplog.text
+
+
+def test_sol_file_missing(tmp_path):
+    setup_dependency_project(tmp_path)
+    os.remove(str(tmp_path / "contracts/Storage.sol"))
+    runner = CliRunner()
+
+    with mock_context():
+        result = runner.invoke(cli, ["analyze"], input="y\n")
+
+    assert "Could not find Solidity file Storage.sol" in result.output
+    assert result.exit_code == 2
+
+
+def test_sol_file_to_artifact_exact_name(tmp_path):
+    setup_dependency_project(tmp_path)
+
+    job = TruffleJob(tmp_path)
+    job.generate_payloads()
+
+    assert job.sol_file_to_artifact("contracts/upgradable/Proxy.sol") == str(
+        tmp_path / "build/contracts/Proxy.json"
+    )
+    assert job.sol_file_to_artifact("contracts/Token.sol") is None
+    main_payload = next(p for p in job.payloads if p["contract_name"] == "LANDProxy")
+    assert sorted(os.path.basename(s) for s in main_payload["sources"]) == [
+        "LANDProxy.sol",
+        "Proxy.sol",
+        "Storage.sol",
+    ]
+
+
+def test_incremental(tmp_path):
+    setup_truffle_project(tmp_path, compiled=True, switch_dir=True)
+    runner = CliRunner()
+
+    with mock_context() as patches:
+        first = runner.invoke(cli, ["analyze", "--incremental"], input="y\n")
+        second = runner.invoke(cli, ["analyze", "--incremental"], input="y\n")
+
+        artifact = deepcopy(TRUFFLE_ARTIFACT)
+        artifact["deployedBytecode"] += "00"
+        with open(tmp_path / "build/contracts/foo.json", "w") as artifact_f:
+            json.dump(artifact, artifact_f)
+        third = runner.invoke(cli, ["analyze", "--incremental"], input="y\n")
+
+    assert first.exit_code == 0
+    assert second.exit_code == 0
+    assert ISSUES_TABLE in second.output
+    assert "Reusing 1 previous analyses of unchanged jobs" in second.output
+    assert "Reusing" not in third.output
+    assert patches[0].call_count == 2
+
+
+def test_incremental_dependency_changed(tmp_path):
+    setup_dependency_project(tmp_path)
+    runner = CliRunner()
+
+    with mock_context() as patches:
+        runner.invoke(cli, ["analyze", "--incremental"], input="y\n")
+        assert patches[0].call_count == 3
+
+        storage_file = tmp_path / "build/contracts/Storage.json"
+        artifact = json.loads(storage_file.read_text())
+        artifact["source"] += "\n// changed"
+        storage_file.write_text(json.dumps(artifact))
+        result = runner.invoke(cli, ["analyze", "--incremental"], input="y\n")
+
+    # Storage and LANDProxy, which imports it, are resubmitted
+    assert "Reusing 1 previous analyses of unchanged jobs" in result.output
+    assert patches[0].call_count == 5
+    submitted = {c[1]["contract_name"] for c in patches[0].call_args_list[3:]}
+    assert submitted == {"LANDProxy", "Storage"}
+
+
+def test_incremental_async_manifest(tmp_path):
+    setup_truffle_project(tmp_path, compiled=True, switch_dir=True)
+    runner = CliRunner()
+
+    with mock_context() as patches:
+        runner.invoke(cli, ["analyze", "--async", "--incremental"], input="y\n")
+        result = runner.invoke(cli, ["analyze", "--incremental"], input="y\n")
+        other_mode = runner.invoke(
+            cli, ["analyze", "--incremental", "--mode", "deep"], input="y\n"
+        )
+
+    assert "Reusing 1 previous analyses" in result.output
+    assert "Reusing" not in other_mode.output
+    assert patches[0].call_count == 2
+
+
+def test_incremental_other_api_url(tmp_path):
+    setup_truffle_project(tmp_path, compiled=True, switch_dir=True)
+    runner = CliRunner()
+
+    with mock_context() as patches:
+        runner.invoke(cli, ["analyze", "--incremental"], input="y\n")
+        result = runner.invoke(
+            cli,
+            ["analyze", "--incremental"],
+            input="y\n",
+            env={"MYTHX_API_URL": "http://127.0.0.1:8080/"},
+        )
+
+    assert result.exit_code == 0
+    assert "Reusing" not in result.output
+    assert patches[0].call_count == 2
+
+
+def test_dependency_sources_shared(tmp_path):
+    setup_dependency_project(tmp_path)
+
+    job = TruffleJob(tmp_path)
+    job.generate_payloads()
+
+    payloads = {p["contract_name"]: p for p in job.payloads}
+    main_sources = payloads["LANDProxy"]["sources"]
+    storage_sources = payloads["Storage"]["sources"]
+    storage_entry = main_sources[str(tmp_path / "contracts/Storage.sol")]
+    assert storage_entry is storage_sources[payloads["Storage"]["main_source"]]
+    assert job.sources == {}
+
+
+def test_artifact_keys_selected(tmp_path):
+    setup_truffle_project(tmp_path, compiled=True, switch_dir=True)
+
+    job = TruffleJob(tmp_path)
+    artifact = next(iter(job.artifacts.values()))
+
+    assert artifact["ast"] == TRUFFLE_ARTIFACT["ast"]
+    assert "legacyAST" not in artifact
+    assert "abi" not in artifact
+
+
+def test_artifact_legacy_ast_fallback(tmp_path):
+    artifact = deepcopy(TRUFFLE_ARTIFACT)
+    del artifact["ast"]
+    with open(tmp_path / "foo.json", "w") as artifact_f:
+        json.dump(artifact, artifact_f, indent=2)
+
+    loaded = TruffleJob.load_artifact(str(tmp_path / "foo.json"))
+
+    assert loaded["legacyAST"] == TRUFFLE_ARTIFACT["legacyAST"]
+    assert loaded["sourcePath"] == TRUFFLE_ARTIFACT["sourcePath"]
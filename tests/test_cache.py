@@ -0,0 +1,276 @@
+import os
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+from mythx_models.response import (
+    AnalysisInputResponse,
+    AnalysisStatusResponse,
+    DetectedIssuesResponse,
+)
+
+from mythx_cli.cache.compile import CompileCache
+from mythx_cli.cache.response import CachedClient, ResponseCache
+from mythx_cli.cache.store import DiskCache, get_cache_dir
+from mythx_cli.cli import cli
+
+from .common import get_test_case, mock_context
+
+ISSUES_RESPONSE = get_test_case(
+    "testdata/detected-issues-response.json", DetectedIssuesResponse
+)
+INPUT_RESPONSE = get_test_case(
+    "testdata/analysis-input-response.json", AnalysisInputResponse
+)
+STATUS_RESPONSE = get_test_case(
+    "testdata/analysis-status-response.json", AnalysisStatusResponse
+)
+UUID = "ab9092f7-54d0-480f-9b63-1bb1508280e2"
+
+INPUT_DATA = {"language": "Solidity", "sources": {"A.sol": {"urls": ["A.sol"]}}}
+
+
+def fake_output(input_data, **kwargs):
+    sources = {"A.sol": {"id": 0}, "Lib.sol": {"id": 1}}
+    return {"sources": sources, "contracts": {}}
+
+
+def setup_sources(base_path):
+    os.chdir(str(base_path))
+    for name in ("A.sol", "Lib.sol"):
+        with open(name, "w+") as f:
+            f.write(f"// {name}\n")
+
+
+def test_cache_dir_env(cache_dir):
+    assert get_cache_dir("solc") == cache_dir / "solc"
+
+
+def test_disk_cache_roundtrip(tmp_path):
+    cache = DiskCache(tmp_path, max_size=1024)
+
+    assert cache.get("abcd") is None
+    cache.set("abcd", "data")
+    assert cache.get("abcd") == "data"
+    cache.delete("abcd")
+    assert cache.get("abcd") is None
+
+
+def test_disk_cache_lru_eviction(tmp_path):
+    cache = DiskCache(tmp_path, max_size=25)
+    for idx, key in enumerate(("aa01", "aa02")):
+        cache.set(key, "x" * 10)
+        os.utime(cache._entry_path(key), (idx, idx))
+
+    # reading an entry marks it as recently used
+    assert cache.get("aa01") == "x" * 10
+    cache.set("aa03", "x" * 10)
+
+    assert cache.get("aa01") is not None
+    assert cache.get("aa02") is None
+    assert cache.get("aa03") is not None
+
+
+def test_disk_cache_tracks_size(tmp_path):
+    cache = DiskCache(tmp_path, max_size=25)
+    cache.set("aa01", "x" * 10)
+
+    with patch.object(cache, "_scan", wraps=cache._scan) as scan_patch:
+        cache.set("aa02", "x" * 10)
+        cache.set("aa02", "x" * 5)
+        cache.delete("aa01")
+        cache.set("aa03", "x" * 10)
+        assert cache.size == 15
+        # the entries are only scanned once the cache is full
+        assert scan_patch.call_count == 0
+
+        cache.set("aa04", "x" * 15)
+        assert scan_patch.call_count == 1
+    assert cache.size <= 25
+
+
+def test_compile_cache_hit(tmp_path):
+    setup_sources(tmp_path)
+    cache = CompileCache(tmp_path / "cache")
+
+    with patch("solcx.compile_standard", side_effect=fake_output) as compile_patch:
+        first = cache.compile_standard(INPUT_DATA, solc_version="v0.5.0")
+        second = cache.compile_standard(INPUT_DATA, solc_version="v0.5.0")
+
+    assert compile_patch.call_count == 1
+    assert first == second
+
+
+def test_compile_cache_key(tmp_path):
+    setup_sources(tmp_path)
+    cache = CompileCache(tmp_path / "cache")
+    remapped = {**INPUT_DATA, "settings": {"remappings": ["a/=b/"]}}
+
+    with patch("solcx.compile_standard", side_effect=fake_output) as compile_patch:
+        cache.compile_standard(INPUT_DATA, solc_version="v0.5.0")
+        cache.compile_standard(INPUT_DATA, solc_version="v0.5.1")
+        cache.compile_standard(remapped, solc_version="v0.5.0")
+
+    assert compile_patch.call_count == 3
+
+
+def test_compile_cache_stale_import(tmp_path):
+    setup_sources(tmp_path)
+    cache = CompileCache(tmp_path / "cache")
+
+    with patch("solcx.compile_standard", side_effect=fake_output) as compile_patch:
+        cache.compile_standard(INPUT_DATA, solc_version="v0.5.0")
+        # changing an imported file invalidates the entry
+        with open("Lib.sol", "a") as f:
+            f.write("// changed\n")
+        cache.compile_standard(INPUT_DATA, solc_version="v0.5.0")
+        cache.compile_standard(INPUT_DATA, solc_version="v0.5.0")
+
+    assert compile_patch.call_count == 2
+
+
+def test_compile_cache_unreadable_source(tmp_path):
+    setup_sources(tmp_path)
+    os.remove("Lib.sol")
+    cache = CompileCache(tmp_path / "cache")
+
+    with patch("solcx.compile_standard", side_effect=fake_output) as compile_patch:
+        cache.compile_standard(INPUT_DATA, solc_version="v0.5.0")
+        cache.compile_standard(INPUT_DATA, solc_version="v0.5.0")
+
+    assert compile_patch.call_count == 2
+
+
+class FakeClient:
+    def __init__(self, ready=True):
+        self.ready = ready
+        self.calls = []
+
+    def analysis_status(self, uuid):
+        self.calls.append("status")
+        return AnalysisStatusResponse(
+            **{
+                **STATUS_RESPONSE.dict(),
+                "status": "Finished" if self.ready else "Queued",
+            }
+        )
+
+    def report(self, uuid):
+        self.calls.append("report")
+        return ISSUES_RESPONSE
+
+    def request_by_uuid(self, uuid):
+        self.calls.append("input")
+        return INPUT_RESPONSE
+
+
+def test_response_cache_roundtrip(tmp_path):
+    cache = ResponseCache(tmp_path)
+    cache.set_status(UUID, STATUS_RESPONSE)
+    cache.set_report(UUID, ISSUES_RESPONSE)
+    cache.set_input(UUID, INPUT_RESPONSE)
+
+    assert cache.has_status(UUID)
+    assert cache.get_status(UUID) == STATUS_RESPONSE
+    assert cache.get_report(UUID) == ISSUES_RESPONSE
+    assert cache.get_input(UUID) == INPUT_RESPONSE
+    assert not cache.has_status("unknown")
+    assert cache.get_report("unknown") is None
+
+
+def test_response_cache_api_url(tmp_path):
+    ResponseCache(tmp_path, api_url="https://api.mythx.io/v1/").set_status(
+        UUID, STATUS_RESPONSE
+    )
+
+    assert ResponseCache(tmp_path, api_url="https://api.mythx.io/v1/").has_status(UUID)
+    assert not ResponseCache(tmp_path, api_url="http://127.0.0.1:8080/").has_status(
+        UUID
+    )
+
+
+def test_cached_client(tmp_path):
+    client = FakeClient()
+    cached = CachedClient(client, ResponseCache(tmp_path))
+
+    assert cached.analysis_ready(UUID)
+    for _ in range(3):
+        assert cached.report(UUID) == ISSUES_RESPONSE
+        assert cached.request_by_uuid(UUID) == INPUT_RESPONSE
+        assert cached.analysis_ready(UUID)
+
+    assert client.calls == ["status", "report", "input"]
+
+
+def test_cached_client_persisted(tmp_path):
+    CachedClient(FakeClient(), ResponseCache(tmp_path)).report(UUID)
+    client = FakeClient()
+    cached = CachedClient(client, ResponseCache(tmp_path))
+
+    # a cached status marks the cached report as final
+    assert cached.analysis_status(UUID).status == "Finished"
+    assert cached.report(UUID) == ISSUES_RESPONSE
+    assert client.calls == []
+
+
+def test_cached_client_report_status(tmp_path):
+    client = FakeClient()
+    cached = CachedClient(client, ResponseCache(tmp_path))
+
+    cached.report(UUID)
+    cached.report(UUID)
+    cached.analysis_status(UUID)
+
+    # the status is requested once to find out whether the report is final
+    assert client.calls == ["status", "report"]
+
+
+def test_cached_client_unfinished(tmp_path):
+    client = FakeClient(ready=False)
+    cached = CachedClient(client, ResponseCache(tmp_path))
+
+    assert not cached.analysis_ready(UUID)
+    cached.report(UUID)
+    cached.report(UUID)
+
+    assert client.calls == ["status", "status", "report", "status", "report"]
+
+
+def test_report_cache_cli(tmp_path):
+    runner = CliRunner()
+    with mock_context() as patches:
+        runner.invoke(cli, ["--output", str(tmp_path / "out.html"), "render", UUID])
+        first = runner.invoke(cli, ["analysis", "report", UUID])
+        second = runner.invoke(cli, ["analysis", "report", UUID])
+
+    assert first.output == second.output
+    assert second.exit_code == 0
+    # render stores the finished status, so the report and input are reused
+    assert patches[2].call_count == 1
+    assert patches[3].call_count == 1
+    assert patches[7].call_count == 1
+
+
+def test_report_cache_cli_status(tmp_path):
+    runner = CliRunner()
+    with mock_context() as patches:
+        runner.invoke(cli, ["analysis", "report", UUID])
+        result = runner.invoke(cli, ["analysis", "report", UUID])
+        runner.invoke(cli, ["--output", str(tmp_path / "out.html"), "render", UUID])
+
+    assert result.exit_code == 0
+    # the status is checked once, then everything is served from the cache
+    assert patches[2].call_count == 1
+    assert patches[3].call_count == 1
+    assert patches[7].call_count == 1
+
+
+def test_no_report_cache_cli():
+    runner = CliRunner()
+    with mock_context() as patches:
+        runner.invoke(cli, ["--no-report-cache", "analysis", "report", UUID])
+        result = runner.invoke(cli, ["--no-report-cache", "analysis", "report", UUID])
+
+    assert result.exit_code == 0
+    assert patches[2].call_count == 2
+    assert patches[3].call_count == 2
@@ -0,0 +1,113 @@
+import os
+
+from click.testing import CliRunner
+from pythx import MythXAPIError
+
+from mythx_cli.cli import cli
+from mythx_cli.util import OutputSink
+
+from .common import get_test_case, mock_context
+
+ANALYSIS_STATUS_TABLE = get_test_case("testdata/analysis-status-table.txt", raw=True)
+
+
+def test_sink_replaces_on_close(tmp_path):
+    output = tmp_path / "out.txt"
+    output.write_text("old\n")
+
+    with OutputSink(str(output)) as sink:
+        sink.write("new\n", mode="w+")
+        sink.write("more\n")
+        # the previous file stays in place until the sink is closed
+        assert output.read_text() == "old\n"
+
+    assert output.read_text() == "new\nmore\n"
+    assert os.listdir(tmp_path) == ["out.txt"]
+
+
+def test_sink_append(tmp_path):
+    output = tmp_path / "out.txt"
+    output.write_text("old\n")
+
+    with OutputSink(str(output)) as sink:
+        sink.write("new\n")
+
+    assert output.read_text() == "old\nnew\n"
+
+
+def test_sink_truncate_after_write(tmp_path):
+    output = tmp_path / "out.txt"
+
+    with OutputSink(str(output)) as sink:
+        sink.write("first\n")
+        sink.write("second\n", mode="w+")
+
+    assert output.read_text() == "second\n"
+
+
+def test_sink_discard_on_error(tmp_path):
+    output = tmp_path / "out.txt"
+    output.write_text("old\n")
+
+    try:
+        with OutputSink(str(output)) as sink:
+            sink.write("partial\n")
+            raise ValueError("failed")
+    except ValueError:
+        pass
+
+    assert output.read_text() == "old\n"
+    assert os.listdir(tmp_path) == ["out.txt"]
+
+
+def test_sink_keeps_mode(tmp_path):
+    output = tmp_path / "out.txt"
+    output.write_text("old\n")
+    output.chmod(0o640)
+
+    with OutputSink(str(output)) as sink:
+        sink.write("new\n")
+
+    assert output.stat().st_mode & 0o777 == 0o640
+
+
+def test_sink_no_write(tmp_path):
+    with OutputSink(str(tmp_path / "out.txt")):
+        pass
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_output_opened_once(tmp_path):
+    output = tmp_path / "status.txt"
+    uuids = ["381eff48-04db-4f81-a417-8394b6614472"] * 3
+    runner = CliRunner()
+    with mock_context():
+        result = runner.invoke(
+            cli, ["--output", str(output), "analysis", "status", *uuids]
+        )
+
+    assert output.read_text() == ANALYSIS_STATUS_TABLE * 3
+    assert os.listdir(tmp_path) == ["status.txt"]
+    assert result.exit_code == 0
+
+
+def test_output_kept_on_api_error(tmp_path):
+    output = tmp_path / "status.txt"
+    output.write_text("old\n")
+    # distinct analyses, as finished statuses are cached
+    uuids = [f"381eff48-04db-4f81-a417-8394b661447{idx}" for idx in range(3)]
+    runner = CliRunner()
+    with mock_context() as patches:
+        status_patch = patches[7]
+        status_patch.side_effect = [
+            status_patch.return_value,
+            MythXAPIError("Internal server error"),
+        ]
+        result = runner.invoke(
+            cli, ["--output", str(output), "analysis", "status", *uuids]
+        )
+
+    assert isinstance(result.exception, MythXAPIError)
+    assert output.read_text() == "old\n"
+    assert os.listdir(tmp_path) == ["status.txt"]
@@ -94,3 +94,20 @@ def test_sanitize_ast(sample, expected):
         cwd_patch.return_value = CWD
         sanitized = sanitize_paths(sample)
     assert expected == sanitized
+
+
+def test_sanitize_shared_sources():
+    shared = {"ast": {"absolutePath": TEST_PATH_1}}
+    first = {"sources": {TEST_PATH_1: shared}, "source_list": [TEST_PATH_1]}
+    second = {
+        "sources": {TEST_PATH_1: shared},
+        "source_list": [TEST_PATH_1, TEST_PATH_2],
+    }
+    with patch("pathlib.Path.cwd") as cwd_patch:
+        cwd_patch.return_value = CWD
+        sanitize_paths(first)
+        sanitize_paths(second)
+
+    assert shared == {"ast": {"absolutePath": TEST_PATH_1}}
+    assert first["sources"][SANI_PATH_1]["ast"]["absolutePath"] == SANI_PATH_1
+    assert second["sources"][FILE_1]["ast"]["absolutePath"] == FILE_1
@@ -4,6 +4,7 @@ from markupsafe import escape
 from mythx_models.response import AnalysisInputResponse, DetectedIssuesResponse
 
 from mythx_cli.cli import cli
+from mythx_cli.util import index_by_filename
 
 from .common import get_test_case, mock_context
 
@@ -77,3 +78,25 @@ def test_invalid_id():
     result = runner.invoke(cli, ["--output=test.html", "render", "--aesthetic", "foo"])
     assert result.exception is not None
     assert result.exit_code == 2
+
+
+def test_index_by_filename_sparse():
+    issues_list = [
+        ("uuid-1", ISSUES_RESPONSE, INPUT_RESPONSE),
+        ("uuid-2", ISSUES_RESPONSE, INPUT_RESPONSE),
+    ]
+
+    report_context = index_by_filename(issues_list)
+
+    assert list(report_context) == list(INPUT_RESPONSE.sources)
+    for filename, file_data in report_context.items():
+        source = INPUT_RESPONSE.sources[filename]["source"]
+        lines = source.split("\n")
+        # each file is indexed once, no matter how many analyses contain it
+        assert len(file_data) == len(lines)
+        assert [line["content"] for line in file_data] == lines
+        assert file_data[-1] == file_data.line(len(lines))
+        assert all(file_data.issues.values())
+        for line in file_data.issue_lines():
+            assert line["content"] == lines[line["line"] - 1]
+            assert {issue["uuid"] for issue in line["issues"]} == {"uuid-1", "uuid-2"}
@@ -1,9 +1,14 @@
 import json
+import time
 
+import pytest
 from click.testing import CliRunner
 from mythx_models.response import AnalysisInputResponse, DetectedIssuesResponse
 
 from mythx_cli.cli import cli
+from mythx_cli.formatter import FORMAT_RESOLVER, StreamingTabularFormatter
+from mythx_cli.formatter.json import iter_json_array
+from mythx_cli.util import fetch_reports
 
 from .common import get_test_case, mock_context
 
@@ -15,6 +20,9 @@ ISSUES_RESPONSE: DetectedIssuesResponse = get_test_case(
 )
 ISSUES_SIMPLE = get_test_case("testdata/detected-issues-simple.txt", raw=True)
 ISSUES_TABLE = get_test_case("testdata/detected-issues-table.txt", raw=True)
+ISSUES_TABLE_STREAM = get_test_case(
+    "testdata/detected-issues-table-stream.txt", raw=True
+)
 
 
 def test_report_tabular():
@@ -28,6 +36,39 @@ def test_report_tabular():
         assert result.exit_code == 0
 
 
+def test_report_tabular_stream():
+    runner = CliRunner()
+    with mock_context():
+        result = runner.invoke(
+            cli,
+            [
+                "--format",
+                "table-stream",
+                "analysis",
+                "report",
+                "ab9092f7-54d0-480f-9b63-1bb1508280e2",
+            ],
+        )
+
+        assert result.output == ISSUES_TABLE_STREAM
+        assert result.exit_code == 0
+
+
+def test_report_tabular_stream_truncate():
+    resp = ISSUES_RESPONSE.copy(deep=True)
+    resp.issue_reports[0].issues[0].description.head = "Very long\n" * 20
+
+    lines = list(
+        StreamingTabularFormatter.iter_lines(
+            [("ab9092f7-54d0-480f-9b63-1bb1508280e2", resp, INPUT_RESPONSE)]
+        )
+    )
+
+    assert len({len(line) for line in lines[2:-1]}) == 1
+    assert "│ Very long Very long" in lines[5]
+    assert lines[5].endswith("… │")
+
+
 def test_report_tabular_blacklist():
     runner = CliRunner()
     with mock_context():
@@ -115,6 +156,35 @@ def test_report_json():
         assert result.exit_code == 0
 
 
+@pytest.mark.parametrize(
+    "fmt,json_args", (("json", {}), ("json-pretty", {"indent": 2, "sort_keys": True}))
+)
+def test_report_json_streamed(fmt, json_args, tmp_path):
+    uuids = ["ab9092f7-54d0-480f-9b63-1bb1508280e2"] * 3
+    expected = [{**ISSUES_RESPONSE.dict(), "uuid": uuid} for uuid in uuids]
+    output = tmp_path / "report.json"
+    runner = CliRunner()
+    with mock_context():
+        result = runner.invoke(
+            cli,
+            ["--format", fmt, "--output", str(output), "analysis", "report", *uuids],
+        )
+
+    assert output.read_text() == json.dumps(expected, **json_args) + "\n"
+    assert result.exit_code == 0
+
+
+@pytest.mark.parametrize(
+    "items", ([], [{}], [[]], [{"b": 1, "a": [1, {"c": "line\nbreak"}]}, {"d": None}])
+)
+@pytest.mark.parametrize("json_args", ({}, {"indent": 2, "sort_keys": True}))
+def test_iter_json_array(items, json_args):
+    fragments = list(iter_json_array(iter(items), **json_args))
+
+    assert len(fragments) == len(items) + 1
+    assert "".join(fragments) == json.dumps(items, **json_args)
+
+
 def test_report_json_blacklist():
     runner = CliRunner()
     with mock_context():
@@ -357,3 +427,122 @@ def test_report_simple_filter():
 
         assert "SWC-110" not in result.output
         assert result.exit_code == 0
+
+
+def test_report_ndjson():
+    runner = CliRunner()
+    with mock_context():
+        result = runner.invoke(
+            cli,
+            [
+                "--format",
+                "ndjson",
+                "analysis",
+                "report",
+                "ab9092f7-54d0-480f-9b63-1bb1508280e2",
+                "ab9092f7-54d0-480f-9b63-1bb1508280e2",
+            ],
+        )
+
+        lines = result.output.strip().split("\n")
+        assert len(lines) == 2
+        for line in lines:
+            report = json.loads(line)
+            assert report["uuid"] == "ab9092f7-54d0-480f-9b63-1bb1508280e2"
+            assert (
+                report["issue_reports"]
+                == json.loads(ISSUES_RESPONSE.json())["issue_reports"]
+            )
+        assert result.exit_code == 0
+
+
+@pytest.mark.parametrize("fmt", ("simple", "json", "json-pretty", "table"))
+def test_report_entry_default(fmt):
+    formatter = FORMAT_RESOLVER[fmt]
+    entry = ("ab9092f7-54d0-480f-9b63-1bb1508280e2", ISSUES_RESPONSE, INPUT_RESPONSE)
+
+    assert formatter.format_detected_issues_entry(
+        *entry
+    ) == formatter.format_detected_issues([entry])
+
+
+def test_report_ndjson_blacklist():
+    runner = CliRunner()
+    with mock_context():
+        result = runner.invoke(
+            cli,
+            [
+                "--format",
+                "ndjson",
+                "analysis",
+                "report",
+                "--swc-blacklist",
+                "SWC-110",
+                "ab9092f7-54d0-480f-9b63-1bb1508280e2",
+            ],
+        )
+
+        for report in json.loads(result.output)["issue_reports"]:
+            for issue in report["issues"]:
+                assert issue["swc_id"] != "SWC-110"
+
+        assert result.exit_code == 0
+
+
+@pytest.mark.parametrize(
+    "fmt", ("table", "table-stream", "simple", "json", "json-pretty")
+)
+def test_report_concurrency_output(fmt):
+    uuids = ["ab9092f7-54d0-480f-9b63-1bb1508280e2"] * 3
+    runner = CliRunner()
+    with mock_context():
+        serial = runner.invoke(cli, ["--format", fmt, "analysis", "report", *uuids])
+        parallel = runner.invoke(
+            cli, ["--format", fmt, "analysis", "report", "--concurrency", "4", *uuids]
+        )
+
+    assert parallel.output == serial.output
+    assert parallel.exit_code == 0
+
+
+class DelayedClient:
+    def report(self, uuid):
+        time.sleep(int(uuid) * 0.01)
+        return f"report-{uuid}"
+
+    def request_by_uuid(self, uuid):
+        time.sleep(int(uuid) * 0.01)
+        return f"input-{uuid}"
+
+
+@pytest.mark.parametrize("concurrency", (1, 3, 10))
+def test_fetch_reports_order(concurrency):
+    # earlier UUIDs take longer to fetch
+    uuids = [str(i) for i in range(5, 0, -1)]
+
+    results = list(fetch_reports(DelayedClient(), uuids, concurrency=concurrency))
+
+    assert results == [(u, f"report-{u}", f"input-{u}") for u in uuids]
+
+
+def test_fetch_reports_skip_input():
+    results = list(fetch_reports(DelayedClient(), ["1"], fetch_input=False))
+
+    assert results == [("1", "report-1", None)]
+
+
+def test_fetch_reports_window():
+    requested = []
+
+    class RecordingClient(DelayedClient):
+        def report(self, uuid):
+            requested.append(uuid)
+            return super().report(uuid)
+
+    uuids = [str(i) for i in range(10)]
+    results = fetch_reports(RecordingClient(), uuids, concurrency=2)
+
+    assert next(results) == ("0", "report-0", "input-0")
+    # only the jobs of the window (plus its refill) have been submitted
+    assert len(requested) <= 5
+    assert [uuid for uuid, _, _ in results] == uuids[1:]
@@ -3,7 +3,7 @@ from copy import deepcopy
 import pytest
 from mythx_models.response import DetectedIssuesResponse
 
-from mythx_cli.formatter.util import filter_report
+from mythx_cli.formatter.util import IssueFilter, filter_report
 
 from .common import get_test_case
 
@@ -97,3 +97,38 @@ def test_report_filter_blacklist(blacklist, whitelist, severity, contained):
         assert "SWC-110" in swcs
     else:
         assert "SWC-110" not in swcs
+
+
+def test_report_filter_multiple_reports():
+    resp = deepcopy(RESPONSE)
+    resp.issue_reports.append(deepcopy(resp.issue_reports[0]))
+    resp.issue_reports[1].issues[0].swc_id = "SWC-123"
+    first_issues = list(resp.issue_reports[0].issues)
+
+    filter_report(resp)
+
+    # each report keeps its own issues
+    assert resp.issue_reports[0].issues == first_issues
+    assert [i.swc_id for i in resp.issue_reports[1].issues] == ["SWC-123"] + [
+        i.swc_id for i in first_issues[1:]
+    ]
+
+
+def test_issue_filter_reuse():
+    issue_filter = IssueFilter(min_severity="low", swc_blacklist="123")
+    responses = [deepcopy(RESPONSE) for _ in range(3)]
+    responses[1].issue_reports[0].issues[0].swc_id = "SWC-123"
+
+    for resp in responses:
+        issue_filter.apply(resp)
+
+    assert [len(r.issue_reports[0].issues) for r in responses] == [
+        len(RESPONSE.issue_reports[0].issues),
+        len(RESPONSE.issue_reports[0].issues) - 1,
+        len(RESPONSE.issue_reports[0].issues),
+    ]
+
+
+def test_issue_filter_invalid_severity():
+    with pytest.raises(ValueError):
+        IssueFilter(min_severity="critical")
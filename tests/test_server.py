@@ -0,0 +1,95 @@
+import json
+import time
+from unittest.mock import patch
+
+from click.testing import CliRunner
+from pythx import Client
+
+from benchmarks.server import StandInAPI, running_server
+from mythx_cli.cli import cli
+
+from .common import get_test_case
+
+ANALYSIS_STATUS_TABLE = get_test_case("testdata/analysis-status-table.txt", raw=True)
+ISSUES_TABLE = get_test_case("testdata/detected-issues-table.txt", raw=True)
+
+
+def test_server_status():
+    with running_server() as url:
+        result = CliRunner().invoke(
+            cli,
+            ["analysis", "status", "ab9092f7-54d0-480f-9b63-1bb1508280e2"],
+            env={"MYTHX_API_URL": url},
+        )
+
+    assert result.output == ANALYSIS_STATUS_TABLE
+    assert result.exit_code == 0
+
+
+def test_server_report():
+    with running_server() as url:
+        result = CliRunner().invoke(
+            cli,
+            ["analysis", "report", "ab9092f7-54d0-480f-9b63-1bb1508280e2"],
+            env={"MYTHX_API_URL": url},
+        )
+
+    assert result.output == ISSUES_TABLE
+    assert result.exit_code == 0
+
+
+def test_server_group_list():
+    with running_server() as url:
+        for name in ("first", "second"):
+            CliRunner().invoke(cli, ["group", "open", name], env={"MYTHX_API_URL": url})
+        result = CliRunner().invoke(
+            cli, ["--format", "json", "group", "list"], env={"MYTHX_API_URL": url}
+        )
+
+    groups = json.loads(result.output)["groups"]
+    assert [group["name"] for group in groups] == ["second", "first"]
+    assert result.exit_code == 0
+
+
+def test_server_queue_time():
+    with running_server(queue_time=0.2) as url:
+        client = Client(username="user", password="password", api_url=url)
+        resp = client.analyze(
+            bytecode="0x00", main_source="a.sol", sources={"a.sol": {"source": ""}}
+        )
+
+        assert not client.analysis_ready(resp.uuid)
+        # leave a margin for the timer resolution
+        time.sleep(0.3)
+        assert client.analysis_ready(resp.uuid)
+
+
+def test_server_rate_limit():
+    with running_server(rate_limit=1) as url:
+        result = CliRunner().invoke(
+            cli,
+            ["--no-report-cache", "analysis", "status", "1", "2"],
+            env={"MYTHX_API_URL": url},
+        )
+
+    assert "Got unexpected status code 429" in str(result.exception)
+    assert result.exit_code == 1
+
+
+def test_rate_limit_window():
+    api = StandInAPI(rate_limit=2)
+    with patch("benchmarks.server.time.monotonic") as clock:
+        # requests across a full-second boundary still share a window
+        for now, limited in ((0.9, False), (1.1, False), (1.5, True), (1.95, False)):
+            clock.return_value = now
+            assert api.rate_limited() is limited
+
+
+def test_server_error_rate():
+    with running_server(error_rate=1) as url:
+        result = CliRunner().invoke(
+            cli, ["version", "--api"], env={"MYTHX_API_URL": url}
+        )
+
+    assert "Got unexpected status code 500" in str(result.exception)
+    assert result.exit_code == 1
@@ -0,0 +1,52 @@
+import pytest
+from mythx_models.response.issue import SourceMap
+
+from mythx_cli.formatter.util import (
+    decode_source_map,
+    get_line_offsets,
+    get_source_location_by_offset,
+)
+
+SOURCES = (
+    "",
+    "\n",
+    "pragma solidity ^0.6.0;",
+    "contract A {\n    // ünïcödé\n    uint x;\n}\n",
+    "\n\nline three\r\nline four\n\n",
+)
+
+
+def count_newlines(source, offset):
+    return source.encode("utf-8")[0:offset].count(b"\n") + 1
+
+
+@pytest.mark.parametrize("source", SOURCES)
+def test_source_location_matches_newline_count(source):
+    size = len(source.encode("utf-8"))
+    line_offsets = get_line_offsets(source)
+    for offset in range(-size - 2, size + 3):
+        expected = count_newlines(source, offset)
+        assert get_source_location_by_offset(source, offset) == expected
+        assert get_source_location_by_offset(source, offset, line_offsets) == expected
+
+
+@pytest.mark.parametrize(
+    "source_map",
+    (
+        "812:50:0",
+        "454:1:1",
+        "482:970:0:-;;;;8:9:-1;5:2;;;30:1;27;20:12;5:2;482:970:0;;;;;;;",
+        "0:10:0:-:0;;12::1:i;:3;::0:o;;",
+    ),
+)
+def test_decode_source_map(source_map):
+    decoded = decode_source_map(source_map)
+    expected = SourceMap.decompress(source_map)
+
+    assert list(decoded.offsets) == [c.offset for c in expected]
+    assert list(decoded.lengths) == [c.length for c in expected]
+    assert list(decoded.file_ids) == [c.file_id for c in expected]
+
+
+def test_decode_source_map_memoized():
+    assert decode_source_map("1:2:0;;3") is decode_source_map("1:2:0;;3")
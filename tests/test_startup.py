@@ -0,0 +1,52 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from mythx_cli.cli import analysis, cli, group
+from mythx_cli.lazy import load_object
+
+HEAVY_MODULES = (
+    "pythx",
+    "mythx_models",
+    "solcx",
+    "jinja2",
+    "htmlmin",
+    "tabulate",
+    "yaml",
+)
+SCRIPT = """
+import sys
+from mythx_cli.cli import cli
+
+try:
+    cli.main({args!r}, standalone_mode=False)
+except SystemExit:
+    pass
+print(",".join(m for m in {modules!r} if m in sys.modules))
+"""
+
+
+@pytest.mark.parametrize(
+    "args", (["version"], ["--help"], ["group", "--help"], ["analysis", "--help"])
+)
+def test_startup_imports(args):
+    result = subprocess.run(
+        [sys.executable, "-c", SCRIPT.format(args=args, modules=HEAVY_MODULES)],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).parent.parent,
+    )
+
+    assert result.stdout.splitlines()[-1] == ""
+
+
+@pytest.mark.parametrize("lazy_group", (cli, group, analysis))
+def test_lazy_command_help(lazy_group):
+    for name, (path, help_text) in lazy_group.lazy_commands.items():
+        command = load_object(path)
+
+        assert command.name == name
+        assert command.get_short_help_str(limit=80) == help_text